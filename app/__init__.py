@@ -1,15 +1,60 @@
 """Flask 애플리케이션 팩토리"""
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import sqlite3
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+import click
+import orjson
 from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from werkzeug.utils import import_string
 
 from app.config import Config
 
 db = SQLAlchemy()
 
+# 등록할 Blueprint (모듈 경로, 객체 이름) - register_blueprints()에서 import
+_BLUEPRINTS = [
+    ("app.routes.main", "main_bp"),
+    ("app.routes.settings", "settings_bp"),
+]
+
+# 백그라운드 로그 리스너 (프로세스당 하나만 유지)
+_log_listener: QueueListener | None = None
+
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    """SQLite 연결 시 WAL 모드 활성화 (읽기/쓰기 동시성 개선)"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """orjson 기반 JSON 직렬화 (jsonify 응답 생성 비용 절감)"""
+
+    def dumps(self, obj, **kwargs):
+        # pandas/FDR 결과의 numpy 스칼라도 그대로 직렬화
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 def setup_logging(app):
     """로깅 설정"""
@@ -34,7 +79,7 @@ def setup_logging(app):
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     console_handler.setLevel(log_level)
-    app.logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # 파일 핸들러 (RotatingFileHandler)
     if log_dir:
@@ -46,7 +91,10 @@ def setup_logging(app):
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(log_level)
-        app.logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # 요청 스레드는 큐에 적재만 하고, 실제 출력은 백그라운드 스레드에서 처리
+    _start_log_listener(app, handlers)
 
     # Flask 앱 로거 설정
     app.logger.setLevel(log_level)
@@ -55,50 +103,115 @@ def setup_logging(app):
     # Werkzeug 로거 레벨 조정 (개발 서버 로그)
     logging.getLogger("werkzeug").setLevel(logging.WARNING)
 
-    app.logger.info(f"로깅 설정 완료 (레벨: {app.config.get('LOG_LEVEL')})")
+    app.logger.info("로깅 설정 완료 (레벨: %s)", app.config.get("LOG_LEVEL"))
+
+
+def _start_log_listener(app, handlers):
+    """QueueHandler를 앱 로거에 연결하고 QueueListener 시작"""
+    global _log_listener
+
+    # 이전 create_app()에서 시작한 리스너 정리
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+
+    log_queue = queue.Queue(-1)
+    app.logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    if _log_listener is None:
+        atexit.register(_stop_log_listener)
+    _log_listener = listener
+    app.extensions["log_listener"] = listener
+
+
+def _stop_log_listener():
+    """프로세스 종료 시 남은 로그 flush"""
+    if _log_listener is not None:
+        _log_listener.stop()
 
 
 def setup_request_logging(app):
     """요청/응답 로깅 설정"""
+    if not app.config.get("LOG_REQUESTS", True):
+        return
 
     @app.before_request
     def log_request():
         """요청 로깅"""
         # 정적 파일 요청은 제외
-        if request.path.startswith("/static"):
+        if request.endpoint == "static":
             return
 
         app.logger.debug(
-            f"REQUEST | {request.method} {request.path} | "
-            f"IP: {request.remote_addr}"
+            "REQUEST | %s %s | IP: %s",
+            request.method,
+            request.path,
+            request.remote_addr,
         )
 
     @app.after_request
     def log_response(response):
         """응답 로깅"""
         # 정적 파일 요청은 제외
-        if request.path.startswith("/static"):
+        if request.endpoint == "static":
             return response
 
         # 에러 응답은 WARNING 레벨로 로깅
         if response.status_code >= 400:
             app.logger.warning(
-                f"RESPONSE | {request.method} {request.path} | "
-                f"Status: {response.status_code}"
+                "RESPONSE | %s %s | Status: %s",
+                request.method,
+                request.path,
+                response.status_code,
             )
         else:
             app.logger.debug(
-                f"RESPONSE | {request.method} {request.path} | "
-                f"Status: {response.status_code}"
+                "RESPONSE | %s %s | Status: %s",
+                request.method,
+                request.path,
+                response.status_code,
             )
 
         return response
 
 
-def create_app(config_class=Config):
-    """Flask 애플리케이션 생성"""
+def register_blueprints(app):
+    """라우트 Blueprint 등록 (라우트 모듈은 이 시점에 import)"""
+    for module_path, name in _BLUEPRINTS:
+        app.register_blueprint(import_string(f"{module_path}:{name}"))
+
+
+def register_commands(app):
+    """CLI 명령 등록"""
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        """데이터베이스 테이블 생성 (배포/최초 실행 시 1회)"""
+        db.create_all()
+        click.echo("데이터베이스 초기화 완료")
+
+
+def _is_flask_cli() -> bool:
+    """flask CLI 명령으로 실행 중인지 여부 (FlaskGroup이 앱 로드 전에 설정)"""
+    return os.environ.get("FLASK_RUN_FROM_CLI") == "true"
+
+
+def create_app(config_class=Config, register_routes=True):
+    """
+    Flask 애플리케이션 생성
+
+    Args:
+        config_class: 설정 클래스
+        register_routes: False이면 Blueprint를 등록하지 않음
+            (라우트가 필요 없는 배치 스크립트/CLI용)
+    """
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)
 
     # 로깅 설정
     setup_logging(app)
@@ -108,15 +221,18 @@ def create_app(config_class=Config):
     db.init_app(app)
 
     # Blueprint 등록
-    from app.routes.main import main_bp
-    from app.routes.settings import settings_bp
+    if register_routes:
+        register_blueprints(app)
 
-    app.register_blueprint(main_bp)
-    app.register_blueprint(settings_bp)
+        # 첫 요청이 종목 리스트 로드를 기다리지 않도록 백그라운드 워밍
+        # flask CLI 명령(init-db 등)은 요청을 처리하지 않으므로 생략
+        if app.config.get("WARM_STOCK_LIST", True) and not _is_flask_cli():
+            from app.services.stock import warm_stock_list
 
-    # 데이터베이스 테이블 생성
-    with app.app_context():
-        db.create_all()
+            warm_stock_list(app)
+
+    # CLI 명령 등록 (테이블 생성은 `flask --app run init-db`로 수행)
+    register_commands(app)
 
     app.logger.info("Flask 애플리케이션 초기화 완료")
 
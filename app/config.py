@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 
 from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
 
 # .env 파일 로드
 load_dotenv()
@@ -23,15 +24,32 @@ class Config:
     DATABASE_PATH = os.environ.get("DATABASE_PATH", "data/stock_alarm.db")
     SQLALCHEMY_DATABASE_URI = f"sqlite:///{BASE_DIR / DATABASE_PATH}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,  # 30분
+        "pool_timeout": 30,
+        "connect_args": {"check_same_thread": False, "timeout": 15},
+    }
 
     # Gmail SMTP
     GMAIL_ADDRESS = os.environ.get("GMAIL_ADDRESS")
     GMAIL_APP_PASSWORD = os.environ.get("GMAIL_APP_PASSWORD")
     MAIL_FROM_ADDRESS = os.environ.get("MAIL_FROM_ADDRESS")  # 발신자 표시 주소
     MAIL_FROM_NAME = os.environ.get("MAIL_FROM_NAME", "Stock Alarm")  # 발신자 이름
+    MAIL_BACKGROUND = True  # 요청 처리 중 메일은 백그라운드 큐로 발송
 
     # OpenAI
     OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
+    # 분당 최대 요청 수 (사용 중인 OpenAI 티어 한도보다 낮게 설정)
+    OPENAI_MAX_REQUESTS_PER_MINUTE = int(
+        os.environ.get("OPENAI_MAX_REQUESTS_PER_MINUTE", 500)
+    )
+    LLM_MAX_CONCURRENCY = 10  # 코멘트 일괄 생성 시 최대 동시 요청 수
+
+    # 앱 시작 시 종목 리스트 캐시 미리 로드 (라우트 등록 시에만, flask CLI 명령 제외)
+    WARM_STOCK_LIST = True
 
     # Logging
     LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
@@ -41,6 +59,7 @@ class Config:
     LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
     LOG_MAX_BYTES = 10 * 1024 * 1024  # 10MB
     LOG_BACKUP_COUNT = 5
+    LOG_REQUESTS = True  # 요청/응답 로깅 훅 등록 여부
 
 
 class DevelopmentConfig(Config):
@@ -62,5 +81,9 @@ class TestConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # 인메모리 DB는 단일 연결을 공유해야 스키마가 유지됨
+    SQLALCHEMY_ENGINE_OPTIONS = {"poolclass": StaticPool}
     WTF_CSRF_ENABLED = False
+    MAIL_BACKGROUND = False  # 테스트에서는 메일 발송을 즉시 실행
+    WARM_STOCK_LIST = False  # 테스트 중 외부 종목 리스트 로드 방지
     LOG_LEVEL = "WARNING"
@@ -1,6 +1,6 @@
 """SQLAlchemy 데이터베이스 모델"""
 
-from datetime import datetime
+from sqlalchemy import func
 
 from app import db
 
@@ -13,7 +13,9 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(255), unique=True, nullable=False)
     uuid = db.Column(db.String(36), unique=True, nullable=False)
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    created_at = db.Column(
+        db.DateTime, nullable=False, default=func.now(), server_default=func.now()
+    )
 
     # 관계 설정
     alerts = db.relationship(
@@ -28,6 +30,10 @@ class Alert(db.Model):
     """알림 설정 모델"""
 
     __tablename__ = "alerts"
+    __table_args__ = (
+        # add_alert 중복 검증, settings_page 상태별 집계
+        db.Index("ix_alerts_user_status_code", "user_id", "status", "stock_code"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
@@ -38,7 +44,9 @@ class Alert(db.Model):
     threshold_lower = db.Column(db.Float, nullable=True)
     status = db.Column(db.String(20), nullable=False, default="active")
     triggered_at = db.Column(db.DateTime, nullable=True)
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    created_at = db.Column(
+        db.DateTime, nullable=False, default=func.now(), server_default=func.now()
+    )
 
     # 관계 설정
     logs = db.relationship(
@@ -53,6 +61,12 @@ class AlertLog(db.Model):
     """알림 발송 기록 모델"""
 
     __tablename__ = "alert_logs"
+    __table_args__ = (
+        # history_page: 사용자별 최신순 조회 (SQLite는 역방향 인덱스 스캔 지원)
+        db.Index("ix_alertlogs_user_sent_desc", "user_id", "sent_at"),
+        # stock_detail / chart_data: 종목별 발송 이력 조회
+        db.Index("ix_alertlogs_alert_id_sent", "alert_id", "sent_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     alert_id = db.Column(db.Integer, db.ForeignKey("alerts.id"), nullable=False)
@@ -63,7 +77,9 @@ class AlertLog(db.Model):
     change_rate = db.Column(db.Float, nullable=False)
     threshold_type = db.Column(db.String(10), nullable=False)  # 'upper' or 'lower'
     email_sent = db.Column(db.Boolean, nullable=False, default=False)
-    sent_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = db.Column(
+        db.DateTime, nullable=False, default=func.now(), server_default=func.now()
+    )
 
     def __repr__(self):
         return f"<AlertLog {self.stock_code} {self.change_rate:+.2f}%>"
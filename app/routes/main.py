@@ -1,24 +1,27 @@
 """메인 라우트 (홈, 이메일 등록)"""
 
+import logging
 import re
 import uuid
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app
+from flask import Blueprint, render_template, request, redirect, url_for, flash
 
 from app import db
 from app.models import User
-from app.services.mail import send_welcome_email
 
 main_bp = Blueprint("main", __name__)
 
-EMAIL_REGEX = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+# 앱 로거("app")의 하위 로거 - 핸들러는 전파로 상속
+logger = logging.getLogger(__name__)
+
+EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
 
 def is_valid_email(email: str) -> bool:
     """이메일 형식 검증"""
     if not email:
         return False
-    return bool(re.match(EMAIL_REGEX, email))
+    return bool(EMAIL_REGEX.match(email))
 
 
 @main_bp.route("/")
@@ -30,42 +33,47 @@ def home():
 @main_bp.route("/register", methods=["POST"])
 def register():
     """이메일 등록 처리"""
+    from app.services.mail import send_welcome_email
+    from app.services.mail_queue import submit_mail
+
     email = request.form.get("email", "").strip()
-    current_app.logger.info(f"[등록 요청] 이메일: {email}")
+    logger.info("[등록 요청] 이메일: %s", email)
 
     # 1. 이메일 유효성 검증
     if not email:
-        current_app.logger.warning("[등록 실패] 이메일 미입력")
+        logger.warning("[등록 실패] 이메일 미입력")
         flash("이메일 주소를 입력해주세요.", "error")
         return redirect(url_for("main.home"))
 
     if not is_valid_email(email):
-        current_app.logger.warning(f"[등록 실패] 이메일 형식 오류: {email}")
+        logger.warning("[등록 실패] 이메일 형식 오류: %s", email)
         flash("올바른 이메일 주소를 입력해주세요.", "error")
         return redirect(url_for("main.home"))
 
     # 2. DB에서 이메일로 사용자 조회
-    user = User.query.filter_by(email=email).first()
+    user = db.session.query(User.id, User.uuid).filter_by(email=email).first()
 
     if not user:
         # 신규 사용자: UUID 생성 및 DB 저장
         user = User(email=email, uuid=str(uuid.uuid4()))
         db.session.add(user)
         db.session.commit()
-        current_app.logger.info(f"[신규 사용자] 이메일: {email}, UUID: {user.uuid}")
+        logger.info("[신규 사용자] 이메일: %s, UUID: %s", email, user.uuid)
     else:
-        current_app.logger.info(f"[기존 사용자] 이메일: {email}, UUID: {user.uuid}")
+        logger.info("[기존 사용자] 이메일: %s, UUID: %s", email, user.uuid)
 
     # 3. 설정 URL 생성
-    settings_url = f"{request.host_url}settings/{user.uuid}"
-
-    # 4. 환영 이메일 발송
-    if send_welcome_email(email, settings_url):
-        current_app.logger.info(f"[이메일 발송 성공] 이메일: {email}")
-        flash("설정 페이지 URL이 이메일로 발송되었습니다.", "success")
-    else:
-        current_app.logger.error(f"[이메일 발송 실패] 이메일: {email}")
-        flash("이메일 발송에 실패했습니다. 잠시 후 다시 시도해주세요.", "error")
+    settings_url = url_for("settings.settings_page", uuid=user.uuid, _external=True)
+
+    # 4. 환영 이메일 발송 (백그라운드 큐 - 발송 결과는 워커에서 로깅)
+    submit_mail(send_welcome_email, email, settings_url)
+    logger.info("[이메일 발송 요청] 이메일: %s", email)
+    # 발송은 큐에서 처리되므로 완료가 아닌 요청 사실만 안내
+    flash(
+        "설정 페이지 URL 이메일 발송이 요청되었습니다. "
+        "메일이 오지 않으면 잠시 후 다시 시도해주세요.",
+        "success",
+    )
 
     # 5. 홈페이지로 리다이렉트
     return redirect(url_for("main.home"))
@@ -100,11 +108,11 @@ def search_stocks():
     try:
         # 종목 검색 (기존 서비스 함수 활용)
         results = search_stock(query, limit=limit)
-        current_app.logger.debug(f"종목 검색: '{query}' -> {len(results)}개 결과")
+        logger.debug("종목 검색: '%s' -> %s개 결과", query, len(results))
         return jsonify(results)
 
     except Exception as e:
-        current_app.logger.error(f"종목 검색 오류: {e}")
+        logger.error("종목 검색 오류: %s", e)
         return (
             jsonify({"error": "종목 정보를 불러올 수 없습니다.", "code": "STOCK_LIST_ERROR"}),
             500,
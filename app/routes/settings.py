@@ -1,6 +1,8 @@
 """설정 라우트 (종목/기준 관리)"""
 
-import re
+import logging
+import threading
+from collections import OrderedDict
 
 from flask import (
     Blueprint,
@@ -11,58 +13,114 @@ from flask import (
     abort,
     request,
     jsonify,
-    current_app,
 )
+from sqlalchemy import bindparam, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import joinedload
 
 from app import db
 from app.models import User, Alert, AlertLog
-from app.services.stock import (
-    is_valid_stock_code_format,
-    validate_stock_code,
-    get_stock_name,
-    get_stock_price,
-    get_stock_history,
-)
 
 # 알림 기준 기본값
 DEFAULT_THRESHOLD_UPPER = 10.0  # +10%
 DEFAULT_THRESHOLD_LOWER = -10.0  # -10%
 
+# 히스토리 페이지당 표시 건수
+HISTORY_PER_PAGE = 20
+
 settings_bp = Blueprint("settings", __name__)
 
+# 앱 로거("app")의 하위 로거 - 핸들러는 전파로 상속
+logger = logging.getLogger(__name__)
+
+# 종목 추가 성공 로그 템플릿 (인자는 레벨 통과 시에만 포맷)
+ALERT_ADDED_LOG = (
+    "[종목 추가 성공] 사용자: %s, 종목: %s(%s), 기준가: %.0f원, 상승: %s%%, 하락: %s%%"
+)
+
+
+# UUID → 사용자 정보 LRU 캐시 (사용자 id/email/uuid는 생성 후 변경되지 않음)
+USER_CACHE_MAXSIZE = 10_000
+_user_cache: OrderedDict[str, Row] = OrderedDict()
+_user_cache_lock = threading.Lock()
+
+# UUID → 사용자 조회문 (모듈 로드 시 1회 생성, users.uuid UNIQUE 인덱스 탐색)
+_USER_BY_UUID = select(User.id, User.email, User.uuid).where(
+    User.uuid == bindparam("uuid")
+)
+
+
+def _get_user(uuid: str):
+    """
+    UUID로 사용자 조회 (프로세스 메모리 캐시 우선, 필요한 컬럼만 조회)
+
+    Returns:
+        Row | None: (id, email, uuid) 또는 None
+    """
+    with _user_cache_lock:
+        user = _user_cache.get(uuid)
+        if user is not None:
+            _user_cache.move_to_end(uuid)
+            return user
+
+    user = db.session.execute(_USER_BY_UUID, {"uuid": uuid}).one_or_none()
+    if user is None:
+        return None
+
+    with _user_cache_lock:
+        _user_cache[uuid] = user
+        if len(_user_cache) > USER_CACHE_MAXSIZE:
+            _user_cache.popitem(last=False)
+    return user
+
+
+def clear_user_cache() -> None:
+    """UUID → 사용자 캐시 초기화"""
+    with _user_cache_lock:
+        _user_cache.clear()
+
 
 @settings_bp.route("/settings/<uuid>")
 def settings_page(uuid):
     """사용자 설정 페이지"""
-    user = User.query.filter_by(uuid=uuid).first()
+    from app.services.stock import get_stock_prices
+
+    user = _get_user(uuid)
     if not user:
-        current_app.logger.warning(f"[설정 페이지] 존재하지 않는 UUID: {uuid}")
+        logger.warning("[설정 페이지] 존재하지 않는 UUID: %s", uuid)
         abort(404)
 
-    current_app.logger.info(f"[설정 페이지] 접근 성공 - 사용자: {user.email}")
+    logger.info("[설정 페이지] 접근 성공 - 사용자: %s", user.email)
+
+    # 통계 계산 (상태별 집계 쿼리 1회)
+    stats = {"total": 0, "active": 0, "triggered": 0, "inactive": 0}
+    status_counts = (
+        db.session.query(Alert.status, db.func.count(Alert.id))
+        .filter(Alert.user_id == user.id)
+        .group_by(Alert.status)
+        .all()
+    )
+    for status, count in status_counts:
+        stats[status] = count
+    stats["total"] = sum(count for _, count in status_counts)
+
+    # 알림 목록 조회 (렌더링용 단일 쿼리, 등록순)
+    alerts = Alert.query.filter_by(user_id=user.id).order_by(Alert.id).all()
 
-    # 통계 계산
-    stats = {
-        "total": len(user.alerts),
-        "active": len([a for a in user.alerts if a.status == "active"]),
-        "triggered": len([a for a in user.alerts if a.status == "triggered"]),
-        "inactive": len([a for a in user.alerts if a.status == "inactive"]),
-    }
+    # 현재가 일괄 조회 (종목 수와 무관하게 약 1회 왕복 시간)
+    try:
+        price_map = get_stock_prices([alert.stock_code for alert in alerts])
+    except Exception as e:
+        logger.warning("현재가 일괄 조회 실패: %s", e)
+        price_map = {}
 
     # 현재가 정보 포함한 알림 목록
     alerts_with_price = []
-    for alert in user.alerts:
-        try:
-            current_price = get_stock_price(alert.stock_code)
-            if current_price is not None:
-                change_rate = (
-                    (current_price - alert.base_price) / alert.base_price
-                ) * 100
-            else:
-                current_price = alert.base_price
-                change_rate = 0
-        except Exception as e:
-            current_app.logger.warning(f"현재가 조회 실패: {alert.stock_code}, {e}")
+    for alert in alerts:
+        current_price = price_map.get(alert.stock_code)
+        if current_price is not None:
+            change_rate = ((current_price - alert.base_price) / alert.base_price) * 100
+        else:
             current_price = alert.base_price
             change_rate = 0
 
@@ -85,10 +143,16 @@ def settings_page(uuid):
 @settings_bp.route("/settings/<uuid>/alerts", methods=["POST"])
 def add_alert(uuid):
     """종목 추가"""
+    from app.services.stock import (
+        is_valid_stock_code_format,
+        find_stock,
+        get_stock_price,
+    )
+
     # 1. 사용자 조회
-    user = User.query.filter_by(uuid=uuid).first()
+    user = _get_user(uuid)
     if not user:
-        current_app.logger.warning(f"[종목 추가] 존재하지 않는 UUID: {uuid}")
+        logger.warning("[종목 추가] 존재하지 않는 UUID: %s", uuid)
         abort(404)
 
     # 2. 폼 데이터 추출
@@ -96,22 +160,25 @@ def add_alert(uuid):
     threshold_upper = request.form.get("threshold_upper", "").strip()
     threshold_lower = request.form.get("threshold_lower", "").strip()
 
-    current_app.logger.info(
-        f"[종목 추가 요청] 사용자: {user.email}, "
-        f"종목코드: {stock_code}, 상승: {threshold_upper}%, 하락: {threshold_lower}%"
+    logger.info(
+        "[종목 추가 요청] 사용자: %s, 종목코드: %s, 상승: %s%%, 하락: %s%%",
+        user.email,
+        stock_code,
+        threshold_upper,
+        threshold_lower,
     )
 
     # 3. 종목코드 유효성 검증
     if not stock_code:
-        current_app.logger.warning(
-            f"[종목 추가 실패] 종목코드 미입력 - 사용자: {user.email}"
-        )
+        logger.warning("[종목 추가 실패] 종목코드 미입력 - 사용자: %s", user.email)
         flash("종목코드를 입력해주세요.", "error")
         return redirect(url_for("settings.settings_page", uuid=uuid))
 
     if not is_valid_stock_code_format(stock_code):
-        current_app.logger.warning(
-            f"[종목 추가 실패] 종목코드 형식 오류: {stock_code} - 사용자: {user.email}"
+        logger.warning(
+            "[종목 추가 실패] 종목코드 형식 오류: %s - 사용자: %s",
+            stock_code,
+            user.email,
         )
         flash("종목코드는 6자리 숫자여야 합니다.", "error")
         return redirect(url_for("settings.settings_page", uuid=uuid))
@@ -124,8 +191,10 @@ def add_alert(uuid):
         try:
             upper_value = float(threshold_upper)
         except ValueError:
-            current_app.logger.warning(
-                f"[종목 추가 실패] 상승 기준 형식 오류: {threshold_upper} - 사용자: {user.email}"
+            logger.warning(
+                "[종목 추가 실패] 상승 기준 형식 오류: %s - 사용자: %s",
+                threshold_upper,
+                user.email,
             )
             flash("상승 기준은 숫자여야 합니다.", "error")
             return redirect(url_for("settings.settings_page", uuid=uuid))
@@ -137,8 +206,10 @@ def add_alert(uuid):
             if lower_value > 0:
                 lower_value = -lower_value
         except ValueError:
-            current_app.logger.warning(
-                f"[종목 추가 실패] 하락 기준 형식 오류: {threshold_lower} - 사용자: {user.email}"
+            logger.warning(
+                "[종목 추가 실패] 하락 기준 형식 오류: %s - 사용자: %s",
+                threshold_lower,
+                user.email,
             )
             flash("하락 기준은 숫자여야 합니다.", "error")
             return redirect(url_for("settings.settings_page", uuid=uuid))
@@ -147,53 +218,52 @@ def add_alert(uuid):
     if upper_value is None and lower_value is None:
         upper_value = DEFAULT_THRESHOLD_UPPER
         lower_value = DEFAULT_THRESHOLD_LOWER
-        current_app.logger.info(
-            f"[종목 추가] 기본값 적용 - 사용자: {user.email}, "
-            f"상승: {upper_value}%, 하락: {lower_value}%"
+        logger.info(
+            "[종목 추가] 기본값 적용 - 사용자: %s, 상승: %s%%, 하락: %s%%",
+            user.email,
+            upper_value,
+            lower_value,
         )
 
-    # 5. 종목코드 실제 존재 여부 검증 (FDR 캐시)
-    current_app.logger.debug(f"[종목 검증] FDR 캐시 조회: {stock_code}")
-    if not validate_stock_code(stock_code):
-        current_app.logger.warning(
-            f"[종목 추가 실패] 유효하지 않은 종목코드: {stock_code} - 사용자: {user.email}"
+    # 5. 종목코드 존재 여부 검증 + 종목명 조회 (FDR 캐시 인덱스 1회 조회)
+    logger.debug("[종목 검증] FDR 캐시 조회: %s", stock_code)
+    stock = find_stock(stock_code)
+    if stock is None:
+        logger.warning(
+            "[종목 추가 실패] 유효하지 않은 종목코드: %s - 사용자: %s",
+            stock_code,
+            user.email,
         )
         flash("유효하지 않은 종목코드입니다. 종목코드를 확인해주세요.", "error")
         return redirect(url_for("settings.settings_page", uuid=uuid))
 
-    # 6. 중복 등록 검증
-    existing_alert = Alert.query.filter_by(
-        user_id=user.id, stock_code=stock_code, status="active"
-    ).first()
+    # 6. 중복 등록 검증 (ix_alerts_user_status_code 인덱스만으로 판단, 행 로드 없음)
+    is_duplicate = db.session.query(
+        Alert.query.filter_by(
+            user_id=user.id, stock_code=stock_code, status="active"
+        ).exists()
+    ).scalar()
 
-    if existing_alert:
-        current_app.logger.warning(
-            f"[종목 추가 실패] 중복 등록: {stock_code} - 사용자: {user.email}"
+    if is_duplicate:
+        logger.warning(
+            "[종목 추가 실패] 중복 등록: %s - 사용자: %s", stock_code, user.email
         )
         flash("이미 등록된 종목입니다.", "error")
         return redirect(url_for("settings.settings_page", uuid=uuid))
 
-    # 7. 종목명 조회 (FDR 캐시)
-    current_app.logger.debug(f"[종목명 조회] FDR 캐시: {stock_code}")
-    stock_name = get_stock_name(stock_code)
-    if not stock_name:
-        current_app.logger.error(
-            f"[종목 추가 실패] 종목명 조회 실패: {stock_code} - 사용자: {user.email}"
-        )
-        flash("종목 정보를 조회할 수 없습니다. 잠시 후 다시 시도해주세요.", "error")
-        return redirect(url_for("settings.settings_page", uuid=uuid))
+    stock_name = stock["name"]
 
-    # 8. 현재가 조회 (네이버 API)
-    current_app.logger.debug(f"[현재가 조회] 네이버 API: {stock_code}")
+    # 7. 현재가 조회 (네이버 API, 중복 검증 통과 후에만 호출)
+    logger.debug("[현재가 조회] 네이버 API: %s", stock_code)
     current_price = get_stock_price(stock_code)
     if current_price is None:
-        current_app.logger.error(
-            f"[종목 추가 실패] 현재가 조회 실패: {stock_code} - 사용자: {user.email}"
+        logger.error(
+            "[종목 추가 실패] 현재가 조회 실패: %s - 사용자: %s", stock_code, user.email
         )
         flash("주식 정보를 조회할 수 없습니다. 잠시 후 다시 시도해주세요.", "error")
         return redirect(url_for("settings.settings_page", uuid=uuid))
 
-    # 9. Alert 레코드 생성
+    # 8. Alert 레코드 생성
     alert = Alert(
         user_id=user.id,
         stock_code=stock_code,
@@ -207,10 +277,14 @@ def add_alert(uuid):
     db.session.add(alert)
     db.session.commit()
 
-    current_app.logger.info(
-        f"[종목 추가 성공] 사용자: {user.email}, "
-        f"종목: {stock_name}({stock_code}), 기준가: {current_price:,.0f}원, "
-        f"상승: {upper_value}%, 하락: {lower_value}%"
+    logger.info(
+        ALERT_ADDED_LOG,
+        user.email,
+        stock_name,
+        stock_code,
+        current_price,
+        upper_value,
+        lower_value,
     )
     flash(f"{stock_name} ({stock_code}) 종목이 추가되었습니다.", "success")
     return redirect(url_for("settings.settings_page", uuid=uuid))
@@ -219,27 +293,31 @@ def add_alert(uuid):
 @settings_bp.route("/settings/<uuid>/alerts/<int:alert_id>/update", methods=["POST"])
 def update_alert(uuid, alert_id):
     """알림 기준 수정"""
-    current_app.logger.info(f"[알림 수정 요청] UUID: {uuid}, Alert ID: {alert_id}")
+    logger.info("[알림 수정 요청] UUID: %s, Alert ID: %s", uuid, alert_id)
 
     # 1. 사용자 조회
-    user = User.query.filter_by(uuid=uuid).first()
+    user = _get_user(uuid)
     if not user:
-        current_app.logger.warning(f"[알림 수정 실패] 존재하지 않는 UUID: {uuid}")
+        logger.warning("[알림 수정 실패] 존재하지 않는 UUID: %s", uuid)
         abort(404)
 
     # 2. Alert 조회
     alert = db.session.get(Alert, alert_id)
     if not alert:
-        current_app.logger.warning(
-            f"[알림 수정 실패] 존재하지 않는 Alert ID: {alert_id} - 사용자: {user.email}"
+        logger.warning(
+            "[알림 수정 실패] 존재하지 않는 Alert ID: %s - 사용자: %s",
+            alert_id,
+            user.email,
         )
         abort(404)
 
     # 3. 소유권 검증
     if alert.user_id != user.id:
-        current_app.logger.warning(
-            f"[알림 수정 실패] 권한 없음 - Alert ID: {alert_id}, "
-            f"요청자: {user.email}, 소유자 ID: {alert.user_id}"
+        logger.warning(
+            "[알림 수정 실패] 권한 없음 - Alert ID: %s, 요청자: %s, 소유자 ID: %s",
+            alert_id,
+            user.email,
+            alert.user_id,
         )
         abort(403)
 
@@ -278,45 +356,50 @@ def update_alert(uuid, alert_id):
     alert.threshold_lower = lower_value
     db.session.commit()
 
-    current_app.logger.info(
-        f"[알림 수정 성공] 사용자: {user.email}, "
-        f"종목: {alert.stock_name}({alert.stock_code}), "
-        f"상승: {upper_value}%, 하락: {lower_value}%"
+    logger.info(
+        "[알림 수정 성공] 사용자: %s, 종목: %s(%s), 상승: %s%%, 하락: %s%%",
+        user.email,
+        alert.stock_name,
+        alert.stock_code,
+        upper_value,
+        lower_value,
     )
     flash(f"{alert.stock_name} 알림 기준이 수정되었습니다.", "success")
 
     # 상세 페이지에서 수정한 경우 상세 페이지로 돌아가기
     if request.form.get("redirect_to") == "stock_detail":
-        return redirect(
-            url_for("settings.stock_detail", uuid=uuid, alert_id=alert_id)
-        )
+        return redirect(url_for("settings.stock_detail", uuid=uuid, alert_id=alert_id))
     return redirect(url_for("settings.settings_page", uuid=uuid))
 
 
 @settings_bp.route("/settings/<uuid>/alerts/<int:alert_id>/toggle", methods=["POST"])
 def toggle_alert_status(uuid, alert_id):
     """알림 상태 토글 (활성/비활성)"""
-    current_app.logger.info(f"[상태 변경 요청] UUID: {uuid}, Alert ID: {alert_id}")
+    logger.info("[상태 변경 요청] UUID: %s, Alert ID: %s", uuid, alert_id)
 
     # 1. 사용자 조회
-    user = User.query.filter_by(uuid=uuid).first()
+    user = _get_user(uuid)
     if not user:
-        current_app.logger.warning(f"[상태 변경 실패] 존재하지 않는 UUID: {uuid}")
+        logger.warning("[상태 변경 실패] 존재하지 않는 UUID: %s", uuid)
         abort(404)
 
     # 2. Alert 조회
     alert = db.session.get(Alert, alert_id)
     if not alert:
-        current_app.logger.warning(
-            f"[상태 변경 실패] 존재하지 않는 Alert ID: {alert_id} - 사용자: {user.email}"
+        logger.warning(
+            "[상태 변경 실패] 존재하지 않는 Alert ID: %s - 사용자: %s",
+            alert_id,
+            user.email,
         )
         abort(404)
 
     # 3. 소유권 검증
     if alert.user_id != user.id:
-        current_app.logger.warning(
-            f"[상태 변경 실패] 권한 없음 - Alert ID: {alert_id}, "
-            f"요청자: {user.email}, 소유자 ID: {alert.user_id}"
+        logger.warning(
+            "[상태 변경 실패] 권한 없음 - Alert ID: %s, 요청자: %s, 소유자 ID: %s",
+            alert_id,
+            user.email,
+            alert.user_id,
         )
         abort(403)
 
@@ -330,10 +413,13 @@ def toggle_alert_status(uuid, alert_id):
     db.session.commit()
 
     status_label = "활성화" if new_status == "active" else "비활성화"
-    current_app.logger.info(
-        f"[상태 변경 성공] 사용자: {user.email}, "
-        f"종목: {alert.stock_name}({alert.stock_code}), "
-        f"{old_status} → {new_status}"
+    logger.info(
+        "[상태 변경 성공] 사용자: %s, 종목: %s(%s), %s → %s",
+        user.email,
+        alert.stock_name,
+        alert.stock_code,
+        old_status,
+        new_status,
     )
     flash(f"{alert.stock_name} 알림이 {status_label}되었습니다.", "success")
     return redirect(url_for("settings.settings_page", uuid=uuid))
@@ -342,27 +428,31 @@ def toggle_alert_status(uuid, alert_id):
 @settings_bp.route("/settings/<uuid>/alerts/<int:alert_id>/delete", methods=["POST"])
 def delete_alert(uuid, alert_id):
     """종목 삭제"""
-    current_app.logger.info(f"[종목 삭제 요청] UUID: {uuid}, Alert ID: {alert_id}")
+    logger.info("[종목 삭제 요청] UUID: %s, Alert ID: %s", uuid, alert_id)
 
     # 1. 사용자 조회
-    user = User.query.filter_by(uuid=uuid).first()
+    user = _get_user(uuid)
     if not user:
-        current_app.logger.warning(f"[종목 삭제 실패] 존재하지 않는 UUID: {uuid}")
+        logger.warning("[종목 삭제 실패] 존재하지 않는 UUID: %s", uuid)
         abort(404)
 
     # 2. Alert 조회
     alert = db.session.get(Alert, alert_id)
     if not alert:
-        current_app.logger.warning(
-            f"[종목 삭제 실패] 존재하지 않는 Alert ID: {alert_id} - 사용자: {user.email}"
+        logger.warning(
+            "[종목 삭제 실패] 존재하지 않는 Alert ID: %s - 사용자: %s",
+            alert_id,
+            user.email,
         )
         abort(404)
 
     # 3. 소유권 검증
     if alert.user_id != user.id:
-        current_app.logger.warning(
-            f"[종목 삭제 실패] 권한 없음 - Alert ID: {alert_id}, "
-            f"요청자: {user.email}, 소유자 ID: {alert.user_id}"
+        logger.warning(
+            "[종목 삭제 실패] 권한 없음 - Alert ID: %s, 요청자: %s, 소유자 ID: %s",
+            alert_id,
+            user.email,
+            alert.user_id,
         )
         abort(403)
 
@@ -374,8 +464,8 @@ def delete_alert(uuid, alert_id):
     db.session.delete(alert)
     db.session.commit()
 
-    current_app.logger.info(
-        f"[종목 삭제 성공] 사용자: {user.email}, 종목: {stock_name}({stock_code})"
+    logger.info(
+        "[종목 삭제 성공] 사용자: %s, 종목: %s(%s)", user.email, stock_name, stock_code
     )
     flash(f"{stock_name} ({stock_code}) 종목이 삭제되었습니다.", "success")
     return redirect(url_for("settings.settings_page", uuid=uuid))
@@ -384,35 +474,35 @@ def delete_alert(uuid, alert_id):
 @settings_bp.route("/settings/<uuid>/stock/<int:alert_id>")
 def stock_detail(uuid, alert_id):
     """종목 상세 페이지"""
-    user = User.query.filter_by(uuid=uuid).first()
+    from app.services.stock import get_stock_price
+
+    user = _get_user(uuid)
     if not user:
-        current_app.logger.warning(f"[종목 상세] 존재하지 않는 UUID: {uuid}")
+        logger.warning("[종목 상세] 존재하지 않는 UUID: %s", uuid)
         abort(404)
 
     alert = db.session.get(Alert, alert_id)
     if not alert or alert.user_id != user.id:
-        current_app.logger.warning(
-            f"[종목 상세] 접근 실패 - Alert ID: {alert_id}, UUID: {uuid}"
-        )
+        logger.warning("[종목 상세] 접근 실패 - Alert ID: %s, UUID: %s", alert_id, uuid)
         abort(404)
 
-    current_app.logger.info(
-        f"[종목 상세] 접근 성공 - {alert.stock_name}({alert.stock_code}), "
-        f"사용자: {user.email}"
+    logger.info(
+        "[종목 상세] 접근 성공 - %s(%s), 사용자: %s",
+        alert.stock_name,
+        alert.stock_code,
+        user.email,
     )
 
     # 현재가 조회
     try:
         current_price = get_stock_price(alert.stock_code)
         if current_price is not None:
-            change_rate = (
-                (current_price - alert.base_price) / alert.base_price
-            ) * 100
+            change_rate = ((current_price - alert.base_price) / alert.base_price) * 100
         else:
             current_price = alert.base_price
             change_rate = 0
     except Exception as e:
-        current_app.logger.warning(f"현재가 조회 실패: {alert.stock_code}, {e}")
+        logger.warning("현재가 조회 실패: %s, %s", alert.stock_code, e)
         current_price = alert.base_price
         change_rate = 0
 
@@ -436,7 +526,9 @@ def stock_detail(uuid, alert_id):
 @settings_bp.route("/settings/<uuid>/stock/<int:alert_id>/chart-data")
 def chart_data(uuid, alert_id):
     """차트 데이터 API (JSON)"""
-    user = User.query.filter_by(uuid=uuid).first()
+    from app.services.stock import get_stock_history
+
+    user = _get_user(uuid)
     if not user:
         abort(404)
 
@@ -479,26 +571,47 @@ def chart_data(uuid, alert_id):
 @settings_bp.route("/settings/<uuid>/history")
 def history_page(uuid):
     """알림 히스토리 페이지"""
-    user = User.query.filter_by(uuid=uuid).first()
+    user = _get_user(uuid)
     if not user:
-        current_app.logger.warning(f"[히스토리 페이지] 존재하지 않는 UUID: {uuid}")
+        logger.warning("[히스토리 페이지] 존재하지 않는 UUID: %s", uuid)
         abort(404)
 
-    current_app.logger.info(f"[히스토리 페이지] 접근 성공 - 사용자: {user.email}")
+    logger.info("[히스토리 페이지] 접근 성공 - 사용자: %s", user.email)
 
-    # 페이지네이션
-    page = request.args.get("page", 1, type=int)
-    per_page = 20
+    # 키셋 페이지네이션: before = 이전 페이지 마지막 AlertLog id
+    # (OFFSET/COUNT 없이 (sent_at, id) 인덱스 탐색만 수행)
+    before = request.args.get("before", type=int)
+
+    # AlertLog 조회 (최신순, 템플릿의 log.alert 접근용 JOIN 로드)
+    logs_query = AlertLog.query.options(joinedload(AlertLog.alert)).filter_by(
+        user_id=user.id
+    )
+    if before is not None:
+        # 커서 행의 sent_at을 DB 값 그대로 비교 (저장 포맷 차이로 인한 누락 방지)
+        cursor_sent_at = (
+            db.select(AlertLog.sent_at)
+            .where(AlertLog.id == before, AlertLog.user_id == user.id)
+            .scalar_subquery()
+        )
+        logs_query = logs_query.filter(
+            db.tuple_(AlertLog.sent_at, AlertLog.id) < db.tuple_(cursor_sent_at, before)
+        )
 
-    # AlertLog 조회 (최신순)
-    logs_query = AlertLog.query.filter_by(user_id=user.id).order_by(
-        AlertLog.sent_at.desc()
+    # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+    logs = (
+        logs_query.order_by(AlertLog.sent_at.desc(), AlertLog.id.desc())
+        .limit(HISTORY_PER_PAGE + 1)
+        .all()
     )
-    logs_pagination = logs_query.paginate(page=page, per_page=per_page, error_out=False)
+    next_cursor = None
+    if len(logs) > HISTORY_PER_PAGE:
+        logs = logs[:HISTORY_PER_PAGE]
+        next_cursor = logs[-1].id
 
     return render_template(
         "history.html",
         user=user,
-        logs=logs_pagination.items,
-        pagination=logs_pagination,
+        logs=logs,
+        before=before,
+        next_cursor=next_cursor,
     )
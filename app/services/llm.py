@@ -3,7 +3,12 @@
 알림 이메일에 포함할 투자 코멘트 생성
 """
 
+import random
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from flask import current_app
@@ -11,30 +16,93 @@ from openai import OpenAI, APIConnectionError, RateLimitError, APIStatusError, A
 
 # OpenAI API 설정
 OPENAI_MODEL = "gpt-5-nano"
-OPENAI_MAX_COMPLETION_TOKENS = 2000  # gpt-5-nano는 reasoning 모델, 추론+출력 토큰 필요
+# gpt-5-nano는 reasoning 모델: 추론을 최소화하고 2문장 출력에 맞춰 상한 축소
+OPENAI_REASONING_EFFORT = "minimal"
+OPENAI_MAX_COMPLETION_TOKENS = 600
 OPENAI_TIMEOUT = 30  # 초
 # Note: gpt-5-nano는 temperature=1만 지원하므로 파라미터 생략 (기본값 사용)
 
 # 재시도 설정
 MAX_RETRIES = 3
 BASE_RETRY_DELAY = 1  # 초
+RETRY_JITTER = 1  # 초, 재시도 대기에 0~1초 무작위 추가 (동시 재시도 분산)
+
+# 인증 오류 후 API 호출을 건너뛰는 시간 (잘못된 키로 알림마다 실패/로그 반복 방지)
+AUTH_FAILURE_COOLDOWN = 300  # 초
+
+# 코멘트 일괄 생성 시 최대 동시 요청 수 기본값 (config LLM_MAX_CONCURRENCY로 변경)
+DEFAULT_LLM_MAX_CONCURRENCY = 10
+
+# 분당 최대 요청 수 기본값 (config OPENAI_MAX_REQUESTS_PER_MINUTE로 변경)
+DEFAULT_MAX_REQUESTS_PER_MINUTE = 500
 
 # 프롬프트 경로
 PROMPT_TEMPLATE_PATH = Path(__file__).resolve().parent.parent.parent / "prompts" / "alert_mail.txt"
 
-# 기본 프롬프트 (템플릿 파일이 없을 경우 사용)
-DEFAULT_PROMPT_TEMPLATE = """당신은 주식 시장 분석가입니다.
-다음 정보를 바탕으로 간결한 투자 코멘트를 작성하세요.
+# 시스템 메시지 (역할/공통 제약은 여기서만 지정)
+SYSTEM_PROMPT = (
+    "당신은 주식 시장 분석가입니다. 객관적 사실 위주로 간결하게, "
+    "투자 권유나 매수/매도 추천 없이 한국어로 답변하세요."
+)
 
+# 기본 프롬프트 (템플릿 파일이 없을 경우 사용)
+DEFAULT_PROMPT_TEMPLATE = """다음 정보로 투자 코멘트를 3-5문장으로 작성하세요.
 종목: {stock_name} ({stock_code})
 변동률: {change_rate}%
 기준: {threshold_direction}
 코스피: {kospi}, 코스닥: {kosdaq}
-
-요구사항: 3-5문장, 객관적 사실 위주, 투자 권유 금지, 한국어
 """
 
 
+class _RequestRateLimiter:
+    """분당 요청 수 제한 (슬라이딩 윈도우, 스레드 안전)
+
+    한도에 도달하면 가장 오래된 요청이 윈도우를 벗어날 때까지 대기하여
+    429 응답을 받기 전에 호출 속도를 낮춘다.
+    """
+
+    def __init__(self, period: float = 60.0):
+        self._period = period
+        self._timestamps: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, max_requests: int) -> None:
+        """요청 슬롯 1개 확보 (필요 시 대기)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self._period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < max_requests:
+                    self._timestamps.append(now)
+                    return
+                wait = self._period - (now - self._timestamps[0])
+            time.sleep(wait)
+
+
+# 프로세스 공용 요청 제한기
+_rate_limiter = _RequestRateLimiter()
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str) -> OpenAI:
+    """
+    OpenAI 클라이언트 반환 (API 키별로 1개 생성 후 재사용)
+
+    클라이언트 내부 HTTP 연결 풀을 호출 간에 공유하여 TLS 핸드셰이크를 줄임
+    """
+    return OpenAI(api_key=api_key, timeout=OPENAI_TIMEOUT)
+
+
+@lru_cache(maxsize=4)
+def _read_prompt_template(path: Path) -> str:
+    """프롬프트 템플릿 파일 읽기 (경로별로 프로세스당 1회)"""
+    with open(path, "r", encoding="utf-8") as f:
+        template = f.read()
+    current_app.logger.debug(f"[LLM] 프롬프트 템플릿 로드: {path}")
+    return template
+
+
 def load_prompt_template() -> str:
     """
     프롬프트 템플릿 파일 로드
@@ -43,13 +111,11 @@ def load_prompt_template() -> str:
         str: 프롬프트 템플릿 문자열
 
     Note:
+        파일 내용은 프로세스 수명 동안 캐시됨 (변경 시 재시작 필요)
         템플릿 파일이 없을 경우 기본 프롬프트 반환
     """
     try:
-        with open(PROMPT_TEMPLATE_PATH, "r", encoding="utf-8") as f:
-            template = f.read()
-            current_app.logger.debug(f"[LLM] 프롬프트 템플릿 로드: {PROMPT_TEMPLATE_PATH}")
-            return template
+        return _read_prompt_template(PROMPT_TEMPLATE_PATH)
     except FileNotFoundError:
         current_app.logger.warning(
             f"[LLM] 프롬프트 템플릿 파일 없음, 기본 프롬프트 사용: {PROMPT_TEMPLATE_PATH}"
@@ -123,6 +189,26 @@ def _format_prompt(
     )
 
 
+# 마지막 인증 실패 (API 키, time.monotonic() 시각)
+_auth_failure: tuple[str, float] | None = None
+
+
+def clear_auth_failure() -> None:
+    """인증 실패 기록 초기화 (즉시 API 호출 재개)"""
+    global _auth_failure
+    _auth_failure = None
+
+
+def _auth_recently_failed(api_key: str) -> bool:
+    """같은 API 키로 AUTH_FAILURE_COOLDOWN 이내에 인증 실패했는지 여부"""
+    failure = _auth_failure
+    return (
+        failure is not None
+        and failure[0] == api_key
+        and time.monotonic() - failure[1] < AUTH_FAILURE_COOLDOWN
+    )
+
+
 def generate_alert_comment(
     stock_name: str,
     stock_code: str,
@@ -151,12 +237,18 @@ def generate_alert_comment(
     Returns:
         str | None: 생성된 투자 코멘트 (3-5문장) 또는 None (API 호출 실패 시)
     """
+    global _auth_failure
+
     # 1. API 키 확인
     api_key = current_app.config.get("OPENAI_API_KEY")
     if not api_key:
         current_app.logger.error("[LLM] OPENAI_API_KEY가 설정되지 않았습니다.")
         return None
 
+    # 인증 실패 직후에는 프롬프트 생성/API 호출/오류 로그 없이 바로 실패 처리
+    if _auth_recently_failed(api_key):
+        return None
+
     # 2. 프롬프트 생성
     prompt = _format_prompt(
         stock_name, stock_code, change_rate, threshold_type, market_summary
@@ -165,34 +257,43 @@ def generate_alert_comment(
     current_app.logger.debug(f"[LLM] 코멘트 생성 요청: {stock_name}({stock_code})")
 
     # 3. OpenAI API 호출 (재시도 로직 포함)
-    client = OpenAI(api_key=api_key, timeout=OPENAI_TIMEOUT)
+    client = _get_client(api_key)
+    max_requests = current_app.config.get(
+        "OPENAI_MAX_REQUESTS_PER_MINUTE", DEFAULT_MAX_REQUESTS_PER_MINUTE
+    )
 
     for attempt in range(MAX_RETRIES):
         try:
+            _rate_limiter.acquire(max_requests)
             response = client.chat.completions.create(
                 model=OPENAI_MODEL,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 주식 시장 분석가입니다. 객관적이고 간결하게 답변하세요.",
-                    },
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
                 max_completion_tokens=OPENAI_MAX_COMPLETION_TOKENS,
+                reasoning_effort=OPENAI_REASONING_EFFORT,
             )
 
             # 성공
             content = response.choices[0].message.content
-            total_tokens = response.usage.total_tokens if response.usage else 0
+            usage = response.usage
+            total_tokens = usage.total_tokens if usage else 0
+            completion_tokens = usage.completion_tokens if usage else 0
 
+            # 출력 토큰 수는 OPENAI_MAX_COMPLETION_TOKENS 조정 근거로 기록
             current_app.logger.info(
-                f"[LLM] 코멘트 생성 성공: {stock_name}({stock_code}), 토큰: {total_tokens}"
+                f"[LLM] 코멘트 생성 성공: {stock_name}({stock_code}), "
+                f"토큰: {total_tokens} (출력: {completion_tokens})"
             )
             return content
 
         except AuthenticationError as e:
-            # 인증 오류는 재시도 불필요
-            current_app.logger.error(f"[LLM] API 인증 오류: {e}")
+            # 인증 오류는 재시도 불필요, 쿨다운 동안 이후 호출도 건너뜀
+            _auth_failure = (api_key, time.monotonic())
+            current_app.logger.error(
+                f"[LLM] API 인증 오류, {AUTH_FAILURE_COOLDOWN}초간 호출 중단: {e}"
+            )
             return None
 
         except (APIConnectionError, RateLimitError, APIStatusError) as e:
@@ -205,11 +306,11 @@ def generate_alert_comment(
                 )
                 return get_fallback_comment(stock_name, change_rate, threshold_type)
 
-            # 재시도 대기 (지수 백오프)
-            delay = BASE_RETRY_DELAY * (2**attempt)
+            # 재시도 대기 (지수 백오프 + 지터)
+            delay = BASE_RETRY_DELAY * (2**attempt) + random.uniform(0, RETRY_JITTER)
             current_app.logger.warning(
                 f"[LLM] API 재시도 ({attempt + 1}/{MAX_RETRIES}), "
-                f"{delay}초 후: {e}"
+                f"{delay:.1f}초 후: {e}"
             )
             time.sleep(delay)
 
@@ -223,3 +324,47 @@ def generate_alert_comment(
 
     # 모든 재시도 실패 (이론적으로 도달 불가)
     return get_fallback_comment(stock_name, change_rate, threshold_type)
+
+
+def generate_alert_comments_batch(items: list[dict]) -> list[str | None]:
+    """
+    여러 알림의 투자 코멘트를 동시에 생성
+
+    Args:
+        items: generate_alert_comment() 인자 dict 목록
+            [{"stock_name", "stock_code", "change_rate",
+              "threshold_type", "market_summary"}, ...]
+
+    Returns:
+        list[str | None]: items 순서대로 생성된 코멘트 (실패 시 None)
+
+    Note:
+        동시 요청 수는 LLM_MAX_CONCURRENCY, 호출 속도는 분당 요청 제한기로 제어
+    """
+    if not items:
+        return []
+    if len(items) == 1:
+        return [generate_alert_comment(**items[0])]
+
+    app = current_app._get_current_object()
+    max_workers = min(
+        app.config.get("LLM_MAX_CONCURRENCY", DEFAULT_LLM_MAX_CONCURRENCY),
+        len(items),
+    )
+
+    def generate(item: dict) -> str | None:
+        # 작업 스레드에는 앱 컨텍스트가 없으므로 직접 push
+        with app.app_context():
+            try:
+                return generate_alert_comment(**item)
+            except Exception as e:
+                app.logger.error(
+                    f"[LLM] 코멘트 생성 오류: {item.get('stock_code')}, {e}"
+                )
+                return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        comments = list(executor.map(generate, items))
+
+    current_app.logger.info(f"[LLM] 코멘트 일괄 생성: {len(items)}건")
+    return comments
@@ -1,12 +1,131 @@
 """이메일 발송 서비스"""
 
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from contextlib import contextmanager
+from email.message import EmailMessage
 from email.utils import formataddr
+from string import Template
 
 from flask import current_app
 
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+
+# 메일 본문 템플릿 (모듈 로드 시 1회 생성, 발송 시에는 치환만 수행)
+WELCOME_SUBJECT = "[Stock Alarm] 설정 페이지 안내"
+_WELCOME_BODY_TEMPLATE = Template("""Stock Alarm 서비스에 등록해 주셔서 감사합니다.
+
+아래 링크에서 알림을 받고 싶은 종목을 설정하세요:
+$settings_url
+
+이 링크는 본인만 사용할 수 있는 고유 URL입니다.
+분실 시 홈페이지에서 동일한 이메일로 재발급 받을 수 있습니다.
+
+---
+Stock Alarm 서비스
+""")
+
+_ALERT_SUBJECT_TEMPLATE = Template("[Stock Alarm] $stock_name $direction 기준 도달")
+_ALERT_BODY_TEMPLATE = Template("""## 알림 요약
+
+- 종목: $stock_name ($stock_code)
+- 등록가: $base_price원
+- 현재가: $current_price원
+- 변동률: $change_rate%
+- 도달 기준: $direction $threshold_value%
+
+## 시장 동향
+
+- 코스피: $kospi ($kospi_change, $kospi_change_rate%)
+- 코스닥: $kosdaq ($kosdaq_change, $kosdaq_change_rate%)
+
+## 투자 코멘트
+
+$llm_comment
+
+---
+이 알림은 Stock Alarm 서비스에서 발송되었습니다.
+설정 변경: $settings_url
+""")
+
+
+@contextmanager
+def _smtp_session(gmail_address: str, gmail_password: str):
+    """
+    로그인까지 마친 Gmail SMTP 연결
+
+    여러 메일을 보낼 때 TLS 핸드셰이크와 로그인을 한 번만 수행하도록
+    연결을 재사용한다.
+    """
+    with smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT) as server:
+        server.login(gmail_address, gmail_password)
+        yield server
+
+
+def _mail_settings() -> tuple[str, str, str] | None:
+    """
+    발송 설정 조회
+
+    Returns:
+        tuple[str, str, str] | None: (Gmail 주소, 앱 비밀번호, From 헤더)
+            Gmail 설정이 없으면 None
+    """
+    gmail_address = current_app.config.get("GMAIL_ADDRESS")
+    gmail_password = current_app.config.get("GMAIL_APP_PASSWORD")
+    if not gmail_address or not gmail_password:
+        return None
+
+    mail_from_address = current_app.config.get("MAIL_FROM_ADDRESS") or gmail_address
+    mail_from_name = current_app.config.get("MAIL_FROM_NAME", "Stock Alarm")
+    return (
+        gmail_address,
+        gmail_password,
+        formataddr((mail_from_name, mail_from_address)),
+    )
+
+
+def _build_message(from_header: str, to: str, subject: str, body: str) -> EmailMessage:
+    """텍스트 메일 생성"""
+    msg = EmailMessage()
+    msg["From"] = from_header
+    msg["To"] = to
+    msg["Subject"] = subject
+    msg.set_content(body)
+    return msg
+
+
+def _send_messages(
+    settings: tuple[str, str, str], messages: list[EmailMessage]
+) -> list[Exception | None]:
+    """
+    하나의 SMTP 연결로 메일 발송 (한 건의 실패가 나머지 발송을 막지 않음)
+
+    Args:
+        settings: _mail_settings() 결과
+        messages: 발송할 메일 목록
+
+    Returns:
+        list[Exception | None]: messages 순서대로 발송 오류 (성공 시 None)
+            연결/로그인 실패 시 발송 전 메일은 모두 해당 오류
+    """
+    gmail_address, gmail_password, _ = settings
+    errors: list[Exception | None] = [None] * len(messages)
+    attempted = 0
+
+    try:
+        with _smtp_session(gmail_address, gmail_password) as server:
+            for msg in messages:
+                try:
+                    server.send_message(msg)
+                except Exception as e:
+                    errors[attempted] = e
+                attempted += 1
+    except Exception as e:
+        for i in range(attempted, len(messages)):
+            errors[i] = e
+
+    return errors
+
 
 def send_welcome_email(email: str, settings_url: str) -> bool:
     """
@@ -22,45 +141,117 @@ def send_welcome_email(email: str, settings_url: str) -> bool:
               True - 발송 성공
               False - 발송 실패
     """
-    gmail_address = current_app.config.get("GMAIL_ADDRESS")
-    gmail_password = current_app.config.get("GMAIL_APP_PASSWORD")
-    mail_from_address = current_app.config.get("MAIL_FROM_ADDRESS") or gmail_address
-    mail_from_name = current_app.config.get("MAIL_FROM_NAME", "Stock Alarm")
-
-    if not gmail_address or not gmail_password:
+    settings = _mail_settings()
+    if settings is None:
         current_app.logger.error("Gmail 설정이 없습니다.")
         return False
 
-    subject = "[Stock Alarm] 설정 페이지 안내"
-    body = f"""Stock Alarm 서비스에 등록해 주셔서 감사합니다.
+    body = _WELCOME_BODY_TEMPLATE.substitute(settings_url=settings_url)
+    msg = _build_message(settings[2], email, WELCOME_SUBJECT, body)
 
-아래 링크에서 알림을 받고 싶은 종목을 설정하세요:
-{settings_url}
+    error = _send_messages(settings, [msg])[0]
+    if error is not None:
+        current_app.logger.error(f"이메일 발송 실패: {email}, 오류: {error}")
+        return False
 
-이 링크는 본인만 사용할 수 있는 고유 URL입니다.
-분실 시 홈페이지에서 동일한 이메일로 재발급 받을 수 있습니다.
+    current_app.logger.info(f"환영 이메일 발송 완료: {email}")
+    return True
 
----
-Stock Alarm 서비스
-"""
 
-    try:
-        msg = MIMEMultipart()
-        msg["From"] = formataddr((mail_from_name, mail_from_address))
-        msg["To"] = email
-        msg["Subject"] = subject
-        msg.attach(MIMEText(body, "plain", "utf-8"))
+def _build_alert_body(
+    stock_name: str,
+    stock_code: str,
+    base_price: float,
+    current_price: float,
+    change_rate: float,
+    threshold_type: str,
+    threshold_value: float,
+    market_summary: dict,
+    llm_comment: str,
+    settings_url: str,
+) -> tuple[str, str]:
+    """알림 이메일 제목과 본문 생성"""
+    direction = "상승" if threshold_type == "upper" else "하락"
+    subject = _ALERT_SUBJECT_TEMPLATE.substitute(
+        stock_name=stock_name, direction=direction
+    )
+
+    # 시장 지수 정보 (없으면 0)
+    def index_value(key: str, fmt: str) -> str:
+        return format(market_summary.get(key, 0), fmt)
+
+    body = _ALERT_BODY_TEMPLATE.substitute(
+        stock_name=stock_name,
+        stock_code=stock_code,
+        base_price=f"{base_price:,.0f}",
+        current_price=f"{current_price:,.0f}",
+        change_rate=f"{change_rate:+.2f}",
+        direction=direction,
+        threshold_value=threshold_value,
+        kospi=index_value("kospi", ",.2f"),
+        kosdaq=index_value("kosdaq", ",.2f"),
+        kospi_change=index_value("kospi_change", "+.2f"),
+        kosdaq_change=index_value("kosdaq_change", "+.2f"),
+        kospi_change_rate=index_value("kospi_change_rate", "+.2f"),
+        kosdaq_change_rate=index_value("kosdaq_change_rate", "+.2f"),
+        llm_comment=llm_comment,
+        settings_url=settings_url,
+    )
+    return subject, body
+
+
+def send_alert_emails_batch(items: list[dict]) -> list[bool]:
+    """
+    알림 이메일 여러 건을 하나의 SMTP 연결로 발송
 
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(gmail_address, gmail_password)
-            server.sendmail(mail_from_address, email, msg.as_string())
+    Args:
+        items: send_alert_email 인자 dict 목록
 
-        current_app.logger.info(f"환영 이메일 발송 완료: {email}")
-        return True
+    Returns:
+        list[bool]: items 순서대로 발송 성공 여부
+    """
+    results = [False] * len(items)
+    if not items:
+        return results
 
-    except Exception as e:
-        current_app.logger.error(f"이메일 발송 실패: {email}, 오류: {e}")
-        return False
+    settings = _mail_settings()
+    if settings is None:
+        current_app.logger.error("[알림 이메일] Gmail 설정이 없습니다.")
+        return results
+
+    # 메일 생성 (생성 실패 건은 발송 대상에서 제외)
+    messages = []
+    indices = []
+    for i, item in enumerate(items):
+        try:
+            subject, body = _build_alert_body(
+                **{k: v for k, v in item.items() if k != "email"}
+            )
+            messages.append(_build_message(settings[2], item["email"], subject, body))
+            indices.append(i)
+        except Exception as e:
+            current_app.logger.error(
+                f"[알림 이메일] 발송 실패: {item.get('email')}, "
+                f"종목: {item.get('stock_name')}({item.get('stock_code')}), 오류: {e}"
+            )
+
+    errors = _send_messages(settings, messages)
+
+    for i, error in zip(indices, errors):
+        item = items[i]
+        if error is None:
+            results[i] = True
+            current_app.logger.info(
+                f"[알림 이메일] 발송 성공: {item['email']}, "
+                f"종목: {item['stock_name']}({item['stock_code']})"
+            )
+        else:
+            current_app.logger.error(
+                f"[알림 이메일] 발송 실패: {item['email']}, "
+                f"종목: {item['stock_name']}({item['stock_code']}), 오류: {error}"
+            )
+
+    return results
 
 
 def send_alert_email(
@@ -95,68 +286,20 @@ def send_alert_email(
     Returns:
         bool: 발송 성공 여부
     """
-    gmail_address = current_app.config.get("GMAIL_ADDRESS")
-    gmail_password = current_app.config.get("GMAIL_APP_PASSWORD")
-    mail_from_address = current_app.config.get("MAIL_FROM_ADDRESS") or gmail_address
-    mail_from_name = current_app.config.get("MAIL_FROM_NAME", "Stock Alarm")
-
-    if not gmail_address or not gmail_password:
-        current_app.logger.error("[알림 이메일] Gmail 설정이 없습니다.")
-        return False
-
-    # 이메일 제목
-    direction = "상승" if threshold_type == "upper" else "하락"
-    subject = f"[Stock Alarm] {stock_name} {direction} 기준 도달"
-
-    # 시장 지수 정보 추출 (기본값 설정)
-    kospi = market_summary.get("kospi", 0)
-    kosdaq = market_summary.get("kosdaq", 0)
-    kospi_change = market_summary.get("kospi_change", 0)
-    kosdaq_change = market_summary.get("kosdaq_change", 0)
-    kospi_change_rate = market_summary.get("kospi_change_rate", 0)
-    kosdaq_change_rate = market_summary.get("kosdaq_change_rate", 0)
-
-    # 이메일 본문
-    body = f"""## 알림 요약
-
-- 종목: {stock_name} ({stock_code})
-- 등록가: {base_price:,.0f}원
-- 현재가: {current_price:,.0f}원
-- 변동률: {change_rate:+.2f}%
-- 도달 기준: {direction} {threshold_value}%
-
-## 시장 동향
-
-- 코스피: {kospi:,.2f} ({kospi_change:+.2f}, {kospi_change_rate:+.2f}%)
-- 코스닥: {kosdaq:,.2f} ({kosdaq_change:+.2f}, {kosdaq_change_rate:+.2f}%)
-
-## 투자 코멘트
-
-{llm_comment}
-
----
-이 알림은 Stock Alarm 서비스에서 발송되었습니다.
-설정 변경: {settings_url}
-"""
-
-    try:
-        msg = MIMEMultipart()
-        msg["From"] = formataddr((mail_from_name, mail_from_address))
-        msg["To"] = email
-        msg["Subject"] = subject
-        msg.attach(MIMEText(body, "plain", "utf-8"))
-
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(gmail_address, gmail_password)
-            server.sendmail(mail_from_address, email, msg.as_string())
-
-        current_app.logger.info(
-            f"[알림 이메일] 발송 성공: {email}, 종목: {stock_name}({stock_code})"
-        )
-        return True
-
-    except Exception as e:
-        current_app.logger.error(
-            f"[알림 이메일] 발송 실패: {email}, 종목: {stock_name}({stock_code}), 오류: {e}"
-        )
-        return False
+    return send_alert_emails_batch(
+        [
+            {
+                "email": email,
+                "stock_name": stock_name,
+                "stock_code": stock_code,
+                "base_price": base_price,
+                "current_price": current_price,
+                "change_rate": change_rate,
+                "threshold_type": threshold_type,
+                "threshold_value": threshold_value,
+                "market_summary": market_summary,
+                "llm_comment": llm_comment,
+                "settings_url": settings_url,
+            }
+        ]
+    )[0]
@@ -0,0 +1,48 @@
+"""이메일 백그라운드 발송 큐
+
+SMTP 왕복(TLS 핸드셰이크 + 로그인 + 전송)을 요청 처리 스레드에서 분리해
+HTTP 응답이 메일 발송을 기다리지 않도록 한다.
+프로세스 메모리 큐이므로 서버 재시작 시 대기 중인 메일은 유실될 수 있다.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from flask import current_app
+
+MAIL_QUEUE_WORKERS = 4
+
+mail_executor = ThreadPoolExecutor(
+    max_workers=MAIL_QUEUE_WORKERS, thread_name_prefix="mail"
+)
+
+
+def submit_mail(func, *args, **kwargs) -> Future:
+    """
+    메일 발송 함수를 백그라운드 스레드에서 실행
+
+    워커 스레드에서도 current_app 설정/로거를 사용할 수 있도록
+    현재 앱 컨텍스트를 넘겨준다. MAIL_BACKGROUND가 False면 즉시 실행한다.
+
+    Args:
+        func: 메일 발송 함수 (send_welcome_email 등)
+        *args, **kwargs: func 인자
+
+    Returns:
+        Future: func 반환값(발송 성공 여부)을 담은 Future
+    """
+    app = current_app._get_current_object()
+
+    def run():
+        with app.app_context():
+            return func(*args, **kwargs)
+
+    if not app.config.get("MAIL_BACKGROUND", True):
+        # 백그라운드 모드와 동일하게 예외는 Future에 담아 반환
+        future = Future()
+        try:
+            future.set_result(run())
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    return mail_executor.submit(run)
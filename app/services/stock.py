@@ -5,19 +5,152 @@
 - 네이버 금융 API: 실시간 현재가/시장 지수 조회
 """
 
-import json
-import re
-from datetime import date, timedelta
+import logging
+import os
+import threading
+import time
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import orjson
 import requests
 from flask import current_app
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# FinanceDataReader/pandas는 무거우므로 모듈 최상단에서 import하지 않는다.
+# 현재가/종목 검증 등 웹 요청 경로는 사용하지 않으므로 필요한 함수 안에서만 import
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경 - 워커 간 잠금 없이 동작
+    fcntl = None
+
+# 종목코드 길이 (6자리 숫자)
+STOCK_CODE_LENGTH = 6
+
+# 네이버 금융 API 타임아웃 (연결, 읽기) 초
+# 웹 요청 경로는 느린 응답이 요청 스레드를 오래 잡지 않도록 읽기 타임아웃을 짧게 둔다.
+NAVER_API_TIMEOUT = (3, 3)
+# cron 배치(scripts/check_alert.py)는 응답을 기다릴 여유가 있음
+NAVER_API_BATCH_TIMEOUT = (3, 5)
+
+# 시장 지수 API (KOSPI, KOSDAQ 순)
+MARKET_INDEX_URLS = (
+    "https://m.stock.naver.com/api/index/KOSPI/basic",
+    "https://m.stock.naver.com/api/index/KOSDAQ/basic",
+)
+
+# 현재가 일괄 조회 시 최대 동시 요청 수 (네이버 API 차단 방지를 위해 10 이하 유지)
+MAX_PRICE_WORKERS = 8
+
+# 네이버 API 재시도 설정 (urllib3 지수 백오프 + 지터)
+NAVER_API_MAX_RETRIES = 1  # 웹 요청: 종목당 최대 2회 시도
+NAVER_API_BATCH_MAX_RETRIES = 3  # cron 배치: Retry-After 헤더도 따름
+NAVER_API_BACKOFF_FACTOR = 0.5  # 0.5초 → 1초 → 2초
+NAVER_API_BACKOFF_JITTER = 0.5  # 최대 0.5초 무작위 추가
+NAVER_API_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# FinanceDataReader 종목 리스트 로드 실패 후 재시도 간격 (초)
+STOCK_LIST_RETRY_INTERVAL = 600
+
+# 워커 스레드(앱 컨텍스트 없음)에서도 기록되도록 앱 로거("app")의 하위 로거 사용
+logger = logging.getLogger(__name__)
+
+
+class _LoggingRetry(Retry):
+    """재시도할 때마다 WARNING 로그를 남기는 urllib3 Retry"""
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        new_retry = super().increment(method, url, *args, **kwargs)
+        response = kwargs.get("response")
+        reason = response.status if response is not None else kwargs.get("error")
+        attempts = len(new_retry.history)
+        logger.warning(
+            "[네이버 API] 재시도 %d/%d: %s (%s)",
+            attempts,
+            attempts + new_retry.total,
+            url,
+            reason,
+        )
+        return new_retry
+
+
+def _create_retry(total: int, respect_retry_after: bool) -> Retry:
+    """네이버 API 재시도 정책 생성"""
+    return _LoggingRetry(
+        total=total,
+        backoff_factor=NAVER_API_BACKOFF_FACTOR,
+        backoff_jitter=NAVER_API_BACKOFF_JITTER,
+        status_forcelist=NAVER_API_RETRY_STATUSES,
+        allowed_methods=("GET",),
+        respect_retry_after_header=respect_retry_after,
+        raise_on_status=False,
+    )
+
+
+# 웹 요청용: Retry-After 대기(수십 초일 수 있음) 없이 1회만 재시도
+NAVER_API_RETRY = _create_retry(NAVER_API_MAX_RETRIES, respect_retry_after=False)
+NAVER_API_BATCH_RETRY = _create_retry(
+    NAVER_API_BATCH_MAX_RETRIES, respect_retry_after=True
+)
+
+# 현재가 메모리 캐시 설정
+STOCK_PRICE_CACHE_TTL = 15  # 초
+STOCK_PRICE_CACHE_MAXSIZE = 4096
+
+# 시장 지수 메모리 캐시 설정
+MARKET_SUMMARY_CACHE_TTL = 60  # 초
+
+
+def _create_session(retry: Retry) -> requests.Session:
+    """네이버 API용 세션 생성 (keep-alive 연결 풀 재사용)"""
+    session = requests.Session()
+    session.headers["User-Agent"] = "stock-alarm"
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_PRICE_WORKERS,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
-# 종목코드 정규식 (6자리 숫자)
-STOCK_CODE_REGEX = r"^\d{6}$"
+# 모듈 공용 세션 (요청마다 TCP/TLS 핸드셰이크 반복 방지)
+_session = _create_session(NAVER_API_RETRY)
+_batch_session = _create_session(NAVER_API_BATCH_RETRY)
+# True면 배치용 세션/타임아웃 사용 (use_batch_naver_session()으로 전환)
+_batch_mode = False
 
-# 네이버 금융 API 타임아웃 (초)
-NAVER_API_TIMEOUT = 5
+
+def use_batch_naver_session() -> None:
+    """
+    이후 네이버 API 호출에 배치용 재시도 정책/타임아웃 사용
+
+    요청 스레드를 잡지 않는 cron 스크립트 전용 (프로세스 전역 설정).
+    """
+    global _batch_mode
+    _batch_mode = True
+
+
+def _get_json(url: str) -> dict:
+    """
+    네이버 API GET 요청 후 JSON 반환 (재시도는 세션 어댑터가 처리)
+
+    Raises:
+        requests.exceptions.RequestException: 재시도 후에도 실패한 경우
+        ValueError: JSON 파싱 실패
+    """
+    if _batch_mode:
+        response = _batch_session.get(url, timeout=NAVER_API_BATCH_TIMEOUT)
+    else:
+        response = _session.get(url, timeout=NAVER_API_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
 
 
 def is_valid_stock_code_format(stock_code: str) -> bool:
@@ -32,12 +165,18 @@ def is_valid_stock_code_format(stock_code: str) -> bool:
     """
     if not stock_code:
         return False
-    return bool(re.match(STOCK_CODE_REGEX, stock_code.strip()))
+    code = stock_code.strip()
+    # 정규식 대신 str 메서드로 검사 (isascii: 전각/아랍 숫자 등 유니코드 숫자 제외)
+    return len(code) == STOCK_CODE_LENGTH and code.isascii() and code.isdigit()
 
 
 # 종목 리스트 메모리 캐시
 _stock_list_cache: list[dict] | None = None
 _stock_list_cache_date: str | None = None
+# FDR 로드 실패 시 다음 재시도 가능 시각 (time.monotonic 기준)
+_stock_list_retry_at = 0.0
+# 동시 요청/워밍 스레드가 같은 목록을 중복 로드하지 않도록 직렬화
+_stock_list_lock = threading.Lock()
 
 
 def _get_stock_list() -> list[dict]:
@@ -46,68 +185,238 @@ def _get_stock_list() -> list[dict]:
 
     우선순위:
         1. 메모리 캐시 (같은 날짜)
-        2. JSON 파일 (data/stock_list.json)
-        3. FinanceDataReader 실시간 로드 (fallback)
+        2. 오늘 저장된 JSON 파일 (data/stock_list.json, cron 또는 다른 워커가 저장)
+        3. FinanceDataReader 실시간 로드 후 JSON 파일 저장 (fallback, 워커 간 1회)
+
+    새로 로드하지 못하면 이전에 로드한 목록(날짜 지남)을 그대로 사용한다.
+    FinanceDataReader 조회가 실패하면 STOCK_LIST_RETRY_INTERVAL 동안은 다시 조회하지 않는다.
 
     Returns:
         list[dict]: 종목 리스트 [{"code": "005930", "name": "삼성전자", "market": "KOSPI"}, ...]
     """
-    global _stock_list_cache, _stock_list_cache_date
-
     today = str(date.today())
     if _stock_list_cache is not None and _stock_list_cache_date == today:
         return _stock_list_cache
 
-    # 1순위: JSON 파일에서 로드
-    cache_path = Path(current_app.root_path).parent / "data" / "stock_list.json"
-    if cache_path.exists():
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                _stock_list_cache = json.load(f)
-            _stock_list_cache_date = today
-            current_app.logger.info(
-                f"종목 리스트 로드 완료 (JSON 파일): {len(_stock_list_cache)}개"
-            )
+    with _stock_list_lock:
+        # 대기 중 다른 스레드가 로드를 마쳤으면 그 결과 사용
+        if _stock_list_cache is not None and _stock_list_cache_date == today:
             return _stock_list_cache
-        except Exception as e:
-            current_app.logger.error(f"종목 리스트 JSON 파일 로드 실패: {e}")
+        return _load_stock_list(today)
+
+
+def fetch_stock_list() -> list[dict]:
+    """
+    FinanceDataReader에서 KOSPI/KOSDAQ/ETF 종목 리스트 조회
+
+    Returns:
+        list[dict]: [{"code": "005930", "name": "삼성전자", "market": "KOSPI"}, ...]
+
+    Raises:
+        Exception: FinanceDataReader 조회 실패
+    """
+    import FinanceDataReader as fdr
+
+    kospi = fdr.StockListing("KOSPI")
+    kosdaq = fdr.StockListing("KOSDAQ")
+    etf = fdr.StockListing("ETF/KR")
+    etf = etf.rename(columns={"Symbol": "Code"})
+
+    stocks = []
+    seen_codes = set()
+    for df, market in [(kospi, "KOSPI"), (kosdaq, "KOSDAQ"), (etf, "ETF")]:
+        # 행마다 Series를 만드는 iterrows 대신 컬럼 단위로 문자열 변환 후 순회
+        codes = df["Code"].astype(str).str.strip().tolist()
+        names = df["Name"].astype(str).str.strip().tolist()
+        for code, name in zip(codes, names):
+            if code and code not in seen_codes:
+                seen_codes.add(code)
+                stocks.append({"code": code, "name": name, "market": market})
+    return stocks
+
+
+def save_stock_list(stocks: list[dict], path: Path) -> None:
+    """
+    종목 리스트를 JSON 파일로 저장
+
+    임시 파일에 쓴 뒤 교체하므로 다른 워커가 쓰는 도중의 파일을 읽지 않는다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(orjson.dumps(stocks))
+    os.replace(tmp_path, path)
+
+
+def _stock_list_path() -> Path:
+    """종목 리스트 JSON 파일 경로 (scripts/update_stock_list.py와 공유)"""
+    return Path(current_app.root_path).parent / "data" / "stock_list.json"
 
-    # 2순위 (fallback): FinanceDataReader에서 실시간 로드
-    current_app.logger.info("종목 리스트 JSON 파일 없음, FinanceDataReader로 로드 시작")
+
+@contextmanager
+def _file_lock(path: Path):
+    """프로세스(gunicorn 워커) 간 배타 잠금"""
+    if fcntl is None:
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _read_stock_list_json(path: Path) -> list[dict] | None:
+    """종목 리스트 JSON 파일 파싱 (orjson으로 바이트를 바로 파싱, 실패 시 None)"""
     try:
-        import FinanceDataReader as fdr
-
-        import pandas as pd
-
-        kospi = fdr.StockListing("KOSPI")
-        kosdaq = fdr.StockListing("KOSDAQ")
-        etf = fdr.StockListing("ETF/KR")
-        etf = etf.rename(columns={"Symbol": "Code"})
-
-        stocks = []
-        seen_codes = set()
-        for df, market in [(kospi, "KOSPI"), (kosdaq, "KOSDAQ"), (etf, "ETF")]:
-            for _, row in df.iterrows():
-                code = str(row["Code"]).strip()
-                if code and code not in seen_codes:
-                    seen_codes.add(code)
-                    stocks.append(
-                        {
-                            "code": code,
-                            "name": str(row["Name"]).strip(),
-                            "market": market,
-                        }
-                    )
+        return orjson.loads(path.read_bytes())
+    except Exception as e:
+        current_app.logger.error(f"종목 리스트 JSON 파일 로드 실패: {e}")
+        return None
+
 
+def _read_stock_list_file(path: Path, today: str) -> list[dict] | None:
+    """오늘 저장된 종목 리스트 JSON 파일 로드 (없거나 날짜가 지났거나 실패 시 None)"""
+    try:
+        modified = datetime.fromtimestamp(path.stat().st_mtime).date()
+    except OSError:
+        return None
+    if str(modified) != today:
+        return None
+
+    stocks = _read_stock_list_json(path)
+    if stocks is None:
+        return None
+
+    current_app.logger.info(f"종목 리스트 로드 완료 (JSON 파일): {len(stocks)}개")
+    return stocks
+
+
+def _load_stock_list(today: str) -> list[dict]:
+    """종목 리스트를 JSON 파일 또는 FinanceDataReader에서 로드 (_stock_list_lock 보유 상태에서 호출)"""
+    global _stock_list_cache, _stock_list_cache_date, _stock_list_retry_at
+
+    # 1순위: 오늘 저장된 JSON 파일 (cron 또는 다른 워커가 저장)
+    cache_path = _stock_list_path()
+    stocks = _read_stock_list_file(cache_path, today)
+
+    # 2순위 (fallback): FinanceDataReader - 워커 중 하나만 조회하고 파일로 공유
+    # 직전 조회가 실패했으면 재시도 간격이 지날 때까지 이전 목록으로 응답
+    if stocks is None and time.monotonic() >= _stock_list_retry_at:
+        with _file_lock(cache_path.with_suffix(".lock")):
+            # 잠금 대기 중 다른 워커가 저장했으면 그 파일 사용
+            stocks = _read_stock_list_file(cache_path, today)
+            if stocks is None:
+                stocks = _fetch_and_save_stock_list(cache_path)
+                if stocks is None:
+                    _stock_list_retry_at = time.monotonic() + STOCK_LIST_RETRY_INTERVAL
+
+    if stocks is None:
+        # 날짜 지난 목록이라도 빈 목록보다 나음 (메모리 → 파일 순)
+        stocks = _stock_list_cache
+        if stocks is None and cache_path.exists():
+            stocks = _read_stock_list_json(cache_path)
+        if stocks is None:
+            return []
+        current_app.logger.warning(f"이전 종목 리스트 사용: {len(stocks)}개")
+        # 재시도 간격 동안 파일을 다시 읽지 않도록 메모리에 유지 (날짜는 갱신하지 않음)
         _stock_list_cache = stocks
-        _stock_list_cache_date = today
-        current_app.logger.info(
-            f"종목 리스트 로드 완료 (FinanceDataReader): {len(stocks)}개"
-        )
-        return _stock_list_cache
+        return stocks
+
+    _stock_list_cache = stocks
+    _stock_list_cache_date = today
+    return _stock_list_cache
+
+
+def _fetch_and_save_stock_list(cache_path: Path) -> list[dict] | None:
+    """FinanceDataReader로 종목 리스트를 조회해 JSON 파일로 저장 (실패 시 None)"""
+    current_app.logger.info(
+        "오늘 종목 리스트 JSON 파일 없음, FinanceDataReader로 로드 시작"
+    )
+    try:
+        stocks = fetch_stock_list()
     except Exception as e:
         current_app.logger.error(f"종목 리스트 로드 실패: {e}")
-        return []
+        return None
+
+    current_app.logger.info(
+        f"종목 리스트 로드 완료 (FinanceDataReader): {len(stocks)}개"
+    )
+    try:
+        save_stock_list(stocks, cache_path)
+    except OSError as e:
+        current_app.logger.warning(f"종목 리스트 JSON 파일 저장 실패: {e}")
+    return stocks
+
+
+def warm_stock_list(app) -> threading.Thread:
+    """
+    백그라운드 스레드에서 종목 리스트 캐시를 미리 로드
+
+    첫 종목 검색/추가 요청이 종목 리스트 로드(수 초)를 기다리지 않도록
+    앱 생성 직후(gunicorn 워커 fork 이후) 호출한다.
+
+    Args:
+        app: Flask 앱 인스턴스
+
+    Returns:
+        threading.Thread: 시작된 데몬 스레드
+    """
+
+    def run():
+        with app.app_context():
+            try:
+                _get_stock_list()
+            except Exception as e:
+                app.logger.warning(f"종목 리스트 워밍 실패: {e}")
+
+    thread = threading.Thread(target=run, name="stock-list-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+# 종목코드 → 종목 dict 인덱스 (종목 리스트가 교체되면 재생성)
+_stock_index: dict[str, dict] = {}
+_stock_index_source: list[dict] | None = None
+
+
+def _get_stock_index() -> dict[str, dict]:
+    """
+    종목코드로 O(1) 조회하기 위한 인덱스 반환
+
+    Returns:
+        dict[str, dict]: {종목코드: {"code", "name", "market"}}
+    """
+    global _stock_index, _stock_index_source
+
+    stocks = _get_stock_list()
+    if stocks is not _stock_index_source:
+        _stock_index = {s["code"]: s for s in stocks}
+        _stock_index_source = stocks
+    return _stock_index
+
+
+# 검색용 인덱스 [(소문자 종목코드, 소문자 종목명, 종목 dict)] (종목 리스트가 교체되면 재생성)
+_search_index: list[tuple[str, str, dict]] = []
+_search_index_source: list[dict] | None = None
+
+
+def _get_search_index() -> list[tuple[str, str, dict]]:
+    """
+    검색어 비교용으로 소문자 변환을 미리 해둔 종목 목록 반환
+
+    Returns:
+        list[tuple[str, str, dict]]: [(code_lower, name_lower, 종목 dict)] (원래 순서 유지)
+    """
+    global _search_index, _search_index_source
+
+    stocks = _get_stock_list()
+    if stocks is not _search_index_source:
+        _search_index = [(s["code"].lower(), s["name"].lower(), s) for s in stocks]
+        _search_index_source = stocks
+    return _search_index
 
 
 def validate_stock_code(stock_code: str) -> bool:
@@ -124,18 +433,33 @@ def validate_stock_code(stock_code: str) -> bool:
         current_app.logger.debug(f"종목코드 형식 오류: {stock_code}")
         return False
 
-    stocks = _get_stock_list()
-    if not stocks:
+    index = _get_stock_index()
+    if not index:
         current_app.logger.warning("종목 리스트가 비어있음")
         return False
 
-    is_valid = any(s["code"] == stock_code.strip() for s in stocks)
+    is_valid = stock_code.strip() in index
     current_app.logger.debug(
         f"종목코드 검증: {stock_code} -> {'유효' if is_valid else '무효'}"
     )
     return is_valid
 
 
+def find_stock(stock_code: str) -> dict | None:
+    """
+    종목코드로 종목 조회 (형식 검증 + 존재 여부 + 종목명을 한 번에)
+
+    Args:
+        stock_code: 종목코드 (예: "005930")
+
+    Returns:
+        dict | None: {"code", "name", "market"} 또는 None (형식 오류/미존재)
+    """
+    if not is_valid_stock_code_format(stock_code):
+        return None
+    return _get_stock_index().get(stock_code.strip())
+
+
 def search_stock(query: str, limit: int = 10) -> list[dict]:
     """
     종목 검색 (종목코드 또는 종목명으로 검색)
@@ -151,17 +475,15 @@ def search_stock(query: str, limit: int = 10) -> list[dict]:
     if not query:
         return []
 
-    stocks = _get_stock_list()
-    if not stocks:
+    index = _get_search_index()
+    if not index:
         return []
 
     query = query.strip().lower()
 
-    results = [
-        s for s in stocks if query in s["code"].lower() or query in s["name"].lower()
-    ][:limit]
-
-    return results
+    # 종목별 소문자 변환은 인덱스 생성 시 1회, limit개를 찾으면 즉시 중단
+    matches = (stock for code, name, stock in index if query in code or query in name)
+    return list(islice(matches, limit))
 
 
 def get_stock_name(stock_code: str) -> str | None:
@@ -174,47 +496,80 @@ def get_stock_name(stock_code: str) -> str | None:
     Returns:
         str | None: 종목명 또는 None
     """
-    stocks = _get_stock_list()
-    if not stocks:
-        return None
+    stock_data = _get_stock_index().get(stock_code.strip())
+    return stock_data["name"] if stock_data else None
 
-    code = stock_code.strip()
-    for s in stocks:
-        if s["code"] == code:
-            return s["name"]
 
-    return None
+# 현재가 메모리 캐시 {종목코드: (만료 시각, 현재가)}
+_stock_price_cache: dict[str, tuple[float, float]] = {}
+_stock_price_cache_lock = threading.Lock()
+
+
+def _get_cached_price(stock_code: str) -> float | None:
+    """TTL 이내의 캐시된 현재가 반환 (없거나 만료 시 None)"""
+    with _stock_price_cache_lock:
+        entry = _stock_price_cache.get(stock_code)
+        if entry is None:
+            return None
+        expires_at, price = entry
+        if expires_at <= time.monotonic():
+            del _stock_price_cache[stock_code]
+            return None
+        return price
+
+
+def _set_cached_price(stock_code: str, price: float) -> None:
+    """현재가 캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+    with _stock_price_cache_lock:
+        if (
+            stock_code not in _stock_price_cache
+            and len(_stock_price_cache) >= STOCK_PRICE_CACHE_MAXSIZE
+        ):
+            del _stock_price_cache[next(iter(_stock_price_cache))]
+        _stock_price_cache[stock_code] = (
+            time.monotonic() + STOCK_PRICE_CACHE_TTL,
+            price,
+        )
+
+
+def clear_stock_price_cache() -> None:
+    """현재가 캐시 초기화"""
+    with _stock_price_cache_lock:
+        _stock_price_cache.clear()
 
 
 def get_stock_price(stock_code: str) -> float | None:
     """
     종목의 실시간 현재가 조회 (네이버 금융 API)
 
+    같은 종목은 STOCK_PRICE_CACHE_TTL 동안 메모리 캐시에서 반환한다.
+
     Args:
         stock_code: 종목코드 (예: "005930")
 
     Returns:
         float | None: 현재가 또는 None (조회 실패 시)
     """
+    cached_price = _get_cached_price(stock_code)
+    if cached_price is not None:
+        current_app.logger.debug(f"[현재가 캐시] 적중: {stock_code}")
+        return cached_price
+
     url = f"https://m.stock.naver.com/api/stock/{stock_code}/basic"
 
     current_app.logger.debug(f"[네이버 API] 현재가 조회 요청: {stock_code}")
 
     try:
-        response = requests.get(url, timeout=NAVER_API_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json(url)
 
         # 현재가 추출 (closePrice 사용, 쉼표 제거)
         close_price = data.get("closePrice")
         if close_price is not None:
-            # 문자열인 경우 쉼표 제거 후 변환
-            if isinstance(close_price, str):
-                close_price = close_price.replace(",", "")
-            price = float(close_price)
+            price = _parse_price(close_price)
             current_app.logger.debug(
                 f"[네이버 API] 현재가 조회 성공: {stock_code} -> {price:,.0f}원"
             )
+            _set_cached_price(stock_code, price)
             return price
 
         current_app.logger.warning(f"현재가 없음: {stock_code}, 응답: {data}")
@@ -228,6 +583,40 @@ def get_stock_price(stock_code: str) -> float | None:
         return None
 
 
+def get_stock_prices(stock_codes: list[str]) -> dict[str, float | None]:
+    """
+    여러 종목의 현재가 일괄 조회 (네이버 금융 API 동시 요청)
+
+    Args:
+        stock_codes: 종목코드 목록 (중복 허용)
+
+    Returns:
+        dict[str, float | None]: {종목코드: 현재가} (조회 실패 시 None)
+    """
+    codes = list(dict.fromkeys(code.strip() for code in stock_codes))
+    if not codes:
+        return {}
+    if len(codes) == 1:
+        return {codes[0]: get_stock_price(codes[0])}
+
+    app = current_app._get_current_object()
+
+    def fetch(code: str) -> float | None:
+        # 작업 스레드에는 앱 컨텍스트가 없으므로 직접 push
+        with app.app_context():
+            try:
+                return get_stock_price(code)
+            except Exception as e:
+                app.logger.warning(f"현재가 조회 실패: {code}, {e}")
+                return None
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PRICE_WORKERS, len(codes))) as executor:
+        prices = list(executor.map(fetch, codes))
+
+    current_app.logger.debug(f"[네이버 API] 현재가 일괄 조회: {len(codes)}개 종목")
+    return dict(zip(codes, prices))
+
+
 def get_stock_info(stock_code: str) -> dict | None:
     """
     종목 정보 조회 (종목명 + 현재가)
@@ -245,17 +634,8 @@ def get_stock_info(stock_code: str) -> dict | None:
             }
     """
     # 1. 종목명, 시장 조회 (캐시된 리스트)
-    stocks = _get_stock_list()
-    if not stocks:
-        return None
-
     code = stock_code.strip()
-    stock_data = None
-    for s in stocks:
-        if s["code"] == code:
-            stock_data = s
-            break
-
+    stock_data = _get_stock_index().get(code)
     if stock_data is None:
         return None
 
@@ -299,18 +679,12 @@ def get_stock_history(stock_code: str, days: int = 90) -> list[dict] | None:
             current_app.logger.warning(f"[FDR] 데이터 없음: {stock_code}")
             return None
 
-        result = []
-        for idx, row in df.iterrows():
-            result.append(
-                {
-                    "date": idx.strftime("%Y-%m-%d"),
-                    "open": float(row["Open"]),
-                    "high": float(row["High"]),
-                    "low": float(row["Low"]),
-                    "close": float(row["Close"]),
-                    "volume": int(row["Volume"]),
-                }
-            )
+        # 행마다 Series를 만드는 iterrows 대신 컬럼 단위로 변환 후 한 번에 레코드화
+        history = df[["Open", "High", "Low", "Close"]].astype(float)
+        history.columns = ["open", "high", "low", "close"]
+        history["volume"] = df["Volume"].astype(int)
+        history.insert(0, "date", df.index.strftime("%Y-%m-%d"))
+        result = history.to_dict("records")
 
         current_app.logger.info(
             f"[FDR] 과거 가격 조회 성공: {stock_code}, {len(result)}건"
@@ -322,18 +696,34 @@ def get_stock_history(stock_code: str, days: int = 90) -> list[dict] | None:
 
 
 def _parse_price(value) -> float:
-    """가격 문자열을 float으로 변환 (쉼표 제거)"""
+    """가격(숫자 또는 쉼표 포함 문자열)을 float으로 변환 (None이면 0.0)"""
     if value is None:
         return 0.0
-    if isinstance(value, str):
-        return float(value.replace(",", ""))
-    return float(value)
+    try:
+        # 숫자 또는 쉼표 없는 문자열은 바로 변환
+        return float(value)
+    except (TypeError, ValueError):
+        return float(str(value).replace(",", ""))
+
+
+# 시장 지수 메모리 캐시 (만료 시각, 지수 정보)
+_market_summary_cache: tuple[float, dict] | None = None
+_market_summary_cache_lock = threading.Lock()
+
+
+def clear_market_summary_cache() -> None:
+    """시장 지수 캐시 초기화"""
+    global _market_summary_cache
+    with _market_summary_cache_lock:
+        _market_summary_cache = None
 
 
 def get_market_summary() -> dict | None:
     """
     시장 지수 요약 조회 (실시간)
 
+    조회 성공 결과는 MARKET_SUMMARY_CACHE_TTL 동안 메모리 캐시에서 반환한다.
+
     Returns:
         dict | None: 시장 지수 정보 또는 None
             {
@@ -345,20 +735,20 @@ def get_market_summary() -> dict | None:
                 "kosdaq_change_rate": -0.38
             }
     """
-    current_app.logger.debug("[네이버 API] 시장 지수 조회 요청")
+    global _market_summary_cache
 
-    try:
-        kospi_url = "https://m.stock.naver.com/api/index/KOSPI/basic"
-        kosdaq_url = "https://m.stock.naver.com/api/index/KOSDAQ/basic"
+    with _market_summary_cache_lock:
+        entry = _market_summary_cache
+    if entry is not None and entry[0] > time.monotonic():
+        current_app.logger.debug("[시장 지수 캐시] 적중")
+        return dict(entry[1])
 
-        kospi_resp = requests.get(kospi_url, timeout=NAVER_API_TIMEOUT)
-        kosdaq_resp = requests.get(kosdaq_url, timeout=NAVER_API_TIMEOUT)
-
-        kospi_resp.raise_for_status()
-        kosdaq_resp.raise_for_status()
+    current_app.logger.debug("[네이버 API] 시장 지수 조회 요청")
 
-        kospi_data = kospi_resp.json()
-        kosdaq_data = kosdaq_resp.json()
+    try:
+        # KOSPI/KOSDAQ 동시 요청 (대기 시간 ≈ 두 요청 중 느린 쪽)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kospi_data, kosdaq_data = executor.map(_get_json, MARKET_INDEX_URLS)
 
         result = {
             "kospi": _parse_price(kospi_data.get("closePrice")),
@@ -375,6 +765,11 @@ def get_market_summary() -> dict | None:
             f"[네이버 API] 시장 지수 조회 성공 - "
             f"KOSPI: {result['kospi']:,.2f}, KOSDAQ: {result['kosdaq']:,.2f}"
         )
+        with _market_summary_cache_lock:
+            _market_summary_cache = (
+                time.monotonic() + MARKET_SUMMARY_CACHE_TTL,
+                dict(result),
+            )
         return result
 
     except requests.exceptions.RequestException as e:
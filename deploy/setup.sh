@@ -29,6 +29,10 @@ mkdir -p logs data
 echo "[2/7] Python 의존성 설치..."
 uv sync
 
+# DB 테이블 생성 및 기존 DB에 신규 인덱스 반영
+uv run flask --app run init-db
+uv run python scripts/migrate_indexes.py
+
 # 4. .env 파일 확인
 if [ ! -f ".env" ]; then
     echo "[WARNING] .env 파일이 없습니다."
@@ -12,22 +12,47 @@ cron 설정 예시:
 """
 
 import sys
-from datetime import datetime
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
+from sqlalchemy.orm import joinedload
+
 from app import create_app, db
 from app.config import Config
 from app.models import Alert, AlertLog
-from app.services.stock import get_stock_price, get_market_summary
-from app.services.llm import generate_alert_comment, get_fallback_comment
-from app.services.mail import send_alert_email
-
-
-def is_threshold_reached(alert: Alert, current_price: float) -> tuple[bool, str | None]:
+from app.services.stock import (
+    get_market_summary,
+    get_stock_price,
+    get_stock_prices,
+    use_batch_naver_session,
+)
+from app.services.llm import (
+    generate_alert_comment,
+    generate_alert_comments_batch,
+    get_fallback_comment,
+)
+from app.services.mail import send_alert_email, send_alert_emails_batch
+
+# 한 번에 조회/처리/커밋하는 활성 알림 수
+CHECK_BATCH_SIZE = 500
+
+# 시장 지수 조회 실패 시 기본값
+DEFAULT_MARKET_SUMMARY = {
+    "kospi": 0,
+    "kosdaq": 0,
+    "kospi_change": 0,
+    "kosdaq_change": 0,
+    "kospi_change_rate": 0,
+    "kosdaq_change_rate": 0,
+}
+
+
+def is_threshold_reached(
+    alert: Alert, current_price: float
+) -> tuple[bool, str | None, float]:
     """
     알림 기준 충족 여부 판단
 
@@ -36,71 +61,90 @@ def is_threshold_reached(alert: Alert, current_price: float) -> tuple[bool, str
         current_price: 현재가
 
     Returns:
-        tuple[bool, str | None]: (충족 여부, 기준 타입)
-            - (True, "upper"): 상승 기준 충족
-            - (True, "lower"): 하락 기준 충족
-            - (False, None): 기준 미충족
+        tuple[bool, str | None, float]: (충족 여부, 기준 타입, 변동률 %)
+            - (True, "upper", rate): 상승 기준 충족
+            - (True, "lower", rate): 하락 기준 충족
+            - (False, None, rate): 기준 미충족
     """
-    # 변동률 계산
+    # 변동률 계산 (호출 측에서 재계산하지 않도록 함께 반환)
     change_rate = (current_price - alert.base_price) / alert.base_price * 100
+    upper = alert.threshold_upper
+    lower = alert.threshold_lower
 
     # 상승 기준 체크
-    if alert.threshold_upper is not None:
-        if change_rate >= alert.threshold_upper:
-            return True, "upper"
+    if upper is not None and change_rate >= upper:
+        return True, "upper", change_rate
 
     # 하락 기준 체크 (threshold_lower는 음수로 저장됨)
-    if alert.threshold_lower is not None:
-        if change_rate <= alert.threshold_lower:
-            return True, "lower"
+    if lower is not None and change_rate <= lower:
+        return True, "lower", change_rate
 
-    return False, None
+    return False, None, change_rate
 
 
-def process_alert(alert: Alert, app) -> dict:
+def evaluate_alert(
+    alert: Alert,
+    app,
+    prices: dict | None = None,
+    market_summary: dict | None = None,
+    comments: dict | None = None,
+) -> dict:
     """
-    단일 알림 처리
+    단일 알림의 기준 충족 여부 판단 및 발송할 이메일 내용 준비
 
     Args:
         alert: Alert 모델 인스턴스
         app: Flask 앱 인스턴스
+        prices: 미리 일괄 조회한 {종목코드: 현재가} (없으면 개별 조회)
+        market_summary: 미리 조회한 시장 지수 (없으면 개별 조회)
+        comments: 미리 일괄 생성한 {alert_id: LLM 코멘트} (없으면 개별 생성)
 
     Returns:
-        dict: 처리 결과
+        dict: 판단 결과
             {
                 "status": "skipped" | "not_triggered" | "triggered",
-                "email_sent": bool | None,
-                "error": str | None
+                "error": str | None,
+                "current_price": float | None,
+                "change_rate": float | None,
+                "threshold_type": "upper" | "lower" | None,
+                "email": dict | None  # send_alert_email 인자 (triggered일 때)
             }
     """
-    result = {"status": "skipped", "email_sent": None, "error": None}
+    evaluation = {
+        "status": "skipped",
+        "error": None,
+        "current_price": None,
+        "change_rate": None,
+        "threshold_type": None,
+        "email": None,
+    }
 
     # 1. 현재가 조회
-    current_price = get_stock_price(alert.stock_code)
+    if prices is not None:
+        current_price = prices.get(alert.stock_code)
+    else:
+        current_price = get_stock_price(alert.stock_code)
     if current_price is None:
         app.logger.error(
             f"[알림 체크] 현재가 조회 실패: {alert.stock_name}({alert.stock_code})"
         )
-        result["error"] = "현재가 조회 실패"
-        return result
+        evaluation["error"] = "현재가 조회 실패"
+        return evaluation
 
     app.logger.debug(
         f"[알림 체크] 현재가 조회: {alert.stock_code} -> {current_price:,.0f}원"
     )
 
-    # 2. 변동률 계산
-    change_rate = (current_price - alert.base_price) / alert.base_price * 100
-
-    # 3. 기준 충족 판단
-    reached, threshold_type = is_threshold_reached(alert, current_price)
+    # 2~3. 변동률 계산 + 기준 충족 판단
+    reached, threshold_type, change_rate = is_threshold_reached(alert, current_price)
 
     if not reached:
-        result["status"] = "not_triggered"
+        evaluation["status"] = "not_triggered"
         app.logger.debug(
             f"[알림 체크] 기준 미충족: {alert.stock_name}({alert.stock_code}), "
             f"변동률: {change_rate:+.2f}%"
         )
-        return result
+        return evaluation
 
     # 기준 충족!
     threshold_value = (
@@ -112,84 +156,334 @@ def process_alert(alert: Alert, app) -> dict:
     )
 
     # 4. 시장 지수 조회
-    market_summary = get_market_summary()
+    if market_summary is None:
+        market_summary = get_market_summary()
     if market_summary is None:
         app.logger.warning("[알림 체크] 시장 지수 조회 실패, 기본값 사용")
-        market_summary = {
-            "kospi": 0,
-            "kosdaq": 0,
-            "kospi_change": 0,
-            "kosdaq_change": 0,
-            "kospi_change_rate": 0,
-            "kosdaq_change_rate": 0,
-        }
+        market_summary = DEFAULT_MARKET_SUMMARY
 
     # 5. LLM 코멘트 생성
-    llm_comment = generate_alert_comment(
-        stock_name=alert.stock_name,
-        stock_code=alert.stock_code,
-        change_rate=change_rate,
-        threshold_type=threshold_type,
-        market_summary=market_summary,
-    )
+    if comments is not None and alert.id in comments:
+        llm_comment = comments[alert.id]
+    else:
+        llm_comment = generate_alert_comment(
+            stock_name=alert.stock_name,
+            stock_code=alert.stock_code,
+            change_rate=change_rate,
+            threshold_type=threshold_type,
+            market_summary=market_summary,
+        )
     if llm_comment is None:
         app.logger.warning("[알림 체크] LLM 코멘트 생성 실패, 폴백 코멘트 사용")
         llm_comment = get_fallback_comment(
             alert.stock_name, change_rate, threshold_type
         )
 
-    # 6. 알림 이메일 발송
+    # 6. 알림 이메일 내용 준비
     # 설정 URL 생성
     base_url = app.config.get("BASE_URL", "https://stockalarm.co.kr")
     settings_url = f"{base_url}/settings/{alert.user.uuid}"
 
-    email_sent = send_alert_email(
-        email=alert.user.email,
-        stock_name=alert.stock_name,
-        stock_code=alert.stock_code,
-        base_price=alert.base_price,
+    evaluation.update(
+        status="triggered",
         current_price=current_price,
         change_rate=change_rate,
         threshold_type=threshold_type,
-        threshold_value=threshold_value,
-        market_summary=market_summary,
-        llm_comment=llm_comment,
-        settings_url=settings_url,
+        email={
+            "email": alert.user.email,
+            "stock_name": alert.stock_name,
+            "stock_code": alert.stock_code,
+            "base_price": alert.base_price,
+            "current_price": current_price,
+            "change_rate": change_rate,
+            "threshold_type": threshold_type,
+            "threshold_value": threshold_value,
+            "market_summary": market_summary,
+            "llm_comment": llm_comment,
+            "settings_url": settings_url,
+        },
     )
+    return evaluation
 
-    if email_sent:
-        app.logger.info(
-            f"[알림 체크] 이메일 발송 성공: {alert.user.email}, 종목: {alert.stock_name}"
-        )
-    else:
-        app.logger.error(
-            f"[알림 체크] 이메일 발송 실패: {alert.user.email}, 종목: {alert.stock_name}"
-        )
 
+def record_alert_trigger(alert: Alert, evaluation: dict) -> AlertLog:
+    """
+    기준 충족 알림의 AlertLog 기록 + 기준가 갱신 (커밋은 호출 측에서)
+
+    이메일 발송 전에 커밋해 두어야 발송 후 저장이 실패해도 다음 실행에서
+    같은 알림을 다시 보내지 않는다. 발송 결과는 mark_email_result()로 반영한다.
+
+    Args:
+        alert: Alert 모델 인스턴스
+        evaluation: evaluate_alert() 결과 (status == "triggered")
+
+    Returns:
+        AlertLog: 추가된 발송 이력 (email_sent=False)
+    """
     # 7. AlertLog 기록
     alert_log = AlertLog(
         alert_id=alert.id,
         user_id=alert.user_id,
         stock_code=alert.stock_code,
         base_price=alert.base_price,
-        current_price=current_price,
-        change_rate=change_rate,
-        threshold_type=threshold_type,
-        email_sent=email_sent,
-        sent_at=datetime.utcnow(),
+        current_price=evaluation["current_price"],
+        change_rate=evaluation["change_rate"],
+        threshold_type=evaluation["threshold_type"],
+        email_sent=False,
     )
     db.session.add(alert_log)
 
     # 8. Alert 업데이트: base_price를 현재가로 갱신, status는 active 유지
-    alert.base_price = current_price
+    alert.base_price = evaluation["current_price"]
+    return alert_log
+
 
-    db.session.commit()
+def mark_email_result(alert_log: AlertLog, app, email: dict, email_sent: bool) -> None:
+    """
+    이메일 발송 결과를 AlertLog에 반영 (커밋은 호출 측에서)
+
+    Args:
+        alert_log: record_alert_trigger()가 추가한 AlertLog
+        app: Flask 앱 인스턴스
+        email: 발송한 send_alert_email 인자
+        email_sent: 이메일 발송 성공 여부
+    """
+    alert_log.email_sent = email_sent
+    if email_sent:
+        app.logger.info(
+            f"[알림 체크] 이메일 발송 성공: {email['email']}, 종목: {email['stock_name']}"
+        )
+    else:
+        app.logger.error(
+            f"[알림 체크] 이메일 발송 실패: {email['email']}, 종목: {email['stock_name']}"
+        )
+
+
+def process_alert(
+    alert: Alert,
+    app,
+    prices: dict | None = None,
+    market_summary: dict | None = None,
+    comments: dict | None = None,
+    commit: bool = True,
+) -> dict:
+    """
+    단일 알림 처리 (판단 → 기록 → 이메일 발송 → 발송 결과 기록)
+
+    Args:
+        alert: Alert 모델 인스턴스
+        app: Flask 앱 인스턴스
+        prices: 미리 일괄 조회한 {종목코드: 현재가} (없으면 개별 조회)
+        market_summary: 미리 조회한 시장 지수 (없으면 개별 조회)
+        comments: 미리 일괄 생성한 {alert_id: LLM 코멘트} (없으면 개별 생성)
+        commit: False면 AlertLog/기준가 변경을 세션에만 반영 (호출 측에서 일괄 커밋)
+
+    Returns:
+        dict: 처리 결과
+            {
+                "status": "skipped" | "not_triggered" | "triggered",
+                "email_sent": bool | None,
+                "error": str | None
+            }
+    """
+    evaluation = evaluate_alert(alert, app, prices, market_summary, comments)
+    result = {
+        "status": evaluation["status"],
+        "email_sent": None,
+        "error": evaluation["error"],
+    }
+    if evaluation["status"] != "triggered":
+        return result
+
+    alert_log = record_alert_trigger(alert, evaluation)
+    if commit:
+        # 발송 전에 기준가 갱신을 저장 (발송 후 저장 실패로 인한 중복 발송 방지)
+        db.session.commit()
+
+    email_sent = send_alert_email(**evaluation["email"])
+    mark_email_result(alert_log, app, evaluation["email"], email_sent)
+
+    if commit:
+        db.session.commit()
 
-    result["status"] = "triggered"
     result["email_sent"] = email_sent
     return result
 
 
+def prepare_comments(
+    alerts: list[Alert], prices: dict, app
+) -> tuple[dict | None, dict[int, str | None]]:
+    """
+    기준을 충족한 알림들의 LLM 코멘트를 동시에 미리 생성
+
+    Args:
+        alerts: 활성 Alert 목록
+        prices: {종목코드: 현재가}
+        app: Flask 앱 인스턴스
+
+    Returns:
+        tuple[dict | None, dict[int, str | None]]:
+            (시장 지수, {alert_id: 코멘트}) - 충족 알림이 없으면 (None, {})
+    """
+    triggered = []
+    for alert in alerts:
+        current_price = prices.get(alert.stock_code)
+        if current_price is None:
+            continue
+        reached, threshold_type, change_rate = is_threshold_reached(
+            alert, current_price
+        )
+        if reached:
+            triggered.append((alert, change_rate, threshold_type))
+
+    if not triggered:
+        return None, {}
+
+    market_summary = get_market_summary()
+    if market_summary is None:
+        app.logger.warning("[알림 체크] 시장 지수 조회 실패, 기본값 사용")
+        market_summary = DEFAULT_MARKET_SUMMARY
+
+    llm_comments = generate_alert_comments_batch(
+        [
+            {
+                "stock_name": alert.stock_name,
+                "stock_code": alert.stock_code,
+                "change_rate": change_rate,
+                "threshold_type": threshold_type,
+                "market_summary": market_summary,
+            }
+            for alert, change_rate, threshold_type in triggered
+        ]
+    )
+    comments = {
+        alert.id: comment for (alert, _, _), comment in zip(triggered, llm_comments)
+    }
+    return market_summary, comments
+
+
+def iter_active_alert_batches(batch_size: int = CHECK_BATCH_SIZE):
+    """
+    활성 Alert를 id 순으로 batch_size개씩 조회 (키셋 페이지네이션)
+
+    전체 알림을 한 번에 메모리에 올리지 않도록 배치 단위로 가져온다.
+    이메일/설정 URL에 쓰는 사용자는 JOIN으로 함께 로드한다.
+
+    Yields:
+        list[Alert]: 활성 Alert 배치
+    """
+    last_id = 0
+    while True:
+        batch = (
+            Alert.query.options(joinedload(Alert.user))
+            .filter(Alert.status == "active", Alert.id > last_id)
+            .order_by(Alert.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return
+        # 호출 측 커밋으로 인스턴스가 만료되기 전에 다음 키 저장
+        last_id = batch[-1].id
+        yield batch
+
+
+def check_alert_batch(alerts: list[Alert], app, result: dict) -> None:
+    """
+    Alert 배치 처리 후 결과를 result에 누적하고 배치 단위로 커밋
+
+    Args:
+        alerts: 활성 Alert 배치
+        app: Flask 앱 인스턴스
+        result: check_alerts() 처리 결과 요약 (누적 대상)
+    """
+    # 현재가 일괄 조회 (종목별 1회, 동시 요청)
+    prices = get_stock_prices([alert.stock_code for alert in alerts])
+
+    # 기준 충족 알림의 LLM 코멘트 일괄 생성 (동시 요청)
+    try:
+        market_summary, comments = prepare_comments(alerts, prices, app)
+    except Exception as e:
+        app.logger.error(f"[알림 체크] 코멘트 일괄 생성 오류, 개별 생성으로 진행: {e}")
+        market_summary, comments = None, None
+
+    # 각 Alert 판단 (이메일은 모아서 일괄 발송)
+    triggered = []
+    for alert in alerts:
+        try:
+            evaluation = evaluate_alert(
+                alert,
+                app,
+                prices=prices,
+                market_summary=market_summary,
+                comments=comments,
+            )
+        except Exception as e:
+            app.logger.error(
+                f"[알림 체크] 처리 오류: {alert.stock_name}({alert.stock_code}), 오류: {e}"
+            )
+            result["errors"].append(
+                {
+                    "alert_id": alert.id,
+                    "stock_code": alert.stock_code,
+                    "error": str(e),
+                }
+            )
+            continue
+
+        result["checked"] += 1
+        if evaluation["status"] == "triggered":
+            triggered.append((alert, evaluation))
+        if evaluation["error"]:
+            result["errors"].append(
+                {
+                    "alert_id": alert.id,
+                    "stock_code": alert.stock_code,
+                    "error": evaluation["error"],
+                }
+            )
+
+    if not triggered:
+        return
+
+    # AlertLog 기록 + 기준가 갱신을 발송 전에 배치 단위로 커밋
+    # (발송 후 저장이 실패해 다음 실행에서 같은 알림을 다시 보내는 일 방지)
+    alert_logs = [
+        record_alert_trigger(alert, evaluation) for alert, evaluation in triggered
+    ]
+    try:
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"[알림 체크] 처리 결과 저장 실패, 이메일 미발송: {e}")
+        result["errors"].append({"alert_id": None, "stock_code": None, "error": str(e)})
+        return
+
+    # 기준 충족 알림 이메일 일괄 발송 (SMTP 연결/로그인 1회)
+    emails = [evaluation["email"] for _, evaluation in triggered]
+    try:
+        sent = send_alert_emails_batch(emails)
+    except Exception as e:
+        app.logger.error(f"[알림 체크] 이메일 일괄 발송 오류: {e}")
+        sent = [False] * len(triggered)
+
+    for alert_log, email, email_sent in zip(alert_logs, emails, sent):
+        mark_email_result(alert_log, app, email, email_sent)
+        result["triggered"] += 1
+        if email_sent:
+            result["email_sent"] += 1
+        else:
+            result["email_failed"] += 1
+
+    # 발송 결과 저장 (실패해도 기준가는 이미 갱신되어 다음 실행에서 재발송하지 않음)
+    try:
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"[알림 체크] 발송 결과 저장 실패: {e}")
+        result["errors"].append({"alert_id": None, "stock_code": None, "error": str(e)})
+
+
 def check_alerts() -> dict:
     """
     활성 알림 체크 및 처리
@@ -205,14 +499,11 @@ def check_alerts() -> dict:
                 "errors": []           # 오류 목록
             }
     """
-    app = create_app(Config)
+    app = create_app(Config, register_routes=False)
 
     with app.app_context():
-        # 활성 Alert 조회
-        active_alerts = Alert.query.filter_by(status="active").all()
-
         result = {
-            "total": len(active_alerts),
+            "total": Alert.query.filter_by(status="active").count(),
             "checked": 0,
             "triggered": 0,
             "email_sent": 0,
@@ -222,43 +513,13 @@ def check_alerts() -> dict:
 
         app.logger.info(f"[알림 체크] 시작 - 활성 알림: {result['total']}개")
 
-        if not active_alerts:
+        if not result["total"]:
             app.logger.info("[알림 체크] 완료 - 활성 알림 없음")
             return result
 
-        # 각 Alert 처리
-        for alert in active_alerts:
-            try:
-                process_result = process_alert(alert, app)
-                result["checked"] += 1
-
-                if process_result["status"] == "triggered":
-                    result["triggered"] += 1
-                    if process_result["email_sent"]:
-                        result["email_sent"] += 1
-                    else:
-                        result["email_failed"] += 1
-
-                if process_result["error"]:
-                    result["errors"].append(
-                        {
-                            "alert_id": alert.id,
-                            "stock_code": alert.stock_code,
-                            "error": process_result["error"],
-                        }
-                    )
-
-            except Exception as e:
-                app.logger.error(
-                    f"[알림 체크] 처리 오류: {alert.stock_name}({alert.stock_code}), 오류: {e}"
-                )
-                result["errors"].append(
-                    {
-                        "alert_id": alert.id,
-                        "stock_code": alert.stock_code,
-                        "error": str(e),
-                    }
-                )
+        # 배치 단위로 조회/처리/커밋 (메모리 사용량을 배치 크기로 제한)
+        for alerts in iter_active_alert_batches():
+            check_alert_batch(alerts, app, result)
 
         app.logger.info(
             f"[알림 체크] 완료 - 체크: {result['checked']}, "
@@ -270,5 +531,7 @@ def check_alerts() -> dict:
 
 
 if __name__ == "__main__":
+    # 요청 스레드가 없는 cron 실행이므로 네이버 API 재시도 예산을 크게
+    use_batch_naver_session()
     result = check_alerts()
     print(f"알림 체크 결과: {result}")
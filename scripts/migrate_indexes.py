@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""DB 인덱스 마이그레이션 스크립트
+
+db.create_all()은 이미 존재하는 테이블에 새 인덱스를 추가하지 않으므로,
+기존 DB에 모델에 선언된 인덱스를 생성한다. 여러 번 실행해도 안전하다.
+
+Usage:
+    uv run python scripts/migrate_indexes.py
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import app.models  # noqa: F401  (라우트 없이도 모델 테이블/인덱스를 metadata에 등록)
+from app import create_app, db
+from app.config import Config
+
+
+def migrate_indexes() -> list[str]:
+    """
+    모델에 선언된 인덱스 중 DB에 없는 것을 생성
+
+    Returns:
+        list[str]: 새로 생성된 인덱스 이름 목록
+    """
+    app = create_app(Config, register_routes=False)
+
+    created = []
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+
+        for table in db.metadata.sorted_tables:
+            # 신규 테이블은 create_all()에서 인덱스와 함께 생성됨
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                index.create(bind=db.engine)
+                created.append(index.name)
+                app.logger.info(f"[인덱스 마이그레이션] 생성: {index.name}")
+
+    return created
+
+
+if __name__ == "__main__":
+    created = migrate_indexes()
+    print(f"생성된 인덱스: {created or '없음'}")
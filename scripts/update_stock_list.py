@@ -10,7 +10,6 @@ Cron example (매일 평일 08:00):
     0 8 * * 1-5  cd /path/to/stock-alarm && uv run python scripts/update_stock_list.py
 """
 
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -19,45 +18,19 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
+from app.services.stock import fetch_stock_list, save_stock_list
+
 
 def update_stock_list():
     """FinanceDataReader에서 종목 리스트를 조회하여 JSON 파일로 저장한다."""
-    import FinanceDataReader as fdr
-
     print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] 종목 리스트 갱신 시작")
 
     try:
-        kospi = fdr.StockListing("KOSPI")
-        kosdaq = fdr.StockListing("KOSDAQ")
-        etf = fdr.StockListing("ETF/KR")
-        etf = etf.rename(columns={"Symbol": "Code"})
-
-        print(f"  KOSPI: {len(kospi)}개, KOSDAQ: {len(kosdaq)}개, ETF: {len(etf)}개")
-
-        # 필요한 필드만 추출하여 리스트로 변환
-        stocks = []
-        seen_codes = set()
-
-        for df, market in [(kospi, "KOSPI"), (kosdaq, "KOSDAQ"), (etf, "ETF")]:
-            for _, row in df.iterrows():
-                code = str(row["Code"]).strip()
-                if code and code not in seen_codes:
-                    seen_codes.add(code)
-                    stocks.append(
-                        {
-                            "code": code,
-                            "name": str(row["Name"]).strip(),
-                            "market": market,
-                        }
-                    )
-
-        # JSON 파일로 저장
-        data_dir = project_root / "data"
-        data_dir.mkdir(exist_ok=True)
-        cache_path = data_dir / "stock_list.json"
+        stocks = fetch_stock_list()
 
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(stocks, f, ensure_ascii=False)
+        # JSON 파일로 저장 (앱 워커가 읽는 중에도 안전하도록 원자적 교체)
+        cache_path = project_root / "data" / "stock_list.json"
+        save_stock_list(stocks, cache_path)
 
         print(f"  총 {len(stocks)}개 종목 저장 완료: {cache_path}")
         return True
@@ -6,21 +6,81 @@ from app import create_app, db
 from app.config import TestConfig
 
 
-@pytest.fixture
-def app():
-    """테스트용 Flask 앱 생성"""
+@pytest.fixture(scope="session")
+def _session_app():
+    """세션 전체에서 공유하는 Flask 앱 (Blueprint 등록/엔진 초기화/테이블 생성 1회)"""
     app = create_app(TestConfig)
 
     with app.app_context():
         db.create_all()
+        # 커밋 후 속성 만료로 인한 재조회 SELECT 생략 (DB 재확인이 필요한 테스트는 직접 재조회)
+        db.session.configure(expire_on_commit=False)
+
+    yield app
+
+    with app.app_context():
+        db.session.configure(expire_on_commit=True)
+
+
+@pytest.fixture
+def app(_session_app):
+    """테스트용 Flask 앱 (테스트마다 설정 복원 + 테이블 비우기로 격리)"""
+    app = _session_app
+    config = dict(app.config)
+
+    with app.app_context():
         yield app
-        db.drop_all()
+
+        db.session.rollback()
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
+
+    app.config.clear()
+    app.config.update(config)
+
+
+@pytest.fixture
+def expire_on_commit(app):
+    """커밋 후 인스턴스 만료(운영 기본값)를 켠 세션 사용 - 만료 이후 동작을 검증하는 테스트용"""
+    db.session.configure(expire_on_commit=True)
+    yield
+    # 이미 만든 세션에는 configure가 적용되지 않으므로 먼저 정리
+    db.session.remove()
+    db.session.configure(expire_on_commit=False)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """테스트 간 프로세스 메모리 상태 격리 (현재가, 시장 지수, UUID → 사용자, OpenAI 클라이언트/인증 실패)"""
+    from app.routes.settings import clear_user_cache
+    from app.services.llm import _get_client, clear_auth_failure
+    from app.services.stock import clear_market_summary_cache, clear_stock_price_cache
+
+    clear_stock_price_cache()
+    clear_market_summary_cache()
+    clear_user_cache()
+    _get_client.cache_clear()
+    clear_auth_failure()
+    yield
+    clear_stock_price_cache()
+    clear_market_summary_cache()
+    clear_user_cache()
+    _get_client.cache_clear()
+    clear_auth_failure()
+
+
+@pytest.fixture(scope="session")
+def _session_client(_session_app):
+    """세션 전체에서 공유하는 테스트 클라이언트"""
+    return _session_app.test_client()
 
 
 @pytest.fixture
-def client(app):
-    """테스트용 클라이언트"""
-    return app.test_client()
+def client(app, _session_client):
+    """테스트용 클라이언트 (테스트마다 세션 쿠키 초기화 - flash 메시지 격리)"""
+    _session_client.delete_cookie(app.config["SESSION_COOKIE_NAME"])
+    return _session_client
 
 
 @pytest.fixture
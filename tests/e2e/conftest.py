@@ -1,15 +1,18 @@
 """E2E 테스트용 fixtures (서버, mock, DB)"""
 
-import tempfile
+import os
+import sqlite3
 import threading
 import uuid
 
 import pytest
-from werkzeug.serving import make_server
+from sqlalchemy import delete, insert
+from sqlalchemy.pool import QueuePool
+from werkzeug.serving import WSGIRequestHandler, make_server
 
 from app import create_app, db
 from app.config import Config
-from app.models import User
+from app.models import Alert, AlertLog, User
 
 # ── 가짜 종목 데이터 ──────────────────────────────────────────────
 FAKE_STOCKS = {
@@ -20,26 +23,34 @@ FAKE_STOCKS = {
 }
 
 
+# 검색마다 lower()를 반복하지 않도록 미리 계산한 (코드, 소문자 이름, 종목) 목록
+_FAKE_STOCKS_INDEX = [(s["code"], s["name"].lower(), s) for s in FAKE_STOCKS.values()]
+
+
 def _fake_search_stock(query, limit=10):
     """가짜 종목 검색"""
+    query_lower = query.lower()
     results = []
-    for stock in FAKE_STOCKS.values():
-        if query.lower() in stock["name"].lower() or query in stock["code"]:
+    for code, name_lower, stock in _FAKE_STOCKS_INDEX:
+        if query_lower in name_lower or query in code:
             results.append(
-                {"code": stock["code"], "name": stock["name"], "market": stock["market"]}
+                {
+                    "code": stock["code"],
+                    "name": stock["name"],
+                    "market": stock["market"],
+                }
             )
-    return results[:limit]
-
-
-def _fake_validate_stock_code(stock_code):
-    """가짜 종목코드 검증"""
-    return stock_code in FAKE_STOCKS
+            if len(results) == limit:
+                break
+    return results
 
 
-def _fake_get_stock_name(stock_code):
-    """가짜 종목명 조회"""
+def _fake_find_stock(stock_code):
+    """가짜 종목 조회 (검증 + 종목명)"""
     stock = FAKE_STOCKS.get(stock_code)
-    return stock["name"] if stock else None
+    if stock is None:
+        return None
+    return {"code": stock["code"], "name": stock["name"], "market": stock["market"]}
 
 
 def _fake_get_stock_price(stock_code):
@@ -60,6 +71,16 @@ class E2ETestConfig(Config):
     TESTING = True
     SECRET_KEY = "e2e-test-secret"
     LOG_LEVEL = "WARNING"
+    LOG_REQUESTS = False  # 요청/응답 로깅 훅 미등록
+    SQLALCHEMY_ECHO = False
+    WARM_STOCK_LIST = False
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    """요청마다 access log를 남기지 않는 Werkzeug 요청 핸들러"""
+
+    def log_request(self, code="-", size="-"):
+        pass
 
 
 # ── Fixtures ─────────────────────────────────────────────────────
@@ -67,60 +88,55 @@ class E2ETestConfig(Config):
 @pytest.fixture(scope="session")
 def e2e_app():
     """E2E 테스트용 Flask 앱 (session 스코프)"""
-    # 파일 기반 SQLite (서버 스레드와 공유)
-    db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
-    db_path = db_file.name
-    db_file.close()
-
-    E2ETestConfig.SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+    # 공유 캐시 인메모리 SQLite - 서버 스레드와 fixture 정리는 각자 풀에서 연결을 받아
+    # 트랜잭션이 섞이지 않고, 데이터는 cache=shared로 공유
+    # pytest-xdist 워커마다 별도 DB 이름 사용 (-n auto --dist loadfile 병렬 실행)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    db_uri = f"file:e2e_{worker}?mode=memory&cache=shared"
+    E2ETestConfig.SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_uri}&uri=true"
     E2ETestConfig.SQLALCHEMY_ENGINE_OPTIONS = {
-        "connect_args": {"check_same_thread": False}
+        "poolclass": QueuePool,
+        "connect_args": {"check_same_thread": False},
     }
 
-    app = create_app(E2ETestConfig)
-
-    # mock 적용 - settings.py의 top-level import
-    import app.routes.settings as settings_mod
+    # 마지막 연결이 닫히면 인메모리 DB가 사라지므로 세션 동안 유지용 연결을 열어 둠
+    keeper = sqlite3.connect(db_uri, uri=True)
 
-    settings_mod.validate_stock_code = _fake_validate_stock_code
-    settings_mod.get_stock_name = _fake_get_stock_name
-    settings_mod.get_stock_price = _fake_get_stock_price
+    app = create_app(E2ETestConfig)
 
-    # mock 적용 - main.py의 top-level import
-    import app.routes.main as main_mod
+    # mock 적용 - 라우트에서 함수 내부 import로 참조하는 서비스 모듈
+    import app.services.mail as mail_mod
 
-    main_mod.send_welcome_email = _fake_send_welcome_email
+    mail_mod.send_welcome_email = _fake_send_welcome_email
 
-    # mock 적용 - stock service (main.py에서 함수 내부 import)
     import app.services.stock as stock_mod
 
     stock_mod.search_stock = _fake_search_stock
-    stock_mod.validate_stock_code = _fake_validate_stock_code
-    stock_mod.get_stock_name = _fake_get_stock_name
+    stock_mod.find_stock = _fake_find_stock
     stock_mod.get_stock_price = _fake_get_stock_price
 
-    with app.app_context():
-        db.create_all()
+    # 앱 컨텍스트를 세션 동안 한 번만 push (fixture마다 push/pop 하지 않음)
+    ctx = app.app_context()
+    ctx.push()
+    db.create_all()
 
     yield app
 
-    # cleanup
-    import os
-
-    try:
-        os.unlink(db_path)
-    except OSError:
-        pass
+    db.session.remove()
+    db.engine.dispose()
+    ctx.pop()
+    keeper.close()
 
 
 @pytest.fixture(scope="session")
 def e2e_server(e2e_app):
     """daemon thread에서 Flask 서버 실행 (session 스코프)"""
-    server = make_server("127.0.0.1", 5555, e2e_app)
+    # 포트 0: OS가 빈 포트를 할당 (동시 실행 시 포트 충돌 방지)
+    server = make_server("127.0.0.1", 0, e2e_app, request_handler=_QuietRequestHandler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
 
-    yield "http://127.0.0.1:5555"
+    yield f"http://127.0.0.1:{server.server_port}"
 
     server.shutdown()
 
@@ -131,23 +147,75 @@ def base_url(e2e_server):
     return e2e_server
 
 
-@pytest.fixture()
-def e2e_user(e2e_app):
-    """테스트 격리를 위한 사용자 생성/정리 (function 스코프)"""
+@pytest.fixture(scope="session")
+def page(browser, browser_context_args):
+    """브라우저 컨텍스트/페이지를 세션 전체에서 공유 (테스트마다 새로 만들지 않음)"""
+    context = browser.new_context(**browser_context_args)
+    yield context.new_page()
+    context.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_page_state(page, base_url):
+    """테스트 간 브라우저 상태 격리 (쿠키, localStorage/sessionStorage)"""
+    yield
+    page.context.clear_cookies()
+    if page.url.startswith(base_url):
+        page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+
+
+# 세션 시작 시 미리 만들어 두는 테스트 사용자 수 (e2e_user 사용 테스트 수 이상)
+E2E_USER_POOL_SIZE = 20
+
+
+def _new_user_dict():
+    """테스트 사용자 정보 생성 (DB 저장 전)"""
     user_uuid = str(uuid.uuid4())
-    user_email = f"test-{user_uuid[:8]}@example.com"
-
-    with e2e_app.app_context():
-        user = User(email=user_email, uuid=user_uuid)
-        db.session.add(user)
-        db.session.commit()
-        user_id = user.id
-
-    yield {"id": user_id, "email": user_email, "uuid": user_uuid}
-
-    # cleanup
-    with e2e_app.app_context():
-        user = db.session.get(User, user_id)
-        if user:
-            db.session.delete(user)
-            db.session.commit()
+    return {"email": f"test-{user_uuid[:8]}@example.com", "uuid": user_uuid}
+
+
+def _insert_users(rows):
+    """사용자 INSERT ... RETURNING id (ORM 객체 상태 관리/커밋 후 재조회 없이 PK만 반환)"""
+    user_ids = db.session.scalars(
+        insert(User).returning(User.id, sort_by_parameter_order=True),
+        [{"email": row["email"], "uuid": row["uuid"]} for row in rows],
+    ).all()
+    db.session.commit()
+    return user_ids
+
+
+@pytest.fixture(scope="session")
+def _user_pool(e2e_app):
+    """e2e_user에 나눠줄 사용자를 세션 시작 시 한 번에 생성"""
+    pool = [_new_user_dict() for _ in range(E2E_USER_POOL_SIZE)]
+
+    for info, user_id in zip(pool, _insert_users(pool)):
+        info["id"] = user_id
+
+    return pool
+
+
+@pytest.fixture()
+def e2e_user(e2e_app, _user_pool):
+    """테스트 격리를 위한 사용자 할당/정리 (function 스코프)
+
+    미리 만든 사용자를 하나씩 꺼내 쓰고, 정리 시 해당 사용자의 알림만 삭제.
+    풀이 소진되면 사용자를 새로 생성하고 정리 시 함께 삭제.
+    """
+    if _user_pool:
+        user_info = _user_pool.pop()
+        created = False
+    else:
+        user_info = _new_user_dict()
+        [user_info["id"]] = _insert_users([user_info])
+        created = True
+
+    yield user_info
+
+    # cleanup - 조회 없이 DELETE 문으로 삭제 (FK 미강제이므로 하위 행부터)
+    user_id = user_info["id"]
+    db.session.execute(delete(AlertLog).where(AlertLog.user_id == user_id))
+    db.session.execute(delete(Alert).where(Alert.user_id == user_id))
+    if created:
+        db.session.execute(delete(User).where(User.id == user_id))
+    db.session.commit()
@@ -9,7 +9,7 @@ pytestmark = pytest.mark.e2e
 
 def _add_stock(page, base_url, user_uuid, stock_query, stock_name, upper="", lower=""):
     """종목 추가 헬퍼 함수"""
-    page.goto(f"{base_url}/settings/{user_uuid}")
+    page.goto(f"{base_url}/settings/{user_uuid}", wait_until="domcontentloaded")
 
     search_input = page.locator("input[placeholder='종목명 또는 코드 검색']")
     search_input.fill(stock_query)
@@ -24,32 +24,37 @@ def _add_stock(page, base_url, user_uuid, stock_query, stock_name, upper="", low
     if lower:
         page.locator("input[name='threshold_lower']").first.fill(lower)
 
-    page.locator("button[type='submit']:has-text('추가')").click()
-    page.wait_for_load_state("networkidle")
+    # networkidle(500ms 유휴 대기) 대신 제출 후 리다이렉트된 페이지 로드까지만 대기
+    with page.expect_navigation(wait_until="domcontentloaded"):
+        page.locator("button[type='submit']:has-text('추가')").click()
+
+
+def _post_add(page, base_url, user_uuid, stock_code, upper="", lower=""):
+    """종목 추가 폼을 브라우저 UI 없이 직접 POST (서버 상태만 준비할 때 사용)"""
+    return page.request.post(
+        f"{base_url}/settings/{user_uuid}/alerts",
+        form={
+            "stock_code": stock_code,
+            "threshold_upper": upper,
+            "threshold_lower": lower,
+        },
+    )
 
 
 def _open_action_menu(page, stock_name):
     """작업 메뉴(... 버튼)를 열고 teleported 드롭다운이 나타날 때까지 대기"""
-    action_button = page.locator(f"tr:has-text('{stock_name}') button").first
-    action_button.click()
-    # teleported 드롭다운이 열릴 때까지 잠시 대기
-    page.wait_for_timeout(300)
+    row = page.get_by_role("row", name=stock_name)
+    row.get_by_role("button", name="작업 메뉴").click()
+    # 고정 대기 대신 teleported 드롭다운이 표시되는 즉시 진행
+    page.locator("[data-testid='action-dropdown']:visible").first.wait_for(
+        state="visible", timeout=2000
+    )
 
 
 def _click_teleported_button(page, text):
-    """teleported 드롭다운 내 버튼을 JS로 클릭 (viewport 밖에 있을 수 있음)"""
-    page.evaluate(
-        """(text) => {
-            const buttons = document.querySelectorAll('button');
-            for (const btn of buttons) {
-                if (btn.textContent.trim().includes(text)) {
-                    btn.click();
-                    return;
-                }
-            }
-        }""",
-        text,
-    )
+    """teleported 드롭다운 내 버튼 클릭 (viewport 밖에 있을 수 있어 click 이벤트 직접 전달)"""
+    # 숨겨진 다른 행의 드롭다운은 role 조회에서 제외됨, "활성화"/"비활성화" 구분 위해 exact
+    page.get_by_role("button", name=text, exact=True).dispatch_event("click")
 
 
 # ── 설정 페이지 기본 ──────────────────────────────────────────────
@@ -57,7 +62,7 @@ def _click_teleported_button(page, text):
 
 def test_settings_page_loads(page, base_url, e2e_user):
     """설정 페이지가 정상 로드되는지 확인"""
-    page.goto(f"{base_url}/settings/{e2e_user['uuid']}")
+    page.goto(f"{base_url}/settings/{e2e_user['uuid']}", wait_until="domcontentloaded")
 
     expect(page).to_have_title("알림 설정 - Stock Alarm")
     expect(page.locator("text=알림 설정")).to_be_visible()
@@ -66,13 +71,15 @@ def test_settings_page_loads(page, base_url, e2e_user):
 
 def test_invalid_uuid_returns_404(page, base_url):
     """잘못된 UUID로 접근 시 404 반환"""
-    response = page.goto(f"{base_url}/settings/invalid-uuid-12345")
+    response = page.goto(
+        f"{base_url}/settings/invalid-uuid-12345", wait_until="domcontentloaded"
+    )
     assert response.status == 404
 
 
 def test_empty_alerts_display(page, base_url, e2e_user):
     """알림이 없는 상태에서 빈 상태 메시지 표시"""
-    page.goto(f"{base_url}/settings/{e2e_user['uuid']}")
+    page.goto(f"{base_url}/settings/{e2e_user['uuid']}", wait_until="domcontentloaded")
 
     empty_message = page.locator("text=등록된 종목이 없습니다")
     expect(empty_message).to_be_visible()
@@ -138,12 +145,9 @@ def test_add_etf_stock(page, base_url, e2e_user):
 
 def test_add_duplicate_stock_error(page, base_url, e2e_user):
     """이미 등록된 종목 중복 추가 시 에러"""
-    # 첫 번째 추가
-    _add_stock(
-        page, base_url, e2e_user["uuid"],
-        stock_query="카카오",
-        stock_name="카카오",
-    )
+    # 첫 번째 추가 (검색 UI 없이 직접 POST)
+    response = _post_add(page, base_url, e2e_user["uuid"], "035720")
+    assert response.ok
 
     # 같은 종목 다시 추가 시도
     _add_stock(
@@ -193,8 +197,8 @@ def test_edit_alert_threshold(page, base_url, e2e_user):
     lower_input.fill("15")
 
     # 저장 버튼 클릭
-    modal_save_button.click()
-    page.wait_for_load_state("networkidle")
+    with page.expect_navigation(wait_until="domcontentloaded"):
+        modal_save_button.click()
 
     # 수정 성공 메시지 확인
     success_toast = page.locator("text=알림 기준이 수정되었습니다.")
@@ -222,8 +226,8 @@ def test_toggle_alert_status(page, base_url, e2e_user):
 
     # 작업 메뉴 → 비활성화 (JS 클릭으로 form submit)
     _open_action_menu(page, "삼성전자")
-    _click_teleported_button(page, "비활성화")
-    page.wait_for_load_state("networkidle")
+    with page.expect_navigation(wait_until="domcontentloaded"):
+        _click_teleported_button(page, "비활성화")
 
     # 비활성화 성공 메시지 확인
     success_toast = page.locator("text=비활성화되었습니다.")
@@ -234,8 +238,8 @@ def test_toggle_alert_status(page, base_url, e2e_user):
 
     # 다시 활성화
     _open_action_menu(page, "삼성전자")
-    _click_teleported_button(page, "활성화")
-    page.wait_for_load_state("networkidle")
+    with page.expect_navigation(wait_until="domcontentloaded"):
+        _click_teleported_button(page, "활성화")
 
     # 활성화 성공 메시지 확인
     success_toast = page.locator("text=활성화되었습니다.")
@@ -257,13 +261,13 @@ def test_delete_alert(page, base_url, e2e_user):
     # 종목이 테이블에 있는지 확인
     expect(page.locator("td:has-text('삼성전자')")).to_be_visible()
 
-    # confirm 다이얼로그 자동 수락 설정
-    page.on("dialog", lambda dialog: dialog.accept())
+    # confirm 다이얼로그 자동 수락 설정 (세션 공유 page이므로 1회만)
+    page.once("dialog", lambda dialog: dialog.accept())
 
     # 작업 메뉴 → 삭제 (JS 클릭)
     _open_action_menu(page, "삼성전자")
-    _click_teleported_button(page, "삭제")
-    page.wait_for_load_state("networkidle")
+    with page.expect_navigation(wait_until="domcontentloaded"):
+        _click_teleported_button(page, "삭제")
 
     # 삭제 성공 메시지 확인
     success_toast = page.locator("text=종목이 삭제되었습니다.")
@@ -9,7 +9,7 @@ pytestmark = pytest.mark.e2e
 
 def test_search_by_name(page, base_url, e2e_user):
     """종목명으로 검색 시 드롭다운이 표시되는지 확인"""
-    page.goto(f"{base_url}/settings/{e2e_user['uuid']}")
+    page.goto(f"{base_url}/settings/{e2e_user['uuid']}", wait_until="domcontentloaded")
 
     search_input = page.locator("input[placeholder='종목명 또는 코드 검색']")
     search_input.fill("삼성")
@@ -21,7 +21,7 @@ def test_search_by_name(page, base_url, e2e_user):
 
 def test_search_by_code(page, base_url, e2e_user):
     """종목코드로 검색 시 드롭다운이 표시되는지 확인"""
-    page.goto(f"{base_url}/settings/{e2e_user['uuid']}")
+    page.goto(f"{base_url}/settings/{e2e_user['uuid']}", wait_until="domcontentloaded")
 
     search_input = page.locator("input[placeholder='종목명 또는 코드 검색']")
     search_input.fill("005930")
@@ -33,7 +33,7 @@ def test_search_by_code(page, base_url, e2e_user):
 
 def test_search_etf(page, base_url, e2e_user):
     """ETF 코드로 검색 시 KODEX 200이 표시되는지 확인"""
-    page.goto(f"{base_url}/settings/{e2e_user['uuid']}")
+    page.goto(f"{base_url}/settings/{e2e_user['uuid']}", wait_until="domcontentloaded")
 
     search_input = page.locator("input[placeholder='종목명 또는 코드 검색']")
     search_input.fill("069500")
@@ -45,7 +45,7 @@ def test_search_etf(page, base_url, e2e_user):
 
 def test_select_from_dropdown(page, base_url, e2e_user):
     """드롭다운 항목 클릭 시 hidden input에 종목코드가 설정되는지 확인"""
-    page.goto(f"{base_url}/settings/{e2e_user['uuid']}")
+    page.goto(f"{base_url}/settings/{e2e_user['uuid']}", wait_until="domcontentloaded")
 
     search_input = page.locator("input[placeholder='종목명 또는 코드 검색']")
     search_input.fill("삼성")
@@ -65,7 +65,7 @@ def test_select_from_dropdown(page, base_url, e2e_user):
 
 def test_keyboard_navigation(page, base_url, e2e_user):
     """키보드 네비게이션 (ArrowDown + Enter)으로 종목 선택"""
-    page.goto(f"{base_url}/settings/{e2e_user['uuid']}")
+    page.goto(f"{base_url}/settings/{e2e_user['uuid']}", wait_until="domcontentloaded")
 
     search_input = page.locator("input[placeholder='종목명 또는 코드 검색']")
     search_input.fill("삼성")
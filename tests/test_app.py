@@ -36,3 +36,110 @@ class TestCreateApp:
             assert "users" in tables
             assert "alerts" in tables
             assert "alert_logs" in tables
+
+    def test_sqlite_wal_mode_enabled(self, tmp_path):
+        """파일 기반 SQLite 연결 시 WAL 모드가 적용되는지 확인"""
+        from sqlalchemy import text
+
+        from app.config import TestConfig
+
+        class FileDBConfig(TestConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+            SQLALCHEMY_ENGINE_OPTIONS = {}
+
+        file_app = create_app(FileDBConfig)
+        with file_app.app_context():
+            mode = db.session.execute(text("PRAGMA journal_mode")).scalar()
+            assert mode == "wal"
+            db.engine.dispose()
+
+    def test_logging_uses_queue_handler(self):
+        """앱 로거가 QueueHandler를 통해 비동기로 기록하는지 확인"""
+        from logging.handlers import QueueHandler
+
+        from app.config import TestConfig
+
+        # 리스너는 프로세스당 하나 - 가장 최근에 생성한 앱 기준으로 확인
+        logging_app = create_app(TestConfig)
+        assert any(isinstance(h, QueueHandler) for h in logging_app.logger.handlers)
+        assert logging_app.extensions["log_listener"]._thread is not None
+
+    def test_request_logging_disabled(self):
+        """LOG_REQUESTS=False이면 요청 로깅 훅을 등록하지 않음"""
+        from app.config import TestConfig
+
+        class NoRequestLogConfig(TestConfig):
+            LOG_REQUESTS = False
+
+        quiet_app = create_app(NoRequestLogConfig)
+        assert quiet_app.before_request_funcs.get(None, []) == []
+        assert quiet_app.after_request_funcs.get(None, []) == []
+
+    def test_route_loggers_propagate_to_app_logger(self, app):
+        """라우트 모듈 로거가 앱 로거의 핸들러로 전파되는지 확인"""
+        from app.routes import main, settings
+
+        assert main.logger.parent is app.logger
+        assert settings.logger.parent is app.logger
+        assert settings.logger.getEffectiveLevel() == app.logger.level
+
+    def test_create_app_does_not_create_tables(self):
+        """create_app()은 테이블을 생성하지 않음 (init-db 명령으로 분리)"""
+        from sqlalchemy import inspect
+
+        from app.config import TestConfig
+
+        fresh_app = create_app(TestConfig)
+        with fresh_app.app_context():
+            assert inspect(db.engine).get_table_names() == []
+
+    def test_init_db_command(self):
+        """init-db 명령으로 테이블 생성"""
+        from sqlalchemy import inspect
+
+        from app.config import TestConfig
+
+        fresh_app = create_app(TestConfig)
+        result = fresh_app.test_cli_runner().invoke(args=["init-db"])
+
+        assert result.exit_code == 0
+        with fresh_app.app_context():
+            assert "users" in inspect(db.engine).get_table_names()
+
+    def test_json_provider_uses_orjson(self, app):
+        """jsonify가 orjson 기반 provider로 직렬화되는지 확인"""
+        import numpy as np
+        from flask import jsonify
+
+        from app import OrjsonProvider
+
+        assert isinstance(app.json, OrjsonProvider)
+        with app.test_request_context():
+            response = jsonify({"name": "삼성전자", "close": np.float64(70500.0)})
+        assert response.get_json() == {"name": "삼성전자", "close": 70500.0}
+
+    def test_stock_list_warmed_only_outside_flask_cli(self, monkeypatch):
+        """서버 프로세스에서만 종목 리스트 워밍 (flask CLI 명령에서는 생략)"""
+        from unittest.mock import patch
+
+        from app.config import TestConfig
+
+        class WarmConfig(TestConfig):
+            WARM_STOCK_LIST = True
+
+        with patch("app.services.stock.warm_stock_list") as mock_warm:
+            monkeypatch.setenv("FLASK_RUN_FROM_CLI", "true")
+            create_app(WarmConfig)
+            mock_warm.assert_not_called()
+
+            monkeypatch.delenv("FLASK_RUN_FROM_CLI")
+            create_app(WarmConfig)
+            mock_warm.assert_called_once()
+
+    def test_create_app_without_routes(self):
+        """register_routes=False이면 Blueprint를 등록하지 않음"""
+        from app.config import TestConfig
+
+        bare_app = create_app(TestConfig, register_routes=False)
+        assert bare_app.blueprints == {}
+        assert "init-db" in bare_app.cli.commands
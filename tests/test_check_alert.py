@@ -7,13 +7,21 @@ base_price 갱신 로직 검증:
 """
 
 import uuid
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pytest
 
 from app import db
 from app.models import User, Alert, AlertLog
-from scripts.check_alert import process_alert, is_threshold_reached
+from scripts.check_alert import (
+    check_alert_batch,
+    is_threshold_reached,
+    iter_active_alert_batches,
+    process_alert,
+)
+
+# check_alerts는 배치마다 커밋하므로 운영과 같이 커밋 후 인스턴스 만료 상태에서 검증
+pytestmark = pytest.mark.usefixtures("expire_on_commit")
 
 
 # ============================================================
@@ -36,40 +44,31 @@ class TestIsThresholdReached:
         )
         return alert
 
-    def test_upper_threshold_reached(self):
-        """상승 기준 충족"""
-        alert = self._make_alert(base_price=100000, upper=10.0)
-        reached, threshold_type = is_threshold_reached(alert, 110000)
-        assert reached is True
-        assert threshold_type == "upper"
-
-    def test_upper_threshold_not_reached(self):
-        """상승 기준 미충족"""
-        alert = self._make_alert(base_price=100000, upper=10.0)
-        reached, threshold_type = is_threshold_reached(alert, 109000)
-        assert reached is False
-        assert threshold_type is None
-
-    def test_lower_threshold_reached(self):
-        """하락 기준 충족"""
-        alert = self._make_alert(base_price=100000, lower=-10.0)
-        reached, threshold_type = is_threshold_reached(alert, 90000)
-        assert reached is True
-        assert threshold_type == "lower"
-
-    def test_lower_threshold_not_reached(self):
-        """하락 기준 미충족"""
-        alert = self._make_alert(base_price=100000, lower=-10.0)
-        reached, threshold_type = is_threshold_reached(alert, 91000)
-        assert reached is False
-        assert threshold_type is None
-
-    def test_exact_threshold(self):
-        """정확히 기준치에 도달"""
-        alert = self._make_alert(base_price=100000, upper=10.0)
-        reached, threshold_type = is_threshold_reached(alert, 110000)
-        assert reached is True
-        assert threshold_type == "upper"
+    @pytest.mark.parametrize(
+        "upper, lower, current_price, expected_reached, expected_type",
+        [
+            (10.0, -10.0, 110000, True, "upper"),  # 상승 기준 충족 (정확히 기준치)
+            (10.0, -10.0, 109000, False, None),  # 상승 기준 미충족
+            (10.0, -10.0, 90000, True, "lower"),  # 하락 기준 충족
+            (10.0, -10.0, 91000, False, None),  # 하락 기준 미충족
+            (5.0, -10.0, 106000, True, "upper"),  # 기준치 초과
+        ],
+        ids=["upper", "upper_not", "lower", "lower_not", "upper_over"],
+    )
+    def test_threshold(
+        self, upper, lower, current_price, expected_reached, expected_type
+    ):
+        """기준 충족 여부와 충족 유형 판단"""
+        alert = self._make_alert(base_price=100000, upper=upper, lower=lower)
+        reached, threshold_type, _ = is_threshold_reached(alert, current_price)
+        assert reached is expected_reached
+        assert threshold_type == expected_type
+
+    def test_change_rate_returned(self):
+        """판단에 사용한 변동률을 함께 반환"""
+        alert = self._make_alert(base_price=100000)
+        assert is_threshold_reached(alert, 105000) == (False, None, 5.0)
+        assert is_threshold_reached(alert, 88000) == (True, "lower", -12.0)
 
 
 # ============================================================
@@ -80,16 +79,42 @@ class TestIsThresholdReached:
 class TestProcessAlert:
     """알림 처리 및 base_price 갱신 테스트"""
 
+    @pytest.fixture(autouse=True)
+    def mock_price(self, monkeypatch):
+        """외부 호출(이메일/LLM/시장 지수) 고정 + 현재가 mock 반환"""
+        monkeypatch.setattr(
+            "scripts.check_alert.send_alert_email", lambda *args, **kwargs: True
+        )
+        monkeypatch.setattr(
+            "scripts.check_alert.send_alert_emails_batch",
+            lambda emails: [True] * len(emails),
+        )
+        monkeypatch.setattr(
+            "scripts.check_alert.generate_alert_comment",
+            lambda *args, **kwargs: "테스트 코멘트",
+        )
+        monkeypatch.setattr(
+            "scripts.check_alert.get_market_summary",
+            lambda: {
+                "kospi": 2650,
+                "kosdaq": 845,
+                "kospi_change": 0,
+                "kosdaq_change": 0,
+                "kospi_change_rate": 0,
+                "kosdaq_change_rate": 0,
+            },
+        )
+        mock_price = Mock()
+        monkeypatch.setattr("scripts.check_alert.get_stock_price", mock_price)
+        return mock_price
+
     @pytest.fixture
     def user_and_alert(self, app):
-        """테스트용 User + Alert 생성"""
+        """테스트용 User + Alert 생성 (1회 커밋, 정리는 app fixture가 담당)"""
         with app.app_context():
             user = User(email="test@example.com", uuid=str(uuid.uuid4()))
-            db.session.add(user)
-            db.session.commit()
-
             alert = Alert(
-                user_id=user.id,
+                user=user,
                 stock_code="005930",
                 stock_name="삼성전자",
                 base_price=100000,
@@ -102,17 +127,7 @@ class TestProcessAlert:
 
             yield user, alert
 
-    @patch("scripts.check_alert.send_alert_email", return_value=True)
-    @patch("scripts.check_alert.generate_alert_comment", return_value="테스트 코멘트")
-    @patch("scripts.check_alert.get_market_summary", return_value={
-        "kospi": 2650, "kosdaq": 845,
-        "kospi_change": 0, "kosdaq_change": 0,
-        "kospi_change_rate": 0, "kosdaq_change_rate": 0,
-    })
-    @patch("scripts.check_alert.get_stock_price")
-    def test_base_price_updated_after_trigger(
-        self, mock_price, mock_market, mock_llm, mock_email, app, user_and_alert
-    ):
+    def test_base_price_updated_after_trigger(self, mock_price, app, user_and_alert):
         """알림 발송 후 base_price가 현재가로 갱신되는지 확인"""
         mock_price.return_value = 110000  # +10% → 기준 충족
 
@@ -126,17 +141,7 @@ class TestProcessAlert:
             assert result["status"] == "triggered"
             assert alert.base_price == 110000  # 현재가로 갱신됨
 
-    @patch("scripts.check_alert.send_alert_email", return_value=True)
-    @patch("scripts.check_alert.generate_alert_comment", return_value="테스트 코멘트")
-    @patch("scripts.check_alert.get_market_summary", return_value={
-        "kospi": 2650, "kosdaq": 845,
-        "kospi_change": 0, "kosdaq_change": 0,
-        "kospi_change_rate": 0, "kosdaq_change_rate": 0,
-    })
-    @patch("scripts.check_alert.get_stock_price")
-    def test_status_remains_active_after_trigger(
-        self, mock_price, mock_market, mock_llm, mock_email, app, user_and_alert
-    ):
+    def test_status_remains_active_after_trigger(self, mock_price, app, user_and_alert):
         """알림 발송 후 status가 active로 유지되는지 확인"""
         mock_price.return_value = 110000
 
@@ -148,16 +153,8 @@ class TestProcessAlert:
 
             assert alert.status == "active"
 
-    @patch("scripts.check_alert.send_alert_email", return_value=True)
-    @patch("scripts.check_alert.generate_alert_comment", return_value="테스트 코멘트")
-    @patch("scripts.check_alert.get_market_summary", return_value={
-        "kospi": 2650, "kosdaq": 845,
-        "kospi_change": 0, "kosdaq_change": 0,
-        "kospi_change_rate": 0, "kosdaq_change_rate": 0,
-    })
-    @patch("scripts.check_alert.get_stock_price")
     def test_alert_log_records_original_base_price(
-        self, mock_price, mock_market, mock_llm, mock_email, app, user_and_alert
+        self, mock_price, app, user_and_alert
     ):
         """AlertLog에 갱신 전 base_price가 기록되는지 확인"""
         mock_price.return_value = 110000
@@ -175,10 +172,7 @@ class TestProcessAlert:
             assert log.current_price == 110000
             assert log.threshold_type == "upper"
 
-    @patch("scripts.check_alert.get_stock_price")
-    def test_not_triggered_no_base_price_change(
-        self, mock_price, app, user_and_alert
-    ):
+    def test_not_triggered_no_base_price_change(self, mock_price, app, user_and_alert):
         """기준 미충족 시 base_price 변경 없음"""
         mock_price.return_value = 105000  # +5% → 기준 미충족
 
@@ -191,7 +185,6 @@ class TestProcessAlert:
             assert result["status"] == "not_triggered"
             assert alert.base_price == 100000  # 변경 없음
 
-    @patch("scripts.check_alert.get_stock_price")
     def test_price_fetch_failure(self, mock_price, app, user_and_alert):
         """현재가 조회 실패 시 에러 반환"""
         mock_price.return_value = None
@@ -206,16 +199,8 @@ class TestProcessAlert:
             assert result["error"] == "현재가 조회 실패"
             assert alert.base_price == 100000  # 변경 없음
 
-    @patch("scripts.check_alert.send_alert_email", return_value=True)
-    @patch("scripts.check_alert.generate_alert_comment", return_value="테스트 코멘트")
-    @patch("scripts.check_alert.get_market_summary", return_value={
-        "kospi": 2650, "kosdaq": 845,
-        "kospi_change": 0, "kosdaq_change": 0,
-        "kospi_change_rate": 0, "kosdaq_change_rate": 0,
-    })
-    @patch("scripts.check_alert.get_stock_price")
     def test_lower_threshold_trigger_updates_base_price(
-        self, mock_price, mock_market, mock_llm, mock_email, app, user_and_alert
+        self, mock_price, app, user_and_alert
     ):
         """하락 기준 충족 시에도 base_price가 현재가로 갱신되는지 확인"""
         mock_price.return_value = 90000  # -10% → 하락 기준 충족
@@ -233,3 +218,171 @@ class TestProcessAlert:
             log = AlertLog.query.filter_by(alert_id=alert.id).first()
             assert log.threshold_type == "lower"
             assert log.base_price == 100000  # 갱신 전 기준가
+
+    def test_commit_false_leaves_changes_pending(self, mock_price, app, user_and_alert):
+        """commit=False면 세션에만 반영 (check_alerts가 일괄 커밋)"""
+        mock_price.return_value = 110000
+
+        with app.app_context():
+            user, alert = user_and_alert
+            alert = db.session.get(Alert, alert.id)
+
+            result = process_alert(alert, app, commit=False)
+            assert result["status"] == "triggered"
+            assert alert in db.session.dirty
+
+            db.session.rollback()
+            assert AlertLog.query.filter_by(alert_id=alert.id).count() == 0
+            assert db.session.get(Alert, alert.id).base_price == 100000
+
+
+# ============================================================
+# check_alert_batch 테스트
+# ============================================================
+
+
+class TestCheckAlertBatch:
+    """배치 단위 알림 처리 테스트"""
+
+    @pytest.fixture
+    def send_batch(self, monkeypatch):
+        """외부 호출(현재가/LLM/시장 지수) 고정 + 일괄 발송 mock 반환"""
+        monkeypatch.setattr(
+            "scripts.check_alert.get_stock_prices",
+            lambda codes: {"005930": 110000, "000660": 90000, "035720": 100000},
+        )
+        monkeypatch.setattr(
+            "scripts.check_alert.prepare_comments",
+            lambda alerts, prices, app: (None, None),
+        )
+        monkeypatch.setattr(
+            "scripts.check_alert.generate_alert_comment",
+            lambda *args, **kwargs: "테스트 코멘트",
+        )
+        monkeypatch.setattr("scripts.check_alert.get_market_summary", lambda: None)
+        monkeypatch.setattr(
+            "scripts.check_alert.send_alert_email", Mock(side_effect=AssertionError)
+        )
+        send_batch = Mock(return_value=[True, False])
+        monkeypatch.setattr("scripts.check_alert.send_alert_emails_batch", send_batch)
+        return send_batch
+
+    @pytest.fixture
+    def alerts(self, app):
+        """테스트용 활성 Alert 3건 (+10%, -10%, 변동 없음)"""
+        user = User(email="test@example.com", uuid=str(uuid.uuid4()))
+        alerts = [
+            Alert(
+                user=user,
+                stock_code=code,
+                stock_name=name,
+                base_price=100000,
+                threshold_upper=10.0,
+                threshold_lower=-10.0,
+                status="active",
+            )
+            for code, name in [
+                ("005930", "삼성전자"),
+                ("000660", "SK하이닉스"),
+                ("035720", "카카오"),
+            ]
+        ]
+        db.session.add_all(alerts)
+        db.session.commit()
+        return alerts
+
+    @staticmethod
+    def new_result() -> dict:
+        return {
+            "checked": 0,
+            "triggered": 0,
+            "email_sent": 0,
+            "email_failed": 0,
+            "errors": [],
+        }
+
+    def test_triggered_emails_sent_in_one_batch(self, send_batch, alerts, app):
+        """기준 충족 알림 이메일을 한 번에 발송하고 결과대로 AlertLog 기록"""
+        result = self.new_result()
+        check_alert_batch(alerts, app, result)
+
+        send_batch.assert_called_once()
+        items = send_batch.call_args.args[0]
+        assert [item["stock_code"] for item in items] == ["005930", "000660"]
+
+        assert result["checked"] == 3
+        assert result["triggered"] == 2
+        assert result["email_sent"] == 1
+        assert result["email_failed"] == 1
+
+        logs = {log.stock_code: log.email_sent for log in AlertLog.query.all()}
+        assert logs == {"005930": True, "000660": False}
+
+    def test_save_failure_after_send_does_not_resend(
+        self, send_batch, alerts, app, monkeypatch
+    ):
+        """발송 후 저장이 실패해도 기준가는 발송 전에 저장되어 다음 실행에서 재발송 없음"""
+        real_commit = db.session.commit
+        commits = []
+
+        def commit_then_fail():
+            commits.append(None)
+            if len(commits) == 2:  # 발송 결과 저장
+                raise RuntimeError("database is locked")
+            real_commit()
+
+        monkeypatch.setattr(db.session, "commit", commit_then_fail)
+
+        result = self.new_result()
+        check_alert_batch(alerts, app, result)
+        send_batch.assert_called_once()
+        assert result["errors"][0]["error"] == "database is locked"
+
+        # 다음 cron 실행
+        monkeypatch.setattr(db.session, "commit", real_commit)
+        alerts = Alert.query.order_by(Alert.id).all()
+        assert [alert.base_price for alert in alerts] == [110000, 90000, 100000]
+
+        check_alert_batch(alerts, app, self.new_result())
+        send_batch.assert_called_once()
+        assert AlertLog.query.count() == 2
+
+
+# ============================================================
+# iter_active_alert_batches 테스트
+# ============================================================
+
+
+class TestIterActiveAlertBatches:
+    """활성 알림 배치 조회 테스트"""
+
+    def test_batches_cover_active_alerts_in_id_order(self, app):
+        """batch_size 단위로 모든 활성 알림을 id 순으로 조회"""
+        with app.app_context():
+            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
+            db.session.add(user)
+            db.session.flush()
+
+            for i in range(5):
+                db.session.add(
+                    Alert(
+                        user_id=user.id,
+                        stock_code=f"00000{i}",
+                        stock_name=f"종목{i}",
+                        base_price=10000,
+                        threshold_upper=10.0,
+                        threshold_lower=-10.0,
+                        status="inactive" if i == 2 else "active",
+                    )
+                )
+            db.session.commit()
+
+            batches = []
+            for batch in iter_active_alert_batches(batch_size=2):
+                batches.append([alert.stock_code for alert in batch])
+                # 이메일 발송용 사용자는 배치 조회 시 함께 로드 (알림마다 추가 SELECT 없음)
+                assert all("user" not in db.inspect(a).unloaded for a in batch)
+                # 배치 사이 커밋해도 다음 배치 조회에 영향 없음
+                db.session.commit()
+
+        assert batches == [["000000", "000001"], ["000003", "000004"]]
@@ -27,3 +27,10 @@ class TestConfig:
     def test_sqlalchemy_track_modifications_disabled(self):
         """SQLALCHEMY_TRACK_MODIFICATIONS가 비활성화되어 있는지 확인"""
         assert Config.SQLALCHEMY_TRACK_MODIFICATIONS is False
+
+    def test_sqlalchemy_engine_options_pooling(self):
+        """커넥션 풀 옵션이 설정되어 있는지 확인"""
+        options = Config.SQLALCHEMY_ENGINE_OPTIONS
+        assert options["pool_size"] == 10
+        assert options["pool_pre_ping"] is True
+        assert options["connect_args"]["check_same_thread"] is False
@@ -0,0 +1,36 @@
+"""인덱스 마이그레이션 스크립트 테스트 (migrate_indexes.py)"""
+
+from app import db
+from app.config import TestConfig
+from scripts import migrate_indexes as migrate_mod
+
+NEW_INDEXES = {
+    "ix_alerts_user_status_code",
+    "ix_alertlogs_user_sent_desc",
+    "ix_alertlogs_alert_id_sent",
+}
+
+
+class TestMigrateIndexes:
+    """기존 DB 인덱스 추가 테스트"""
+
+    def test_missing_indexes_created(self, monkeypatch, tmp_path):
+        """인덱스 없이 생성된 기존 DB에 모델 인덱스를 모두 추가"""
+
+        class FileDBConfig(TestConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'stock_alarm.db'}"
+            SQLALCHEMY_ENGINE_OPTIONS = {}
+
+        monkeypatch.setattr(migrate_mod, "Config", FileDBConfig)
+
+        # 인덱스가 추가되기 전 스키마의 DB 준비
+        app = migrate_mod.create_app(FileDBConfig, register_routes=False)
+        with app.app_context():
+            db.create_all()
+            for name in NEW_INDEXES:
+                db.session.execute(db.text(f"DROP INDEX {name}"))
+            db.session.commit()
+            db.engine.dispose()
+
+        assert NEW_INDEXES <= set(migrate_mod.migrate_indexes())
+        assert migrate_mod.migrate_indexes() == []
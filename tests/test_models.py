@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime
+from types import SimpleNamespace
 
 import pytest
 
@@ -9,6 +10,26 @@ from app import db
 from app.models import User, Alert, AlertLog
 
 
+@pytest.fixture
+def seeded(app):
+    """관계/로그 테스트 공용 User + Alert (1회 커밋, 정리는 app fixture가 담당)
+
+    app fixture가 push한 앱 컨텍스트(같은 세션)에서 생성하므로
+    사용하는 테스트도 별도 app_context 없이 그대로 접근
+    """
+    user = User(email="test@example.com", uuid=str(uuid.uuid4()))
+    alert = Alert(
+        user=user,
+        stock_code="005930",
+        stock_name="삼성전자",
+        base_price=70000.0,
+    )
+    db.session.add(alert)
+    db.session.commit()
+
+    return SimpleNamespace(user=user, alert=alert)
+
+
 class TestUserModel:
     """User 모델 테스트"""
 
@@ -23,6 +44,17 @@ class TestUserModel:
             assert user.email == "test@example.com"
             assert user.created_at is not None
 
+    def test_created_at_server_default(self, app):
+        """ORM을 거치지 않은 INSERT에도 DB가 created_at을 채움"""
+        with app.app_context():
+            db.session.execute(
+                db.insert(User).values(email="raw@example.com", uuid=str(uuid.uuid4()))
+            )
+            db.session.commit()
+
+            user = User.query.filter_by(email="raw@example.com").one()
+            assert isinstance(user.created_at, datetime)
+
     def test_user_email_unique(self, app):
         """이메일 중복 방지 테스트"""
         with app.app_context():
@@ -65,7 +97,7 @@ class TestAlertModel:
         with app.app_context():
             user = User(email="test@example.com", uuid=str(uuid.uuid4()))
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
 
             alert = Alert(
                 user_id=user.id,
@@ -82,175 +114,111 @@ class TestAlertModel:
             assert alert.status == "active"
             assert alert.triggered_at is None
 
-    def test_alert_default_status(self, app):
+    def test_alert_default_status(self, seeded):
         """알림 기본 상태가 active인지 확인"""
-        with app.app_context():
-            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
-            db.session.add(user)
-            db.session.commit()
+        assert seeded.alert.status == "active"
 
-            alert = Alert(
-                user_id=user.id,
-                stock_code="005930",
-                stock_name="삼성전자",
-                base_price=70000.0,
-            )
-            db.session.add(alert)
-            db.session.commit()
-
-            assert alert.status == "active"
-
-    def test_alert_user_relationship(self, app):
+    def test_alert_user_relationship(self, seeded):
         """알림-사용자 관계 테스트"""
-        with app.app_context():
-            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
-            db.session.add(user)
-            db.session.commit()
+        assert seeded.alert.user == seeded.user
+        assert seeded.alert in seeded.user.alerts
 
-            alert = Alert(
-                user_id=user.id,
-                stock_code="005930",
-                stock_name="삼성전자",
-                base_price=70000.0,
-            )
-            db.session.add(alert)
-            db.session.commit()
-
-            assert alert.user == user
-            assert alert in user.alerts
-
-    def test_alert_cascade_delete(self, app):
+    def test_alert_cascade_delete(self, seeded):
         """사용자 삭제 시 알림도 삭제되는지 확인"""
-        with app.app_context():
-            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
-            db.session.add(user)
-            db.session.commit()
-
-            alert = Alert(
-                user_id=user.id,
-                stock_code="005930",
-                stock_name="삼성전자",
-                base_price=70000.0,
-            )
-            db.session.add(alert)
-            db.session.commit()
-
-            alert_id = alert.id
-            db.session.delete(user)
-            db.session.commit()
+        alert_id = seeded.alert.id
+        db.session.delete(seeded.user)
+        db.session.commit()
 
-            assert Alert.query.get(alert_id) is None
+        assert not db.session.scalar(db.select(db.exists().where(Alert.id == alert_id)))
 
-    def test_alert_repr(self, app):
+    def test_alert_repr(self, seeded):
         """Alert __repr__ 테스트"""
-        with app.app_context():
-            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
-            db.session.add(user)
-            db.session.commit()
-
-            alert = Alert(
-                user_id=user.id,
-                stock_code="005930",
-                stock_name="삼성전자",
-                base_price=70000.0,
-            )
-            assert "삼성전자" in repr(alert)
-            assert "005930" in repr(alert)
+        assert "삼성전자" in repr(seeded.alert)
+        assert "005930" in repr(seeded.alert)
 
 
 class TestAlertLogModel:
     """AlertLog 모델 테스트"""
 
-    def test_create_alert_log(self, app):
+    def test_create_alert_log(self, seeded):
         """알림 로그 생성 테스트"""
-        with app.app_context():
-            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
-            db.session.add(user)
-            db.session.commit()
-
-            alert = Alert(
-                user_id=user.id,
-                stock_code="005930",
-                stock_name="삼성전자",
-                base_price=70000.0,
-            )
-            db.session.add(alert)
-            db.session.commit()
-
-            log = AlertLog(
-                alert_id=alert.id,
-                user_id=user.id,
-                stock_code="005930",
-                base_price=70000.0,
-                current_price=77000.0,
-                change_rate=10.0,
-                threshold_type="upper",
-                email_sent=True,
-            )
-            db.session.add(log)
-            db.session.commit()
-
-            assert log.id is not None
-            assert log.sent_at is not None
-
-    def test_alert_log_relationship(self, app):
+        user, alert = seeded.user, seeded.alert
+
+        log = AlertLog(
+            alert_id=alert.id,
+            user_id=user.id,
+            stock_code="005930",
+            base_price=70000.0,
+            current_price=77000.0,
+            change_rate=10.0,
+            threshold_type="upper",
+            email_sent=True,
+        )
+        db.session.add(log)
+        db.session.commit()
+
+        assert log.id is not None
+        assert log.sent_at is not None
+
+    def test_alert_log_relationship(self, seeded):
         """알림 로그-알림 관계 테스트"""
-        with app.app_context():
-            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
-            db.session.add(user)
-            db.session.commit()
+        user, alert = seeded.user, seeded.alert
+
+        log = AlertLog(
+            alert_id=alert.id,
+            user_id=user.id,
+            stock_code="005930",
+            base_price=70000.0,
+            current_price=77000.0,
+            change_rate=10.0,
+            threshold_type="upper",
+            email_sent=True,
+        )
+        db.session.add(log)
+        db.session.commit()
+
+        assert log.alert == alert
+        assert log in alert.logs
+
+    def test_alert_log_repr(self, seeded):
+        """AlertLog __repr__ 테스트"""
+        user, alert = seeded.user, seeded.alert
 
-            alert = Alert(
-                user_id=user.id,
-                stock_code="005930",
-                stock_name="삼성전자",
-                base_price=70000.0,
-            )
-            db.session.add(alert)
-            db.session.commit()
+        log = AlertLog(
+            alert_id=alert.id,
+            user_id=user.id,
+            stock_code="005930",
+            base_price=70000.0,
+            current_price=77000.0,
+            change_rate=10.0,
+            threshold_type="upper",
+            email_sent=True,
+        )
 
-            log = AlertLog(
-                alert_id=alert.id,
-                user_id=user.id,
-                stock_code="005930",
-                base_price=70000.0,
-                current_price=77000.0,
-                change_rate=10.0,
-                threshold_type="upper",
-                email_sent=True,
-            )
-            db.session.add(log)
-            db.session.commit()
+        assert "005930" in repr(log)
+        assert "10.00" in repr(log)
 
-            assert log.alert == alert
-            assert log in alert.logs
 
-    def test_alert_log_repr(self, app):
-        """AlertLog __repr__ 테스트"""
+class TestIndexes:
+    """복합 인덱스 테스트"""
+
+    def test_composite_indexes_created(self, app):
+        """조회 경로용 복합 인덱스가 생성되는지 확인"""
         with app.app_context():
-            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
-            db.session.add(user)
-            db.session.commit()
+            inspector = db.inspect(db.engine)
+            alert_indexes = {i["name"] for i in inspector.get_indexes("alerts")}
+            log_indexes = {i["name"] for i in inspector.get_indexes("alert_logs")}
 
-            alert = Alert(
-                user_id=user.id,
-                stock_code="005930",
-                stock_name="삼성전자",
-                base_price=70000.0,
-            )
-            db.session.add(alert)
-            db.session.commit()
+            assert "ix_alerts_user_status_code" in alert_indexes
+            assert "ix_alertlogs_user_sent_desc" in log_indexes
+            assert "ix_alertlogs_alert_id_sent" in log_indexes
 
-            log = AlertLog(
-                alert_id=alert.id,
-                user_id=user.id,
-                stock_code="005930",
-                base_price=70000.0,
-                current_price=77000.0,
-                change_rate=10.0,
-                threshold_type="upper",
-                email_sent=True,
-            )
+    def test_user_uuid_lookup_uses_index(self, app):
+        """UUID 조회가 UNIQUE 인덱스 탐색으로 처리되는지 확인"""
+        with app.app_context():
+            plan = db.session.execute(
+                db.text("EXPLAIN QUERY PLAN SELECT id FROM users WHERE uuid = :u"),
+                {"u": "test-uuid"},
+            ).all()
 
-            assert "005930" in repr(log)
-            assert "10.00" in repr(log)
+            assert any("USING" in row[-1] and "INDEX" in row[-1] for row in plan)
@@ -3,6 +3,8 @@
 import uuid
 from unittest.mock import patch
 
+import pytest
+
 from app import db
 from app.models import User
 from app.routes.main import is_valid_email
@@ -11,23 +13,23 @@ from app.routes.main import is_valid_email
 class TestEmailValidation:
     """이메일 유효성 검증 테스트"""
 
-    def test_valid_email(self):
-        """유효한 이메일 형식"""
-        assert is_valid_email("user@example.com") is True
-        assert is_valid_email("test.user@domain.co.kr") is True
-        assert is_valid_email("user+tag@gmail.com") is True
-
-    def test_invalid_email_empty(self):
-        """빈 이메일"""
-        assert is_valid_email("") is False
-        assert is_valid_email(None) is False
-
-    def test_invalid_email_format(self):
-        """잘못된 이메일 형식"""
-        assert is_valid_email("invalid") is False
-        assert is_valid_email("invalid@") is False
-        assert is_valid_email("@domain.com") is False
-        assert is_valid_email("user@domain") is False
+    @pytest.mark.parametrize(
+        "email, expected",
+        [
+            ("user@example.com", True),
+            ("test.user@domain.co.kr", True),
+            ("user+tag@gmail.com", True),
+            ("", False),  # 빈 이메일
+            (None, False),
+            ("invalid", False),  # 잘못된 이메일 형식
+            ("invalid@", False),
+            ("@domain.com", False),
+            ("user@domain", False),
+        ],
+    )
+    def test_email_validation(self, email, expected):
+        """이메일 형식 검증"""
+        assert is_valid_email(email) is expected
 
 
 class TestHomeRoute:
@@ -62,7 +64,7 @@ class TestRegisterRoute:
         assert response.status_code == 200
         assert "올바른 이메일 주소를 입력해주세요".encode("utf-8") in response.data
 
-    @patch("app.routes.main.send_welcome_email")
+    @patch("app.services.mail.send_welcome_email")
     def test_register_new_user_success(self, mock_send_email, app, client):
         """신규 사용자 등록 성공"""
         mock_send_email.return_value = True
@@ -72,9 +74,7 @@ class TestRegisterRoute:
         )
 
         assert response.status_code == 200
-        assert (
-            "설정 페이지 URL이 이메일로 발송되었습니다".encode("utf-8") in response.data
-        )
+        assert "이메일 발송이 요청되었습니다".encode("utf-8") in response.data
 
         # DB에 사용자가 생성되었는지 확인
         with app.app_context():
@@ -85,7 +85,7 @@ class TestRegisterRoute:
         # 이메일 발송 함수가 호출되었는지 확인
         mock_send_email.assert_called_once()
 
-    @patch("app.routes.main.send_welcome_email")
+    @patch("app.services.mail.send_welcome_email")
     def test_register_existing_user_success(self, mock_send_email, app, client):
         """기존 사용자 재등록 시 기존 UUID 사용"""
         mock_send_email.return_value = True
@@ -102,18 +102,21 @@ class TestRegisterRoute:
         )
 
         assert response.status_code == 200
-        assert (
-            "설정 페이지 URL이 이메일로 발송되었습니다".encode("utf-8") in response.data
-        )
+        assert "이메일 발송이 요청되었습니다".encode("utf-8") in response.data
 
         # UUID가 변경되지 않았는지 확인
         with app.app_context():
             user = User.query.filter_by(email="existing@example.com").first()
             assert user.uuid == existing_uuid
 
-    @patch("app.routes.main.send_welcome_email")
+        # 설정 페이지 절대 URL 전달
+        mock_send_email.assert_called_once_with(
+            "existing@example.com", f"http://localhost/settings/{existing_uuid}"
+        )
+
+    @patch("app.services.mail.send_welcome_email")
     def test_register_email_send_failure(self, mock_send_email, client):
-        """이메일 발송 실패 시 에러 메시지"""
+        """발송 실패 시 발송 완료로 안내하지 않음 (요청 사실만 안내)"""
         mock_send_email.return_value = False
 
         response = client.post(
@@ -121,11 +124,13 @@ class TestRegisterRoute:
         )
 
         assert response.status_code == 200
-        assert "이메일 발송에 실패했습니다".encode("utf-8") in response.data
+        assert "이메일 발송이 요청되었습니다".encode("utf-8") in response.data
+        assert "이메일로 발송되었습니다".encode("utf-8") not in response.data
+        mock_send_email.assert_called_once()
 
     def test_register_redirects_to_home(self, client):
         """등록 후 홈페이지로 리다이렉트"""
-        with patch("app.routes.main.send_welcome_email", return_value=True):
+        with patch("app.services.mail.send_welcome_email", return_value=True):
             response = client.post(
                 "/register", data={"email": "user@example.com"}, follow_redirects=False
             )
@@ -149,3 +154,36 @@ class TestMailService:
                 "test@example.com", "http://example.com/settings/abc"
             )
             assert result is False
+
+    def test_submit_mail_runs_in_background_with_app_context(self, app):
+        """백그라운드 큐: 워커 스레드에서 앱 컨텍스트와 함께 실행"""
+        import threading
+
+        from flask import current_app
+
+        from app.services.mail_queue import submit_mail
+
+        main_thread = threading.current_thread()
+
+        def fake_send(email):
+            return current_app.name, threading.current_thread() is main_thread, email
+
+        with app.app_context():
+            app.config["MAIL_BACKGROUND"] = True
+            future = submit_mail(fake_send, "test@example.com")
+
+        assert future.result(timeout=5) == (app.name, False, "test@example.com")
+
+    def test_submit_mail_sync_exception_in_future(self, app):
+        """동기 모드: 예외를 호출 측으로 던지지 않고 Future에 담음"""
+        from app.services.mail_queue import submit_mail
+
+        def fake_send(email):
+            raise RuntimeError("SMTP 오류")
+
+        with app.app_context():
+            app.config["MAIL_BACKGROUND"] = False
+            future = submit_mail(fake_send, "test@example.com")
+
+        with pytest.raises(RuntimeError, match="SMTP 오류"):
+            future.result()
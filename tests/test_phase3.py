@@ -12,7 +12,9 @@ from app.services.stock import (
     validate_stock_code,
     search_stock,
     get_stock_name,
+    find_stock,
     get_stock_price,
+    get_stock_prices,
     get_stock_info,
     get_market_summary,
 )
@@ -25,26 +27,25 @@ from app.services.stock import (
 class TestStockCodeFormat:
     """종목코드 형식 검증 테스트"""
 
-    def test_valid_stock_code_format(self):
-        """유효한 종목코드 형식"""
-        assert is_valid_stock_code_format("005930") is True
-        assert is_valid_stock_code_format("000660") is True
-        assert is_valid_stock_code_format("123456") is True
-
-    def test_invalid_stock_code_format_empty(self):
-        """빈 종목코드"""
-        assert is_valid_stock_code_format("") is False
-        assert is_valid_stock_code_format(None) is False
-
-    def test_invalid_stock_code_format_wrong_length(self):
-        """잘못된 길이"""
-        assert is_valid_stock_code_format("12345") is False
-        assert is_valid_stock_code_format("1234567") is False
-
-    def test_invalid_stock_code_format_non_numeric(self):
-        """숫자가 아닌 문자"""
-        assert is_valid_stock_code_format("00593A") is False
-        assert is_valid_stock_code_format("ABCDEF") is False
+    @pytest.mark.parametrize(
+        "stock_code, expected",
+        [
+            ("005930", True),
+            ("000660", True),
+            ("123456", True),
+            ("", False),  # 빈 종목코드
+            (None, False),
+            ("12345", False),  # 잘못된 길이
+            ("1234567", False),
+            ("00593A", False),  # 숫자가 아닌 문자
+            ("ABCDEF", False),
+            ("００５９３０", False),  # 전각 숫자
+            ("00593²", False),
+        ],
+    )
+    def test_stock_code_format(self, stock_code, expected):
+        """종목코드 형식 검증 (6자리 ASCII 숫자)"""
+        assert is_valid_stock_code_format(stock_code) is expected
 
 
 # ============================================================
@@ -52,9 +53,9 @@ class TestStockCodeFormat:
 # ============================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_stock_list():
-    """Mock 종목 리스트"""
+    """Mock 종목 리스트 (세션 공유 - 같은 객체라 서비스의 코드/검색 인덱스도 재사용)"""
     return [
         {"code": "005930", "name": "삼성전자", "market": "KOSPI"},
         {"code": "000660", "name": "SK하이닉스", "market": "KOSPI"},
@@ -116,6 +117,19 @@ class TestSearchStock:
             assert len(results) == 1
             assert results[0]["name"] == "삼성전자"
 
+    @patch("app.services.stock._get_stock_list")
+    def test_search_case_insensitive_with_limit(self, mock_get_list, app):
+        """영문 종목명 대소문자 무시, limit개까지만 반환"""
+        mock_get_list.return_value = [
+            {"code": "069500", "name": "KODEX 200", "market": "ETF"},
+            {"code": "122630", "name": "KODEX 레버리지", "market": "ETF"},
+            {"code": "102110", "name": "TIGER 200", "market": "ETF"},
+        ]
+
+        with app.app_context():
+            results = search_stock("kodex", limit=1)
+            assert [r["code"] for r in results] == ["069500"]
+
     @patch("app.services.stock._get_stock_list")
     def test_search_empty_query(self, mock_get_list, app, mock_stock_list):
         """빈 검색어"""
@@ -146,6 +160,146 @@ class TestGetStockName:
         with app.app_context():
             assert get_stock_name("999999") is None
 
+    @patch("app.services.stock._get_stock_list")
+    def test_stock_index_rebuilt_on_list_change(
+        self, mock_get_list, app, mock_stock_list
+    ):
+        """종목 리스트가 교체되면 코드 인덱스도 새로 생성"""
+        mock_get_list.return_value = mock_stock_list
+
+        with app.app_context():
+            assert get_stock_name("373220") is None
+
+            mock_get_list.return_value = mock_stock_list + [
+                {"code": "373220", "name": "LG에너지솔루션", "market": "KOSPI"}
+            ]
+            assert get_stock_name("373220") == "LG에너지솔루션"
+
+
+class TestFindStock:
+    """종목 조회 (검증 + 종목명) 테스트"""
+
+    @patch("app.services.stock._get_stock_list")
+    def test_find_stock_success(self, mock_get_list, app, mock_stock_list):
+        """존재하는 종목코드는 종목 정보 반환"""
+        mock_get_list.return_value = mock_stock_list
+
+        with app.app_context():
+            stock = find_stock(" 005930 ")
+            assert stock == {"code": "005930", "name": "삼성전자", "market": "KOSPI"}
+
+    @patch("app.services.stock._get_stock_list")
+    def test_find_stock_invalid(self, mock_get_list, app, mock_stock_list):
+        """형식 오류/미존재 종목코드는 None"""
+        mock_get_list.return_value = mock_stock_list
+
+        with app.app_context():
+            assert find_stock("999999") is None
+            assert find_stock("12345") is None
+            assert find_stock("") is None
+
+
+class TestStockListCache:
+    """종목 리스트 캐시 로드/워밍 테스트"""
+
+    @patch("FinanceDataReader.StockListing", side_effect=Exception("KRX 오류"))
+    def test_stale_list_used_when_reload_fails(
+        self, mock_listing, app, mock_stock_list, monkeypatch, tmp_path
+    ):
+        """날짜가 지난 목록 재로드 실패 시 이전 목록 유지"""
+        import app.services.stock as stock_mod
+
+        monkeypatch.setattr(stock_mod, "_stock_list_cache", mock_stock_list)
+        monkeypatch.setattr(stock_mod, "_stock_list_cache_date", "2000-01-01")
+        monkeypatch.setattr(stock_mod, "_stock_list_retry_at", 0.0)
+        monkeypatch.setattr(
+            stock_mod, "_stock_list_path", lambda: tmp_path / "stock_list.json"
+        )
+
+        with app.app_context():
+            assert stock_mod._get_stock_list() is mock_stock_list
+
+    def test_reload_retried_once_per_interval(
+        self, app, mock_stock_list, monkeypatch, tmp_path
+    ):
+        """FDR 실패 후 재시도 간격 동안은 다시 조회하지 않음"""
+        import app.services.stock as stock_mod
+
+        monkeypatch.setattr(stock_mod, "_stock_list_cache", mock_stock_list)
+        monkeypatch.setattr(stock_mod, "_stock_list_cache_date", "2000-01-01")
+        monkeypatch.setattr(stock_mod, "_stock_list_retry_at", 0.0)
+        monkeypatch.setattr(
+            stock_mod, "_stock_list_path", lambda: tmp_path / "stock_list.json"
+        )
+
+        with app.app_context():
+            with patch(
+                "app.services.stock.fetch_stock_list",
+                side_effect=Exception("KRX 오류"),
+            ) as mock_fetch:
+                assert stock_mod._get_stock_list() is mock_stock_list
+                assert stock_mod._get_stock_list() is mock_stock_list
+            mock_fetch.assert_called_once()
+
+    def test_fetched_list_shared_via_file(
+        self, app, mock_stock_list, monkeypatch, tmp_path
+    ):
+        """FDR로 조회한 목록을 파일로 저장해 다른 워커가 재사용"""
+        import app.services.stock as stock_mod
+
+        path = tmp_path / "stock_list.json"
+        monkeypatch.setattr(stock_mod, "_stock_list_cache", None)
+        monkeypatch.setattr(stock_mod, "_stock_list_cache_date", None)
+        monkeypatch.setattr(stock_mod, "_stock_list_retry_at", 0.0)
+        monkeypatch.setattr(stock_mod, "_stock_list_path", lambda: path)
+
+        with app.app_context():
+            with patch(
+                "app.services.stock.fetch_stock_list", return_value=mock_stock_list
+            ) as mock_fetch:
+                assert stock_mod._get_stock_list() == mock_stock_list
+            mock_fetch.assert_called_once()
+            assert path.exists()
+
+            # 다른 워커(메모리 캐시 없음)는 파일에서 로드
+            monkeypatch.setattr(stock_mod, "_stock_list_cache", None)
+            with patch("app.services.stock.fetch_stock_list") as mock_fetch:
+                assert stock_mod._get_stock_list() == mock_stock_list
+            mock_fetch.assert_not_called()
+
+    @patch("FinanceDataReader.StockListing")
+    def test_fetch_stock_list(self, mock_listing):
+        """KOSPI/KOSDAQ/ETF 목록을 합치고 중복 종목코드는 처음 것만 유지"""
+        import pandas as pd
+
+        from app.services.stock import fetch_stock_list
+
+        listings = {
+            "KOSPI": pd.DataFrame({"Code": ["005930 "], "Name": [" 삼성전자"]}),
+            "KOSDAQ": pd.DataFrame(
+                {"Code": ["035720", "005930"], "Name": ["카카오", "중복"]}
+            ),
+            "ETF/KR": pd.DataFrame({"Symbol": ["069500"], "Name": ["KODEX 200"]}),
+        }
+        mock_listing.side_effect = lambda market: listings[market]
+
+        assert fetch_stock_list() == [
+            {"code": "005930", "name": "삼성전자", "market": "KOSPI"},
+            {"code": "035720", "name": "카카오", "market": "KOSDAQ"},
+            {"code": "069500", "name": "KODEX 200", "market": "ETF"},
+        ]
+
+    @patch("app.services.stock._get_stock_list")
+    def test_warm_stock_list(self, mock_get_list, app):
+        """워밍 스레드가 앱 컨텍스트에서 종목 리스트 로드"""
+        from app.services.stock import warm_stock_list
+
+        thread = warm_stock_list(app)
+        thread.join(timeout=5)
+
+        assert thread.daemon
+        mock_get_list.assert_called_once()
+
 
 # ============================================================
 # 네이버 API 테스트 (Mock)
@@ -155,7 +309,7 @@ class TestGetStockName:
 class TestGetStockPrice:
     """현재가 조회 테스트"""
 
-    @patch("app.services.stock.requests.get")
+    @patch("app.services.stock._session.get")
     def test_get_stock_price_success(self, mock_get, app):
         """현재가 조회 성공"""
         mock_response = MagicMock()
@@ -168,7 +322,7 @@ class TestGetStockPrice:
             price = get_stock_price("005930")
             assert price == 70000.0
 
-    @patch("app.services.stock.requests.get")
+    @patch("app.services.stock._session.get")
     def test_get_stock_price_numeric(self, mock_get, app):
         """현재가 조회 성공 (숫자 형식)"""
         mock_response = MagicMock()
@@ -180,7 +334,21 @@ class TestGetStockPrice:
             price = get_stock_price("005930")
             assert price == 70000.0
 
-    @patch("app.services.stock.requests.get")
+    @patch("app.services.stock._session.get")
+    def test_get_stock_price_cached(self, mock_get, app):
+        """TTL 이내 재조회 시 API 호출 없이 캐시 반환"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"closePrice": "70,000"}
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+
+        with app.app_context():
+            assert get_stock_price("005930") == 70000.0
+            assert get_stock_price("005930") == 70000.0
+
+        assert mock_get.call_count == 1
+
+    @patch("app.services.stock._session.get")
     def test_get_stock_price_api_error(self, mock_get, app):
         """API 오류 시 None 반환"""
         import requests
@@ -192,10 +360,104 @@ class TestGetStockPrice:
             assert price is None
 
 
+class TestGetStockPrices:
+    """현재가 일괄 조회 테스트"""
+
+    @patch("app.services.stock.get_stock_price")
+    def test_get_stock_prices_dedup(self, mock_price, app):
+        """중복 종목코드는 한 번만 조회"""
+        mock_price.side_effect = lambda code: {"005930": 70000.0}.get(code)
+
+        with app.app_context():
+            prices = get_stock_prices(["005930", "000660", "005930"])
+
+        assert prices == {"005930": 70000.0, "000660": None}
+        assert mock_price.call_count == 2
+
+    @patch("app.services.stock.get_stock_price")
+    def test_get_stock_prices_exception(self, mock_price, app):
+        """개별 조회 예외 시 해당 종목만 None"""
+        mock_price.side_effect = [Exception("API 오류"), 120000.0]
+
+        with app.app_context():
+            prices = get_stock_prices(["005930", "000660"])
+
+        assert None in prices.values()
+        assert 120000.0 in prices.values()
+
+    def test_get_stock_prices_empty(self, app):
+        """빈 목록"""
+        with app.app_context():
+            assert get_stock_prices([]) == {}
+
+
+class TestNaverSession:
+    """네이버 API 공용 세션 테스트"""
+
+    def test_session_mounts_pooled_adapter(self):
+        """https 요청에 연결 풀/재시도 어댑터 사용"""
+        from app.services.stock import (
+            MAX_PRICE_WORKERS,
+            NAVER_API_BATCH_MAX_RETRIES,
+            NAVER_API_MAX_RETRIES,
+            _batch_session,
+            _session,
+        )
+
+        adapter = _session.get_adapter("https://m.stock.naver.com/api")
+        assert adapter._pool_maxsize == MAX_PRICE_WORKERS
+        assert adapter.max_retries.total == NAVER_API_MAX_RETRIES == 1
+        assert adapter.max_retries.respect_retry_after_header is False
+        assert 429 in adapter.max_retries.status_forcelist
+
+        # cron 배치용 세션은 재시도 예산이 더 큼
+        adapter = _batch_session.get_adapter("https://m.stock.naver.com/api")
+        assert adapter.max_retries.total == NAVER_API_BATCH_MAX_RETRIES
+        assert adapter.max_retries.respect_retry_after_header is True
+
+    def test_batch_mode_uses_batch_session(self, monkeypatch):
+        """use_batch_naver_session() 이후 배치용 세션과 긴 읽기 타임아웃 사용"""
+        import app.services.stock as stock_mod
+
+        monkeypatch.setattr(stock_mod, "_batch_mode", False)
+        with (
+            patch.object(stock_mod._batch_session, "get") as mock_batch_get,
+            patch.object(stock_mod._session, "get") as mock_get,
+        ):
+            stock_mod._get_json("https://m.stock.naver.com/api/stock/005930/basic")
+            stock_mod.use_batch_naver_session()
+            stock_mod._get_json("https://m.stock.naver.com/api/stock/005930/basic")
+
+        assert mock_get.call_args.kwargs["timeout"] == stock_mod.NAVER_API_TIMEOUT
+        assert (
+            mock_batch_get.call_args.kwargs["timeout"]
+            == stock_mod.NAVER_API_BATCH_TIMEOUT
+        )
+
+    def test_retry_logs_warning(self, caplog):
+        """재시도 시 WARNING 로그 기록 및 지터 포함 백오프"""
+        from app.services.stock import NAVER_API_BATCH_RETRY
+
+        response = MagicMock(status=503)
+        response.get_redirect_location.return_value = None
+        response.headers = {}
+
+        with caplog.at_level("WARNING", logger="app.services.stock"):
+            retry = NAVER_API_BATCH_RETRY.increment(
+                "GET", "/api/stock/005930/basic", response=response
+            )
+            retry = retry.increment("GET", "/api/stock/005930/basic", response=response)
+
+        assert "재시도 1/3" in caplog.text
+        assert "재시도 2/3" in caplog.text
+        # 두 번째 재시도 백오프: 0.5 * 2^1 = 1초 + 지터(0~0.5초)
+        assert 1.0 <= retry.get_backoff_time() <= 1.5
+
+
 class TestGetMarketSummary:
     """시장 지수 조회 테스트"""
 
-    @patch("app.services.stock.requests.get")
+    @patch("app.services.stock._session.get")
     def test_get_market_summary_success(self, mock_get, app):
         """시장 지수 조회 성공"""
 
@@ -224,6 +486,28 @@ class TestGetMarketSummary:
             assert summary["kospi"] == 2650.42
             assert summary["kosdaq"] == 845.67
 
+            # TTL 이내 재호출은 캐시에서 반환 (추가 요청 없음)
+            assert get_market_summary() == summary
+        assert mock_get.call_count == 2
+
+    @patch("app.services.stock._session.get")
+    def test_get_market_summary_request_failure(self, mock_get, app):
+        """지수 요청 중 하나라도 실패하면 None"""
+        import requests
+
+        def mock_response_factory(url, **kwargs):
+            if "KOSDAQ" in url:
+                raise requests.exceptions.ConnectionError("연결 실패")
+            mock_resp = MagicMock()
+            mock_resp.json.return_value = {"closePrice": 2650.42}
+            return mock_resp
+
+        mock_get.side_effect = mock_response_factory
+
+        with app.app_context():
+            assert get_market_summary() is None
+        assert mock_get.call_count == 2
+
 
 # ============================================================
 # 설정 페이지 라우트 테스트
@@ -245,6 +529,66 @@ class TestSettingsPage:
         assert response.status_code == 200
         assert b"test@example.com" in response.data
 
+    @patch("app.services.stock.get_stock_prices")
+    def test_settings_page_with_alerts(self, mock_prices, app, client):
+        """현재가를 일괄 조회하여 변동률 표시"""
+        mock_prices.return_value = {"005930": 77000.0}
+
+        with app.app_context():
+            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
+            db.session.add(user)
+            db.session.flush()
+            alert = Alert(
+                user_id=user.id,
+                stock_code="005930",
+                stock_name="삼성전자",
+                base_price=70000.0,
+                threshold_upper=10.0,
+                status="active",
+            )
+            db.session.add(alert)
+            db.session.commit()
+            user_uuid = user.uuid
+
+        response = client.get(f"/settings/{user_uuid}")
+        assert response.status_code == 200
+        assert b"77,000" in response.data
+        mock_prices.assert_called_once_with(["005930"])
+
+    @patch("app.services.stock.get_stock_prices", return_value={})
+    def test_settings_page_stats(self, mock_prices, app, client):
+        """상태별 알림 통계 집계"""
+        with app.app_context():
+            user = User(email="test@example.com", uuid=str(uuid.uuid4()))
+            db.session.add(user)
+            db.session.flush()
+            for code, status in [
+                ("005930", "active"),
+                ("000660", "active"),
+                ("035720", "inactive"),
+            ]:
+                db.session.add(
+                    Alert(
+                        user_id=user.id,
+                        stock_code=code,
+                        stock_name=code,
+                        base_price=10000.0,
+                        status=status,
+                    )
+                )
+            db.session.commit()
+            user_uuid = user.uuid
+
+        with app.test_request_context():
+            from app.routes import settings as settings_routes
+
+            with patch.object(settings_routes, "render_template") as mock_render:
+                mock_render.return_value = ""
+                settings_routes.settings_page(user_uuid)
+
+        stats = mock_render.call_args.kwargs["stats"]
+        assert stats == {"total": 3, "active": 2, "triggered": 0, "inactive": 1}
+
     def test_settings_page_with_invalid_uuid(self, client):
         """유효하지 않은 UUID로 설정 페이지 접근"""
         response = client.get("/settings/invalid-uuid")
@@ -291,15 +635,15 @@ class TestAddAlert:
         assert response.status_code == 200
         assert "종목코드는 6자리 숫자여야 합니다".encode("utf-8") in response.data
 
-    @patch("app.routes.settings.get_stock_price")
-    @patch("app.routes.settings.get_stock_name")
-    @patch("app.routes.settings.validate_stock_code")
-    def test_add_alert_no_threshold(
-        self, mock_validate, mock_name, mock_price, app, client
-    ):
+    @patch("app.services.stock.get_stock_price")
+    @patch("app.services.stock.find_stock")
+    def test_add_alert_no_threshold(self, mock_find, mock_price, app, client):
         """알림 기준 없이 추가 시 기본값 ±10% 적용"""
-        mock_validate.return_value = True
-        mock_name.return_value = "삼성전자"
+        mock_find.return_value = {
+            "code": "005930",
+            "name": "삼성전자",
+            "market": "KOSPI",
+        }
         mock_price.return_value = 70000
 
         with app.app_context():
@@ -323,10 +667,10 @@ class TestAddAlert:
             assert alert.threshold_upper == 10.0
             assert alert.threshold_lower == -10.0
 
-    @patch("app.routes.settings.validate_stock_code")
-    def test_add_alert_invalid_stock_code(self, mock_validate, app, client):
+    @patch("app.services.stock.find_stock")
+    def test_add_alert_invalid_stock_code(self, mock_find, app, client):
         """유효하지 않은 종목코드"""
-        mock_validate.return_value = False
+        mock_find.return_value = None
 
         with app.app_context():
             user = User(email="test@example.com", uuid=str(uuid.uuid4()))
@@ -342,15 +686,15 @@ class TestAddAlert:
         assert response.status_code == 200
         assert "유효하지 않은 종목코드입니다".encode("utf-8") in response.data
 
-    @patch("app.routes.settings.get_stock_price")
-    @patch("app.routes.settings.get_stock_name")
-    @patch("app.routes.settings.validate_stock_code")
-    def test_add_alert_success(
-        self, mock_validate, mock_get_name, mock_get_price, app, client
-    ):
+    @patch("app.services.stock.get_stock_price")
+    @patch("app.services.stock.find_stock")
+    def test_add_alert_success(self, mock_find, mock_get_price, app, client):
         """종목 추가 성공"""
-        mock_validate.return_value = True
-        mock_get_name.return_value = "삼성전자"
+        mock_find.return_value = {
+            "code": "005930",
+            "name": "삼성전자",
+            "market": "KOSPI",
+        }
         mock_get_price.return_value = 70000.0
 
         with app.app_context():
@@ -384,21 +728,21 @@ class TestAddAlert:
             assert alert.threshold_lower == -10.0
             assert alert.status == "active"
 
-    @patch("app.routes.settings.get_stock_price")
-    @patch("app.routes.settings.get_stock_name")
-    @patch("app.routes.settings.validate_stock_code")
-    def test_add_alert_duplicate(
-        self, mock_validate, mock_get_name, mock_get_price, app, client
-    ):
+    @patch("app.services.stock.get_stock_price")
+    @patch("app.services.stock.find_stock")
+    def test_add_alert_duplicate(self, mock_find, mock_get_price, app, client):
         """중복 종목 추가 시 에러"""
-        mock_validate.return_value = True
-        mock_get_name.return_value = "삼성전자"
+        mock_find.return_value = {
+            "code": "005930",
+            "name": "삼성전자",
+            "market": "KOSPI",
+        }
         mock_get_price.return_value = 70000.0
 
         with app.app_context():
             user = User(email="test@example.com", uuid=str(uuid.uuid4()))
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
 
             # 기존 Alert 추가
             alert = Alert(
@@ -435,7 +779,7 @@ class TestDeleteAlert:
         with app.app_context():
             user = User(email="test@example.com", uuid=str(uuid.uuid4()))
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
 
             alert = Alert(
                 user_id=user.id,
@@ -460,10 +804,11 @@ class TestDeleteAlert:
             "삼성전자 (005930) 종목이 삭제되었습니다".encode("utf-8") in response.data
         )
 
-        # DB 확인
+        # DB 확인 (행 조회 없이 EXISTS만 확인)
         with app.app_context():
-            alert = db.session.get(Alert, alert_id)
-            assert alert is None
+            assert not db.session.scalar(
+                db.select(db.exists().where(Alert.id == alert_id))
+            )
 
     def test_delete_alert_not_found(self, app, client):
         """존재하지 않는 Alert 삭제"""
@@ -8,6 +8,7 @@ from app.services.llm import (
     get_fallback_comment,
     generate_alert_comment,
     _format_prompt,
+    DEFAULT_PROMPT_TEMPLATE,
     PROMPT_TEMPLATE_PATH,
 )
 
@@ -23,14 +24,27 @@ class TestLoadPromptTemplate:
             assert "종목명" in template
             assert "변동률" in template
 
+    def test_load_prompt_template_cached(self, app):
+        """템플릿 파일은 한 번만 읽고 이후 캐시 사용"""
+        from app.services.llm import _read_prompt_template
+
+        _read_prompt_template.cache_clear()
+        with app.app_context():
+            first = load_prompt_template()
+            second = load_prompt_template()
+
+        assert first == second
+        info = _read_prompt_template.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
     def test_load_prompt_template_file_not_found(self, app):
         """템플릿 파일 없을 때 기본 프롬프트 반환"""
         with app.app_context():
             with patch("app.services.llm.PROMPT_TEMPLATE_PATH", "/nonexistent/path.txt"):
                 # 파일이 없어도 기본 프롬프트 반환
                 template = load_prompt_template()
-                assert template is not None
-                assert "주식 시장 분석가" in template
+                assert template == DEFAULT_PROMPT_TEMPLATE
 
 
 class TestGetFallbackComment:
@@ -156,6 +170,28 @@ class TestGenerateAlertComment:
             assert "삼성전자" in result
             mock_client.chat.completions.create.assert_called_once()
 
+    @patch("app.services.llm.OpenAI")
+    def test_client_reused_across_calls(self, mock_openai_class, app, market_summary):
+        """같은 API 키로 여러 번 호출해도 클라이언트는 1회만 생성"""
+        with app.app_context():
+            app.config["OPENAI_API_KEY"] = "test-api-key"
+
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = "코멘트"
+            mock_openai_class.return_value.chat.completions.create.return_value = (
+                mock_response
+            )
+
+            for _ in range(3):
+                generate_alert_comment(
+                    "삼성전자", "005930", 5.23, "upper", market_summary
+                )
+
+            mock_openai_class.assert_called_once_with(
+                api_key="test-api-key", timeout=30
+            )
+
     @patch("app.services.llm.OpenAI")
     def test_generate_comment_auth_error(self, mock_openai_class, app, market_summary):
         """인증 오류 시 None 반환 (재시도 없음)"""
@@ -180,10 +216,20 @@ class TestGenerateAlertComment:
             # 재시도 없이 1번만 호출
             assert mock_client.chat.completions.create.call_count == 1
 
+            # 쿨다운 동안 같은 키로는 API 호출 없이 바로 None
+            assert (
+                generate_alert_comment(
+                    "SK하이닉스", "000660", 5.0, "upper", market_summary
+                )
+                is None
+            )
+            assert mock_client.chat.completions.create.call_count == 1
+
+    @patch("app.services.llm.random.uniform", return_value=0)
     @patch("app.services.llm.OpenAI")
     @patch("app.services.llm.time.sleep")
     def test_generate_comment_retry_then_success(
-        self, mock_sleep, mock_openai_class, app, market_summary
+        self, mock_sleep, mock_openai_class, mock_jitter, app, market_summary
     ):
         """재시도 후 성공"""
         from openai import APIConnectionError
@@ -213,10 +259,11 @@ class TestGenerateAlertComment:
             assert mock_client.chat.completions.create.call_count == 2
             mock_sleep.assert_called_once_with(1)  # BASE_RETRY_DELAY * 2^0
 
+    @patch("app.services.llm.random.uniform", return_value=0)
     @patch("app.services.llm.OpenAI")
     @patch("app.services.llm.time.sleep")
     def test_generate_comment_all_retries_fail(
-        self, mock_sleep, mock_openai_class, app, market_summary
+        self, mock_sleep, mock_openai_class, mock_jitter, app, market_summary
     ):
         """모든 재시도 실패 시 폴백 코멘트 반환"""
         from openai import APIConnectionError
@@ -243,10 +290,11 @@ class TestGenerateAlertComment:
             # 재시도 대기: 1초, 2초
             assert mock_sleep.call_count == 2
 
+    @patch("app.services.llm.random.uniform", return_value=0)
     @patch("app.services.llm.OpenAI")
     @patch("app.services.llm.time.sleep")
     def test_generate_comment_rate_limit(
-        self, mock_sleep, mock_openai_class, app, market_summary
+        self, mock_sleep, mock_openai_class, mock_jitter, app, market_summary
     ):
         """Rate Limit 오류 시 지수 백오프 재시도"""
         from openai import RateLimitError
@@ -311,6 +359,77 @@ class TestGenerateAlertComment:
             assert "하락" in result
 
 
+class TestGenerateAlertCommentsBatch:
+    """코멘트 일괄 생성 테스트"""
+
+    def test_batch_preserves_order_and_isolates_errors(self, app):
+        """입력 순서대로 결과 반환, 개별 예외는 None"""
+        from app.services.llm import generate_alert_comments_batch
+
+        def fake_generate(stock_name, **kwargs):
+            if stock_name == "카카오":
+                raise RuntimeError("boom")
+            return f"{stock_name} 코멘트"
+
+        items = [
+            {
+                "stock_name": name,
+                "stock_code": code,
+                "change_rate": 5.0,
+                "threshold_type": "upper",
+                "market_summary": {},
+            }
+            for name, code in [
+                ("삼성전자", "005930"),
+                ("카카오", "035720"),
+                ("SK하이닉스", "000660"),
+            ]
+        ]
+
+        with app.app_context():
+            with patch(
+                "app.services.llm.generate_alert_comment", side_effect=fake_generate
+            ):
+                result = generate_alert_comments_batch(items)
+
+        assert result == ["삼성전자 코멘트", None, "SK하이닉스 코멘트"]
+
+    def test_batch_empty(self, app):
+        """빈 입력"""
+        from app.services.llm import generate_alert_comments_batch
+
+        with app.app_context():
+            assert generate_alert_comments_batch([]) == []
+
+
+class TestRequestRateLimiter:
+    """분당 요청 수 제한 테스트"""
+
+    def test_acquire_waits_when_limit_reached(self):
+        """한도 도달 시 가장 오래된 요청이 윈도우를 벗어날 때까지 대기"""
+        from app.services.llm import _RequestRateLimiter
+
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        limiter = _RequestRateLimiter(period=60.0)
+        with patch("app.services.llm.time.monotonic", side_effect=lambda: clock[0]):
+            with patch(
+                "app.services.llm.time.sleep", side_effect=fake_sleep
+            ) as mock_sleep:
+                limiter.acquire(2)
+                clock[0] += 10
+                limiter.acquire(2)
+                mock_sleep.assert_not_called()
+
+                # 3번째 요청: 첫 요청(100초) + 60초까지 대기
+                limiter.acquire(2)
+                mock_sleep.assert_called_once_with(50.0)
+                assert clock[0] == 160.0
+
+
 class TestIntegration:
     """통합 테스트"""
 
@@ -359,4 +478,5 @@ class TestIntegration:
                 # API 호출 검증
                 call_args = mock_client.chat.completions.create.call_args
                 assert call_args.kwargs["model"] == "gpt-5-nano"
-                assert call_args.kwargs["max_completion_tokens"] == 2000
+                assert call_args.kwargs["max_completion_tokens"] == 600
+                assert call_args.kwargs["reasoning_effort"] == "minimal"
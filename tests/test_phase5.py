@@ -13,7 +13,7 @@ sys.path.insert(0, str(project_root))
 
 from app import db
 from app.models import User, Alert, AlertLog
-from app.services.mail import send_alert_email
+from app.services.mail import send_alert_email, send_alert_emails_batch
 from scripts.check_alert import is_threshold_reached, process_alert, check_alerts
 
 
@@ -33,7 +33,7 @@ class TestIsThresholdReached:
                 status="active",
             )
             # 5.0% 상승 (70000 -> 73500)
-            reached, threshold_type = is_threshold_reached(alert, 73500)
+            reached, threshold_type, _ = is_threshold_reached(alert, 73500)
             assert reached is True
             assert threshold_type == "upper"
 
@@ -50,7 +50,7 @@ class TestIsThresholdReached:
                 status="active",
             )
             # 4.0% 상승 (70000 -> 72800)
-            reached, threshold_type = is_threshold_reached(alert, 72800)
+            reached, threshold_type, _ = is_threshold_reached(alert, 72800)
             assert reached is False
             assert threshold_type is None
 
@@ -67,7 +67,7 @@ class TestIsThresholdReached:
                 status="active",
             )
             # -3.0% 하락 (70000 -> 67900)
-            reached, threshold_type = is_threshold_reached(alert, 67900)
+            reached, threshold_type, _ = is_threshold_reached(alert, 67900)
             assert reached is True
             assert threshold_type == "lower"
 
@@ -84,7 +84,7 @@ class TestIsThresholdReached:
                 status="active",
             )
             # -2.0% 하락 (70000 -> 68600)
-            reached, threshold_type = is_threshold_reached(alert, 68600)
+            reached, threshold_type, _ = is_threshold_reached(alert, 68600)
             assert reached is False
             assert threshold_type is None
 
@@ -101,7 +101,7 @@ class TestIsThresholdReached:
                 status="active",
             )
             # 5.0% 상승 (70000 -> 73500)
-            reached, threshold_type = is_threshold_reached(alert, 73500)
+            reached, threshold_type, _ = is_threshold_reached(alert, 73500)
             assert reached is True
             assert threshold_type == "upper"
 
@@ -118,7 +118,7 @@ class TestIsThresholdReached:
                 status="active",
             )
             # -3.0% 하락 (70000 -> 67900)
-            reached, threshold_type = is_threshold_reached(alert, 67900)
+            reached, threshold_type, _ = is_threshold_reached(alert, 67900)
             assert reached is True
             assert threshold_type == "lower"
 
@@ -160,7 +160,12 @@ class TestSendAlertEmail:
                 )
 
                 assert result is True
-                mock_server.sendmail.assert_called_once()
+                mock_server.send_message.assert_called_once()
+                msg = mock_server.send_message.call_args.args[0]
+                assert not msg.is_multipart()
+                assert msg["To"] == "user@example.com"
+                assert "삼성전자" in msg["Subject"]
+                assert "73,500원" in msg.get_content()
 
     def test_send_alert_email_no_config(self, app):
         """Gmail 설정 없을 때 실패"""
@@ -209,6 +214,41 @@ class TestSendAlertEmail:
 
                 assert result is False
 
+    def test_send_alert_emails_batch_single_login(self, app):
+        """일괄 발송 시 로그인 1회, 실패 건은 나머지 발송에 영향 없음"""
+        with app.app_context():
+            app.config["GMAIL_ADDRESS"] = "test@gmail.com"
+            app.config["GMAIL_APP_PASSWORD"] = "test-password"
+
+            items = [
+                {
+                    "email": f"user{i}@example.com",
+                    "stock_name": "삼성전자",
+                    "stock_code": "005930",
+                    "base_price": 70000,
+                    "current_price": 73500,
+                    "change_rate": 5.0,
+                    "threshold_type": "upper",
+                    "threshold_value": 5.0,
+                    "market_summary": {},
+                    "llm_comment": "코멘트",
+                    "settings_url": "https://stockalarm.co.kr/settings/test-uuid",
+                }
+                for i in range(3)
+            ]
+
+            with patch("app.services.mail.smtplib.SMTP_SSL") as mock_smtp:
+                mock_server = MagicMock()
+                mock_server.send_message.side_effect = [None, Exception("거부"), None]
+                mock_smtp.return_value.__enter__.return_value = mock_server
+
+                result = send_alert_emails_batch(items)
+
+            assert result == [True, False, True]
+            mock_smtp.assert_called_once()
+            mock_server.login.assert_called_once()
+            assert mock_server.send_message.call_count == 3
+
 
 class TestProcessAlert:
     """단일 알림 처리 테스트"""
@@ -219,7 +259,7 @@ class TestProcessAlert:
         with app.app_context():
             user = User(email="test@example.com", uuid="test-uuid-123")
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
 
             alert = Alert(
                 user_id=user.id,
@@ -368,6 +408,7 @@ class TestProcessAlert:
             mock_get_fallback.assert_called_once()
 
 
+@pytest.mark.usefixtures("expire_on_commit")
 class TestCheckAlerts:
     """전체 알림 체크 테스트"""
 
@@ -383,14 +424,18 @@ class TestCheckAlerts:
             assert result["checked"] == 0
             assert result["triggered"] == 0
 
-    @patch("scripts.check_alert.process_alert")
-    def test_check_alerts_multiple_alerts(self, mock_process, app):
+    @patch("scripts.check_alert.send_alert_emails_batch", return_value=[True, False])
+    @patch("scripts.check_alert.get_stock_prices", return_value={})
+    @patch("scripts.check_alert.evaluate_alert")
+    def test_check_alerts_multiple_alerts(
+        self, mock_evaluate, mock_prices, mock_send_batch, app
+    ):
         """복수 알림 처리"""
         with app.app_context():
             # 테스트 데이터 생성
             user = User(email="test@example.com", uuid="test-uuid")
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
 
             for i in range(3):
                 alert = Alert(
@@ -404,11 +449,21 @@ class TestCheckAlerts:
                 db.session.add(alert)
             db.session.commit()
 
-        # process_alert 결과 모킹
-        mock_process.side_effect = [
-            {"status": "triggered", "email_sent": True, "error": None},
-            {"status": "not_triggered", "email_sent": None, "error": None},
-            {"status": "triggered", "email_sent": False, "error": None},
+        # evaluate_alert 결과 모킹
+        def triggered(email):
+            return {
+                "status": "triggered",
+                "error": None,
+                "current_price": 73500,
+                "change_rate": 5.0,
+                "threshold_type": "upper",
+                "email": {"email": email, "stock_name": "테스트종목"},
+            }
+
+        mock_evaluate.side_effect = [
+            triggered("a@example.com"),
+            {"status": "not_triggered", "error": None},
+            triggered("c@example.com"),
         ]
 
         with patch("scripts.check_alert.create_app") as mock_create_app:
@@ -423,13 +478,22 @@ class TestCheckAlerts:
         assert result["email_sent"] == 1
         assert result["email_failed"] == 1
 
-    @patch("scripts.check_alert.process_alert")
-    def test_check_alerts_with_errors(self, mock_process, app):
+        # 현재가는 종목별로 한 번에 조회해 각 알림 처리에 전달
+        mock_prices.assert_called_once_with(["005930", "005931", "005932"])
+        assert mock_evaluate.call_args.kwargs["prices"] == {}
+
+        # 기준 충족 알림 이메일은 한 번에 발송
+        sent_to = [item["email"] for item in mock_send_batch.call_args.args[0]]
+        assert sent_to == ["a@example.com", "c@example.com"]
+
+    @patch("scripts.check_alert.get_stock_prices", return_value={})
+    @patch("scripts.check_alert.evaluate_alert")
+    def test_check_alerts_with_errors(self, mock_evaluate, mock_prices, app):
         """오류 발생 시 에러 목록 기록"""
         with app.app_context():
             user = User(email="test@example.com", uuid="test-uuid")
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
 
             alert = Alert(
                 user_id=user.id,
@@ -442,9 +506,8 @@ class TestCheckAlerts:
             db.session.add(alert)
             db.session.commit()
 
-        mock_process.return_value = {
+        mock_evaluate.return_value = {
             "status": "skipped",
-            "email_sent": None,
             "error": "현재가 조회 실패",
         }
 
@@ -460,13 +523,14 @@ class TestCheckAlerts:
         assert result["errors"][0]["error"] == "현재가 조회 실패"
 
 
+@pytest.mark.usefixtures("expire_on_commit")
 class TestIntegration:
     """통합 테스트"""
 
-    @patch("scripts.check_alert.send_alert_email")
-    @patch("scripts.check_alert.generate_alert_comment")
+    @patch("scripts.check_alert.send_alert_emails_batch")
+    @patch("scripts.check_alert.generate_alert_comments_batch")
     @patch("scripts.check_alert.get_market_summary")
-    @patch("scripts.check_alert.get_stock_price")
+    @patch("scripts.check_alert.get_stock_prices")
     def test_full_flow_upper_threshold(
         self,
         mock_get_price,
@@ -476,7 +540,7 @@ class TestIntegration:
         app,
     ):
         """전체 흐름 통합 테스트 - 상승 기준"""
-        mock_get_price.return_value = 73500  # 5% 상승
+        mock_get_price.return_value = {"005930": 73500}  # 5% 상승
         mock_get_market.return_value = {
             "kospi": 2650.42,
             "kosdaq": 845.67,
@@ -485,14 +549,14 @@ class TestIntegration:
             "kospi_change_rate": 0.47,
             "kosdaq_change_rate": -0.38,
         }
-        mock_generate_comment.return_value = "삼성전자가 등록가 대비 5% 상승했습니다."
-        mock_send_email.return_value = True
+        mock_generate_comment.return_value = ["삼성전자가 등록가 대비 5% 상승했습니다."]
+        mock_send_email.return_value = [True]
 
         with app.app_context():
             # 테스트 데이터 생성
             user = User(email="test@example.com", uuid="test-uuid")
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
 
             alert = Alert(
                 user_id=user.id,
@@ -528,10 +592,17 @@ class TestIntegration:
             assert log.threshold_type == "upper"
             assert log.email_sent is True
 
-    @patch("scripts.check_alert.send_alert_email")
-    @patch("scripts.check_alert.generate_alert_comment")
+        # 코멘트는 일괄 생성 결과를 이메일에 사용
+        mock_generate_comment.assert_called_once()
+        assert (
+            mock_send_email.call_args.args[0][0]["llm_comment"]
+            == "삼성전자가 등록가 대비 5% 상승했습니다."
+        )
+
+    @patch("scripts.check_alert.send_alert_emails_batch")
+    @patch("scripts.check_alert.generate_alert_comments_batch")
     @patch("scripts.check_alert.get_market_summary")
-    @patch("scripts.check_alert.get_stock_price")
+    @patch("scripts.check_alert.get_stock_prices")
     def test_full_flow_lower_threshold(
         self,
         mock_get_price,
@@ -541,15 +612,15 @@ class TestIntegration:
         app,
     ):
         """전체 흐름 통합 테스트 - 하락 기준"""
-        mock_get_price.return_value = 67900  # 3% 하락
+        mock_get_price.return_value = {"005930": 67900}  # 3% 하락
         mock_get_market.return_value = {"kospi": 2500, "kosdaq": 800}
-        mock_generate_comment.return_value = "삼성전자가 등록가 대비 3% 하락했습니다."
-        mock_send_email.return_value = True
+        mock_generate_comment.return_value = ["삼성전자가 등록가 대비 3% 하락했습니다."]
+        mock_send_email.return_value = [True]
 
         with app.app_context():
             user = User(email="test@example.com", uuid="test-uuid")
             db.session.add(user)
-            db.session.commit()
+            db.session.flush()
 
             alert = Alert(
                 user_id=user.id,
@@ -49,3 +49,171 @@ class TestSettingsRoutes:
 
         response = client.get(f"/settings/{user_uuid}")
         assert b"test@example.com" in response.data
+
+    def test_user_lookup_cached(self, app):
+        """UUID → 사용자 조회 결과가 캐시되어 재조회 시 DB를 거치지 않음"""
+        from unittest.mock import patch
+
+        from app.routes.settings import _get_user
+
+        with app.app_context():
+            user_uuid = str(uuid.uuid4())
+            db.session.add(User(email="test@example.com", uuid=user_uuid))
+            db.session.commit()
+
+            first = _get_user(user_uuid)
+            with patch.object(db.session, "execute", side_effect=AssertionError):
+                second = _get_user(user_uuid)
+
+        assert first.email == "test@example.com"
+        assert second == first
+
+
+class TestHistoryRoutes:
+    """알림 히스토리 라우트 테스트"""
+
+    def test_history_page_shows_logs(self, app, client):
+        """발송 이력이 종목명과 함께 표시되는지 확인"""
+        from app.models import Alert, AlertLog
+
+        with app.app_context():
+            user_uuid = str(uuid.uuid4())
+            user = User(email="test@example.com", uuid=user_uuid)
+            db.session.add(user)
+            db.session.flush()
+            alert = Alert(
+                user_id=user.id,
+                stock_code="005930",
+                stock_name="삼성전자",
+                base_price=70000.0,
+            )
+            db.session.add(alert)
+            db.session.flush()
+            db.session.add(
+                AlertLog(
+                    alert_id=alert.id,
+                    user_id=user.id,
+                    stock_code="005930",
+                    base_price=70000.0,
+                    current_price=77000.0,
+                    change_rate=10.0,
+                    threshold_type="upper",
+                    email_sent=True,
+                )
+            )
+            db.session.commit()
+
+        response = client.get(f"/settings/{user_uuid}/history")
+        assert response.status_code == 200
+        assert "삼성전자".encode() in response.data
+
+    def test_history_page_with_invalid_uuid(self, client):
+        """잘못된 UUID로 히스토리 페이지 접근 시 404"""
+        response = client.get("/settings/invalid-uuid/history")
+        assert response.status_code == 404
+
+    def test_history_page_keyset_pagination(self, app, client):
+        """before 커서로 다음 페이지를 중복/누락 없이 조회"""
+        from datetime import datetime, timedelta
+        from unittest.mock import patch
+
+        from app.models import Alert, AlertLog
+        from app.routes import settings as settings_routes
+
+        with app.app_context():
+            user_uuid = str(uuid.uuid4())
+            user = User(email="test@example.com", uuid=user_uuid)
+            db.session.add(user)
+            db.session.flush()
+            alert = Alert(
+                user_id=user.id,
+                stock_code="005930",
+                stock_name="삼성전자",
+                base_price=70000.0,
+            )
+            db.session.add(alert)
+            db.session.flush()
+            # 같은 sent_at을 가진 로그 포함 (id로 순서 결정)
+            base = datetime(2026, 2, 10, 11, 30)
+            for i in range(25):
+                db.session.add(
+                    AlertLog(
+                        alert_id=alert.id,
+                        user_id=user.id,
+                        stock_code="005930",
+                        base_price=70000.0,
+                        current_price=77000.0,
+                        change_rate=10.0,
+                        threshold_type="upper",
+                        email_sent=True,
+                        sent_at=base + timedelta(minutes=i // 2),
+                    )
+                )
+            db.session.commit()
+
+        def fetch(query_string):
+            with app.test_request_context(query_string=query_string):
+                with patch.object(settings_routes, "render_template") as mock_render:
+                    mock_render.return_value = ""
+                    settings_routes.history_page(user_uuid)
+            kwargs = mock_render.call_args.kwargs
+            return [log.id for log in kwargs["logs"]], kwargs["next_cursor"]
+
+        first_ids, cursor = fetch({})
+        assert len(first_ids) == settings_routes.HISTORY_PER_PAGE
+        assert cursor == first_ids[-1]
+
+        second_ids, next_cursor = fetch({"before": cursor})
+        assert len(second_ids) == 5
+        assert next_cursor is None
+        assert sorted(first_ids + second_ids, reverse=True) == list(range(25, 0, -1))
+
+    def test_history_page_cursor_links_at_boundary(self, app, client):
+        """마지막 페이지 경계에서 '더 보기' 링크가 사라지고 '최신 알림'만 남음"""
+        from datetime import datetime, timedelta
+
+        from app.models import Alert, AlertLog
+        from app.routes.settings import HISTORY_PER_PAGE
+
+        with app.app_context():
+            user_uuid = str(uuid.uuid4())
+            user = User(email="test@example.com", uuid=user_uuid)
+            db.session.add(user)
+            db.session.flush()
+            alert = Alert(
+                user_id=user.id,
+                stock_code="005930",
+                stock_name="삼성전자",
+                base_price=70000.0,
+            )
+            db.session.add(alert)
+            db.session.flush()
+            # 정확히 한 페이지 + 1건 → 두 번째 페이지가 마지막 1건
+            base = datetime(2026, 2, 10, 11, 30)
+            for i in range(HISTORY_PER_PAGE + 1):
+                db.session.add(
+                    AlertLog(
+                        alert_id=alert.id,
+                        user_id=user.id,
+                        stock_code="005930",
+                        base_price=70000.0,
+                        current_price=77000.0,
+                        change_rate=10.0,
+                        threshold_type="upper",
+                        email_sent=True,
+                        sent_at=base + timedelta(minutes=i),
+                    )
+                )
+            db.session.commit()
+
+        first = client.get(f"/settings/{user_uuid}/history")
+        html = first.data.decode("utf-8")
+        # 첫 페이지 마지막 로그(id=2)가 다음 페이지 커서
+        assert f"/settings/{user_uuid}/history?before=2" in html
+        assert "최신 알림" not in html
+
+        second = client.get(f"/settings/{user_uuid}/history?before=2")
+        html = second.data.decode("utf-8")
+        # 마지막 페이지: 다음 커서 링크 없이 첫 페이지로 돌아가는 링크만 표시
+        assert "?before=" not in html
+        assert "최신 알림" in html
@@ -40,7 +40,7 @@ def _create_user_and_alert(app, **alert_kwargs):
 class TestStockDetailRoute:
     """종목 상세 페이지 라우트 테스트"""
 
-    @patch("app.routes.settings.get_stock_price", return_value=77000)
+    @patch("app.services.stock.get_stock_price", return_value=77000)
     def test_stock_detail_success(self, mock_price, app, client):
         """유효한 UUID/alert_id로 상세 페이지 접근"""
         user_uuid, _, alert_id = _create_user_and_alert(app)
@@ -53,14 +53,14 @@ class TestStockDetailRoute:
         response = client.get("/settings/invalid-uuid/stock/1")
         assert response.status_code == 404
 
-    @patch("app.routes.settings.get_stock_price", return_value=77000)
+    @patch("app.services.stock.get_stock_price", return_value=77000)
     def test_stock_detail_wrong_alert_id(self, mock_price, app, client):
         """다른 사용자의 alert_id → 404"""
         user_uuid, _, _ = _create_user_and_alert(app)
         response = client.get(f"/settings/{user_uuid}/stock/9999")
         assert response.status_code == 404
 
-    @patch("app.routes.settings.get_stock_price", return_value=77000)
+    @patch("app.services.stock.get_stock_price", return_value=77000)
     def test_stock_detail_change_rate(self, mock_price, app, client):
         """변동률 계산 확인 (base_price: 70000, current: 77000 → +10%)"""
         user_uuid, _, alert_id = _create_user_and_alert(app)
@@ -68,21 +68,21 @@ class TestStockDetailRoute:
         assert response.status_code == 200
         assert b"10.00" in response.data
 
-    @patch("app.routes.settings.get_stock_price", return_value=None)
+    @patch("app.services.stock.get_stock_price", return_value=None)
     def test_stock_detail_price_fallback(self, mock_price, app, client):
         """현재가 조회 실패 시 base_price로 폴백"""
         user_uuid, _, alert_id = _create_user_and_alert(app)
         response = client.get(f"/settings/{user_uuid}/stock/{alert_id}")
         assert response.status_code == 200
 
-    @patch("app.routes.settings.get_stock_price", side_effect=Exception("API 오류"))
+    @patch("app.services.stock.get_stock_price", side_effect=Exception("API 오류"))
     def test_stock_detail_price_exception(self, mock_price, app, client):
         """현재가 조회 예외 시 base_price로 폴백"""
         user_uuid, _, alert_id = _create_user_and_alert(app)
         response = client.get(f"/settings/{user_uuid}/stock/{alert_id}")
         assert response.status_code == 200
 
-    @patch("app.routes.settings.get_stock_price", return_value=77000)
+    @patch("app.services.stock.get_stock_price", return_value=77000)
     def test_stock_detail_with_alert_logs(self, mock_price, app, client):
         """알림 히스토리가 있는 경우 표시"""
         user_uuid, user_id, alert_id = _create_user_and_alert(app)
@@ -127,12 +127,12 @@ class TestChartDataAPI:
         },
     ]
 
-    @patch("app.routes.settings.get_stock_history", return_value=None)
+    @patch("app.services.stock.get_stock_history", return_value=None)
     def _setup(self, mock_history):
         """get_stock_history가 사용되는 패턴 확인용"""
         pass
 
-    @patch("app.routes.settings.get_stock_history")
+    @patch("app.services.stock.get_stock_history")
     def test_chart_data_success(self, mock_history, app, client):
         """정상 응답: JSON 구조 확인"""
         mock_history.return_value = self.MOCK_PRICES
@@ -154,7 +154,7 @@ class TestChartDataAPI:
         assert data["threshold_upper"] == 10.0
         assert data["threshold_lower"] == -10.0
 
-    @patch("app.routes.settings.get_stock_history")
+    @patch("app.services.stock.get_stock_history")
     def test_chart_data_price_structure(self, mock_history, app, client):
         """가격 데이터 필드 구조 확인"""
         mock_history.return_value = self.MOCK_PRICES
@@ -178,7 +178,7 @@ class TestChartDataAPI:
         response = client.get("/settings/invalid-uuid/stock/1/chart-data")
         assert response.status_code == 404
 
-    @patch("app.routes.settings.get_stock_history")
+    @patch("app.services.stock.get_stock_history")
     def test_chart_data_wrong_alert_id(self, mock_history, app, client):
         """다른 사용자의 alert_id → 404"""
         user_uuid, _, _ = _create_user_and_alert(app)
@@ -187,7 +187,7 @@ class TestChartDataAPI:
         )
         assert response.status_code == 404
 
-    @patch("app.routes.settings.get_stock_history", return_value=None)
+    @patch("app.services.stock.get_stock_history", return_value=None)
     def test_chart_data_history_failure(self, mock_history, app, client):
         """가격 데이터 조회 실패 → 500"""
         user_uuid, _, alert_id = _create_user_and_alert(app)
@@ -199,7 +199,7 @@ class TestChartDataAPI:
         data = json.loads(response.data)
         assert "error" in data
 
-    @patch("app.routes.settings.get_stock_history")
+    @patch("app.services.stock.get_stock_history")
     def test_chart_data_with_alert_logs(self, mock_history, app, client):
         """알림 이력이 alerts 필드에 포함되는지 확인"""
         mock_history.return_value = self.MOCK_PRICES
@@ -230,7 +230,7 @@ class TestChartDataAPI:
         assert data["alerts"][0]["price"] == 77000
         assert data["alerts"][0]["type"] == "upper"
 
-    @patch("app.routes.settings.get_stock_history")
+    @patch("app.services.stock.get_stock_history")
     def test_chart_data_empty_alert_logs(self, mock_history, app, client):
         """알림 이력이 없으면 빈 배열"""
         mock_history.return_value = self.MOCK_PRICES